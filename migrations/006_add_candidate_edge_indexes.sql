@@ -0,0 +1,18 @@
+-- Migration 006: Indexes for candidate edge generation
+--
+-- graph_builder.get_candidate_edges() chains confirmed occurrences per concept
+-- in curriculum order, then probes edges for each (from, to) pair to flag
+-- pairs that are already confirmed. build_graph() reads the same confirmed
+-- subset.
+--
+-- The partial index holds only confirmed occurrences, keyed by concept and
+-- curriculum position, so the window query reads a compact index instead of
+-- filtering the whole table. The composite edges index turns each
+-- already-confirmed probe into a single index lookup.
+
+CREATE INDEX IF NOT EXISTS idx_occurrences_confirmed_concept
+    ON occurrences (concept_id, year, term, slide_number, occurrence_id)
+    WHERE validation_status = 'confirmed';
+
+CREATE INDEX IF NOT EXISTS idx_edges_pair
+    ON edges (from_occurrence, to_occurrence);
@@ -0,0 +1,15 @@
+-- Migration 007: Index for the audit review queue
+--
+-- uplink.get_audit_queue(), get_adjacent_occurrence_ids() and get_audit_stats()
+-- all read the review queue: occurrences with needs_review = 1 or a
+-- potential_noise / high_priority_review validation status. The queue is a
+-- small slice of the table.
+--
+-- The partial index holds only queue rows, keyed by the queue's sort order
+-- (subject, year, term, unit), so queue reads and keyset page seeks scan the
+-- queue instead of the whole table.
+
+CREATE INDEX IF NOT EXISTS idx_occurrences_review_queue
+    ON occurrences (subject, year, term, unit, concept_id, occurrence_id)
+    WHERE needs_review = 1
+       OR validation_status IN ('potential_noise', 'high_priority_review');
@@ -0,0 +1,26 @@
+-- Migration 008: Materialised per-concept occurrence stats
+--
+-- uplink.get_load_bearing_concepts() aggregates confirmed occurrences per
+-- concept (count, subjects, first/last year) on every dashboard load. The
+-- inputs only change when migrate_to_postgres.py reloads the data or
+-- uplink.apply_pending_decisions() confirms/deletes occurrences; both refresh
+-- this view, so the dashboard reads precomputed rows instead.
+--
+-- The unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY if a refresh
+-- ever needs to run alongside readers.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS concept_stats AS
+    SELECT o.concept_id,
+           COUNT(*)                            AS occ_count,
+           STRING_AGG(DISTINCT o.subject, ',') AS subjects,
+           MIN(o.year)                         AS first_year,
+           MAX(o.year)                         AS last_year
+    FROM occurrences o
+    WHERE o.validation_status = 'confirmed'
+    GROUP BY o.concept_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_concept_stats_concept_id
+    ON concept_stats (concept_id);
+
+CREATE INDEX IF NOT EXISTS idx_concept_stats_occ_count
+    ON concept_stats (occ_count);
@@ -0,0 +1,17 @@
+-- Migration 009: Make the review-queue index covering
+--
+-- uplink.get_audit_stats() counts review-queue rows by needs_review,
+-- validation_status and audit_decision. Carrying those columns in the
+-- partial index from migration 007 lets PostgreSQL answer the stats and the
+-- queue filter with an index-only scan, without visiting the table.
+--
+-- The occurrences side of the queue's concepts join is already served by
+-- idx_occurrences_concept_id.
+
+DROP INDEX IF EXISTS idx_occurrences_review_queue;
+
+CREATE INDEX idx_occurrences_review_queue
+    ON occurrences (subject, year, term, unit, concept_id, occurrence_id)
+    INCLUDE (needs_review, validation_status, audit_decision)
+    WHERE needs_review = 1
+       OR validation_status IN ('potential_noise', 'high_priority_review');
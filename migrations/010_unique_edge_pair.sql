@@ -0,0 +1,34 @@
+-- Migration 010: One edge per occurrence pair
+--
+-- uplink.confirm_edge() already treats the (from_occurrence, to_occurrence)
+-- pair as the edge's identity, updating the existing row on re-confirmation.
+-- Enforcing it with a unique index lets confirm_edge do that in a single
+-- INSERT ... ON CONFLICT upsert. The unique index also serves every lookup
+-- the non-unique idx_edges_pair (migration 006) did, so that index is dropped.
+--
+-- The migration stops before changing anything if duplicate pairs exist.
+-- List them with:
+--   SELECT from_occurrence, to_occurrence, array_agg(edge_id)
+--   FROM edges GROUP BY 1, 2 HAVING COUNT(*) > 1;
+-- and delete all but one edge per pair, then re-run.
+
+DO $$
+DECLARE
+    duplicate_pairs INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO duplicate_pairs FROM (
+        SELECT 1 FROM edges
+        WHERE from_occurrence IS NOT NULL AND to_occurrence IS NOT NULL
+        GROUP BY from_occurrence, to_occurrence
+        HAVING COUNT(*) > 1
+    ) d;
+    IF duplicate_pairs > 0 THEN
+        RAISE EXCEPTION 'Migration 010: % duplicate (from_occurrence, to_occurrence) pairs in edges; de-duplicate before re-running', duplicate_pairs;
+    END IF;
+END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_edges_pair_unique
+    ON edges (from_occurrence, to_occurrence);
+
+DROP INDEX IF EXISTS idx_edges_pair;
@@ -0,0 +1,21 @@
+-- Migration 011: Curriculum position of the term as a stored column
+--
+-- uplink.get_concept_detail() and get_corpus() order occurrences by year and
+-- then by term in curriculum order (Autumn1 … Summer2, anything else last).
+-- Evaluating that as a CASE in ORDER BY forces a sort on every call. A
+-- generated column keeps the ordinal on the row (maintained by PostgreSQL on
+-- insert/update, no application changes), and the index lets a concept's
+-- occurrences be read already in curriculum order.
+
+ALTER TABLE occurrences
+    ADD COLUMN IF NOT EXISTS term_ordinal smallint GENERATED ALWAYS AS (
+        CASE term
+            WHEN 'Autumn1' THEN 1 WHEN 'Autumn2' THEN 2
+            WHEN 'Spring1' THEN 3 WHEN 'Spring2' THEN 4
+            WHEN 'Summer1' THEN 5 WHEN 'Summer2' THEN 6
+            ELSE 7
+        END
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_occurrences_curriculum
+    ON occurrences (concept_id, year, term_ordinal, slide_number);
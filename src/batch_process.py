@@ -10,11 +10,12 @@ Created: 2026-02-23
 
 import argparse
 import sqlite3
+import sys
 from pathlib import Path
-from typing import List, Set, Dict
+from typing import List, FrozenSet, Dict
 
 # Import Stage 2 processing functions
-from extract_stage2 import process_file
+from extract_stage2 import process_corpus
 
 
 # =============================================================================
@@ -70,35 +71,33 @@ def discover_booklet_files(root_dir: Path, subject_filter: str = None,
     return filtered_files
 
 
-def get_processed_file_paths(db_path: Path) -> Set[str]:
+def get_processed_file_paths(db_path: Path) -> FrozenSet[str]:
     """
     Query database for already-processed files (resume capability).
 
     2026-02-23: Created for batch processing
+    2026-10-16: De-duplication stays in SQL, backed by idx_occurrences_source_path
+    (init_db.py; older databases: migrate_add_occurrence_indexes.py)
 
     Args:
         db_path: Path to SQLite database
 
     Returns:
-        Set of absolute file paths already in database
+        Frozen set of absolute file paths already in database
     """
-    processed_paths = set()
-
     try:
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
 
         # Get distinct source paths from occurrences table
         cursor.execute("SELECT DISTINCT source_path FROM occurrences")
-        rows = cursor.fetchall()
-
-        for row in rows:
-            processed_paths.add(row[0])
+        processed_paths = frozenset(row[0] for row in cursor.fetchall())
 
         conn.close()
 
     except Exception as e:
         print(f"Warning: Could not query database for processed files: {e}")
+        processed_paths = frozenset()
 
     return processed_paths
 
@@ -109,11 +108,16 @@ def get_processed_file_paths(db_path: Path) -> Set[str]:
 
 def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
                  subject_filter: str = None, year_filter: int = None,
-                 resume: bool = False, dry_run: bool = False) -> Dict:
+                 resume: bool = False, dry_run: bool = False,
+                 quiet: bool = False, workers: int = None) -> Dict:
     """
     Main batch processing orchestration.
 
     2026-02-23: Created for batch processing
+    2026-10-16: Added quiet mode — a single in-place progress line replaces
+                the per-file separator/header/result prints
+    2026-10-16: Files are extracted in parallel worker processes via
+                process_corpus; database writes stay in this process
 
     Args:
         root_dir: Root directory to search
@@ -123,6 +127,8 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
         year_filter: Optional year filter
         resume: Skip files already in database
         dry_run: Discover files without processing
+        quiet: Show one progress line instead of per-file output
+        workers: Extraction worker processes (default: os.cpu_count())
 
     Returns:
         Dict with batch statistics
@@ -160,24 +166,42 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
         return batch_stats
 
     # Get already-processed files for resume mode
-    processed_paths = set()
+    # 2026-10-16: Both sides of the resume check are resolved once up front, so
+    #             stored paths written via absolute() still match resolved ones
+    processed_paths = frozenset()
     if resume:
         print("Resume mode: checking database for processed files...")
-        processed_paths = get_processed_file_paths(db_path)
+        # source_path is nullable; rows without one name no file
+        processed_paths = frozenset(
+            str(Path(p).resolve()) for p in get_processed_file_paths(db_path) if p
+        )
         print(f"Found {len(processed_paths)} already-processed files\n")
+    files_abs = [str(p.resolve()) for p in files]
 
     # Create output directory
     csv_output_dir.mkdir(parents=True, exist_ok=True)
 
+    # In quiet mode per-file output is suppressed and progress is redrawn in place
+    log = (lambda *args, **kwargs: None) if quiet else print
+
+    # Results arrive in file order; files skipped on resume are never submitted
+    pending = [str(file_path) for file_path, abs_path in zip(files, files_abs)
+               if not (resume and abs_path in processed_paths)]
+    corpus = process_corpus(pending, str(db_path), str(csv_output_dir),
+                            workers=workers, verbose=not quiet)
+
     # Process each file
-    for i, file_path in enumerate(files, 1):
-        print("=" * 60)
-        print(f"[{i}/{len(files)}] Processing: {file_path.name}")
-        print("=" * 60)
+    for i, (file_path, abs_path) in enumerate(zip(files, files_abs), 1):
+        if quiet:
+            sys.stdout.write(f"\r[{i}/{len(files)}] {file_path.name[:60]:<60}")
+            sys.stdout.flush()
+        log("=" * 60)
+        log(f"[{i}/{len(files)}] Processing: {file_path.name}")
+        log("=" * 60)
 
         # Check if already processed (resume mode)
-        if resume and str(file_path.absolute()) in processed_paths:
-            print("SKIPPING (already processed)")
+        if resume and abs_path in processed_paths:
+            log("SKIPPING (already processed)")
             batch_stats['files_skipped'] += 1
             batch_stats['file_results'].append({
                 'file': file_path.name,
@@ -189,11 +213,7 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
 
         # Process file
         try:
-            results = process_file(
-                str(file_path),
-                str(db_path),
-                str(csv_output_dir)
-            )
+            results = next(corpus)
 
             # Update statistics
             if results['success']:
@@ -212,7 +232,7 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
                     'skipped': False
                 })
 
-                print(f"Success: {term_count} terms extracted")
+                log(f"Success: {term_count} terms extracted")
 
             else:
                 batch_stats['files_failed'] += 1
@@ -226,7 +246,7 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
                     'terms': 0,
                     'skipped': False
                 })
-                print(f"Failed: {results['errors']}")
+                log(f"Failed: {results['errors']}")
 
         except Exception as e:
             batch_stats['files_failed'] += 1
@@ -241,9 +261,15 @@ def batch_process(root_dir: Path, db_path: Path, csv_output_dir: Path,
                 'terms': 0,
                 'skipped': False
             })
-            print(f"Failed: {error_msg}")
+            log(f"Failed: {error_msg}")
 
-        print()
+        log()
+
+    # Shuts down the worker pool
+    corpus.close()
+
+    if quiet:
+        sys.stdout.write("\n\n")
 
     return batch_stats
 
@@ -257,61 +283,68 @@ def print_batch_report(stats: Dict):
     Print comprehensive batch processing report.
 
     2026-02-23: Created for batch processing
+    2026-10-16: Report lines are accumulated and written in a single call
 
     Args:
         stats: Batch statistics dict from batch_process()
     """
-    print("=" * 60)
-    print("=== BATCH PROCESSING REPORT ===")
-    print("=" * 60)
-    print()
+    lines = []
+    out = lines.append
+
+    out("=" * 60)
+    out("=== BATCH PROCESSING REPORT ===")
+    out("=" * 60)
+    out("")
 
     # Summary statistics
-    print(f"Files discovered: {stats['files_discovered']}")
-    print(f"Files processed: {stats['files_processed']}")
-    print(f"Files skipped: {stats['files_skipped']}")
-    print(f"Files failed: {stats['files_failed']}")
-    print()
+    out(f"Files discovered: {stats['files_discovered']}")
+    out(f"Files processed: {stats['files_processed']}")
+    out(f"Files skipped: {stats['files_skipped']}")
+    out(f"Files failed: {stats['files_failed']}")
+    out("")
 
-    print(f"Total concepts created: {stats['total_concepts']}")
-    print(f"Total occurrences created: {stats['total_occurrences']}")
-    print()
+    out(f"Total concepts created: {stats['total_concepts']}")
+    out(f"Total occurrences created: {stats['total_occurrences']}")
+    out("")
 
     # Success rate
     total_attempted = stats['files_processed'] + stats['files_failed']
     if total_attempted > 0:
         success_rate = (stats['files_processed'] / total_attempted) * 100
-        print(f"Success rate: {success_rate:.1f}%")
-    print()
+        out(f"Success rate: {success_rate:.1f}%")
+    out("")
 
     # Per-file results
-    print("=" * 60)
-    print("=== PER-FILE RESULTS ===")
-    print("=" * 60)
+    out("=" * 60)
+    out("=== PER-FILE RESULTS ===")
+    out("=" * 60)
 
     for result in stats['file_results']:
         if result['skipped']:
-            print(f"⊘ {result['file']}: skipped (already processed)")
+            out(f"⊘ {result['file']}: skipped (already processed)")
         elif result['success']:
-            print(f"✓ {result['file']}: {result['terms']} terms")
+            out(f"✓ {result['file']}: {result['terms']} terms")
         else:
-            print(f"✗ {result['file']}: 0 terms")
+            out(f"✗ {result['file']}: 0 terms")
 
-    print()
+    out("")
 
     # Errors
     if stats['errors']:
-        print("=" * 60)
-        print("=== ERRORS ===")
-        print("=" * 60)
+        out("=" * 60)
+        out("=== ERRORS ===")
+        out("=" * 60)
 
         for error_entry in stats['errors']:
-            print(f"File: {error_entry['file']}")
+            out(f"File: {error_entry['file']}")
             for error in error_entry['errors']:
-                print(f"  - {error}")
-            print()
+                out(f"  - {error}")
+            out("")
+
+    out("=" * 60)
 
-    print("=" * 60)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
 # =============================================================================
@@ -340,6 +373,9 @@ Examples:
 
   # Process entire History corpus
   python batch_process.py "$DROPBOX_ROOT/HEP History"
+
+  # Single progress line instead of per-file output
+  python batch_process.py "$DROPBOX_ROOT/HEP History" --quiet
         """
     )
 
@@ -373,6 +409,14 @@ Examples:
                        action='store_true',
                        help='Skip files already in database')
 
+    parser.add_argument('--quiet',
+                       action='store_true',
+                       help='Show a single progress line instead of per-file output')
+
+    parser.add_argument('--workers',
+                       type=int,
+                       help='Extraction worker processes (default: CPU count; 1 = serial)')
+
     args = parser.parse_args()
 
     # Resolve paths
@@ -412,7 +456,9 @@ Examples:
         subject_filter=args.subject,
         year_filter=args.year,
         resume=args.resume,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        quiet=args.quiet,
+        workers=args.workers
     )
 
     # Print report (unless dry run already printed)
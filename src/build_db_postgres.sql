@@ -23,7 +23,16 @@ CREATE TABLE occurrences (
     vocab_match_type    TEXT,
     vocab_source        TEXT,
     audit_decision      TEXT,
-    audit_notes         TEXT
+    audit_notes         TEXT,
+    -- Curriculum position of term (see migrations/011_add_term_ordinal.sql)
+    term_ordinal        SMALLINT GENERATED ALWAYS AS (
+        CASE term
+            WHEN 'Autumn1' THEN 1 WHEN 'Autumn2' THEN 2
+            WHEN 'Spring1' THEN 3 WHEN 'Spring2' THEN 4
+            WHEN 'Summer1' THEN 5 WHEN 'Summer2' THEN 6
+            ELSE 7
+        END
+    ) STORED
 );
 
 CREATE TABLE edges (
@@ -39,4 +48,28 @@ CREATE TABLE edges (
 CREATE INDEX idx_occurrences_concept_id ON occurrences(concept_id);
 CREATE INDEX idx_occurrences_is_introduction ON occurrences(is_introduction);
 CREATE INDEX idx_edges_from_occurrence ON edges(from_occurrence);
-CREATE INDEX idx_edges_to_occurrence ON edges(to_occurrence);
\ No newline at end of file
+CREATE INDEX idx_edges_to_occurrence ON edges(to_occurrence);
+
+-- Candidate edge generation (see migrations/006_add_candidate_edge_indexes.sql)
+CREATE INDEX idx_occurrences_confirmed_concept ON occurrences(concept_id, year, term, slide_number, occurrence_id) WHERE validation_status = 'confirmed';
+-- One edge per occurrence pair (see migrations/010_unique_edge_pair.sql)
+CREATE UNIQUE INDEX idx_edges_pair_unique ON edges(from_occurrence, to_occurrence);
+
+-- Audit review queue (see migrations/007_add_review_queue_index.sql, 009_cover_review_queue_index.sql)
+CREATE INDEX idx_occurrences_review_queue ON occurrences(subject, year, term, unit, concept_id, occurrence_id) INCLUDE (needs_review, validation_status, audit_decision) WHERE needs_review = 1 OR validation_status IN ('potential_noise', 'high_priority_review');
+
+-- Per-concept stats for the dashboard (see migrations/008_create_concept_stats.sql)
+CREATE MATERIALIZED VIEW concept_stats AS
+    SELECT o.concept_id,
+           COUNT(*)                            AS occ_count,
+           STRING_AGG(DISTINCT o.subject, ',') AS subjects,
+           MIN(o.year)                         AS first_year,
+           MAX(o.year)                         AS last_year
+    FROM occurrences o
+    WHERE o.validation_status = 'confirmed'
+    GROUP BY o.concept_id;
+CREATE UNIQUE INDEX idx_concept_stats_concept_id ON concept_stats(concept_id);
+CREATE INDEX idx_concept_stats_occ_count ON concept_stats(occ_count);
+
+-- Occurrences of a concept in curriculum order (see migrations/011_add_term_ordinal.sql)
+CREATE INDEX idx_occurrences_curriculum ON occurrences(concept_id, year, term_ordinal, slide_number);
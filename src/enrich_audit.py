@@ -20,6 +20,7 @@ Created: 2026-02-24
 """
 
 import csv
+import os
 import re
 import sqlite3
 from pathlib import Path
@@ -174,6 +175,10 @@ def enrich_audit(input_path: Path, output_path: Path, db_path: Path) -> None:
         decision         — blank; reviewer fills in
 
     Created: 2026-02-24
+    2026-10-16: Rows are written as they are enriched and a .progress sidecar
+    records how many are on disk. If a run dies part-way, the next run
+    appends from that point instead of starting over. Summary counts cover
+    the current run only.
     """
     with open(input_path, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
@@ -192,10 +197,50 @@ def enrich_audit(input_path: Path, output_path: Path, db_path: Path) -> None:
         'noise_id_missing': 0,
     }
 
-    enriched_rows = []
     total = len(rows)
 
+    fieldnames = [
+        'issue_type', 'subject', 'year', 'term_period', 'unit',
+        'chapter', 'term', 'slide', 'context', 'review_reason',
+        'vocab_source', 'notes',
+        'occurrence_id', 'appears_unbolded', 'unbolded_slides', 'unbolded_context',
+        'decision'
+    ]
+
+    # Resume from an interrupted run if its checkpoint is still present
+    # Sidecar holds "<rows written> <byte offset>"; anything past the offset
+    # was written after the last checkpoint and is truncated before resuming
+    progress_path = output_path.with_suffix('.progress')
+    resume_from = 0
+    resume_offset = 0
+    if output_path.exists() and progress_path.exists():
+        try:
+            resume_from, resume_offset = map(int, progress_path.read_text().split())
+        except ValueError:
+            resume_from, resume_offset = 0, 0
+        if resume_from:
+            print(f"Resuming after {resume_from} rows already written to {output_path.name}")
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if resume_from:
+        out = open(output_path, 'r+', newline='', encoding='utf-8')
+        out.seek(resume_offset)
+        out.truncate()
+    else:
+        out = open(output_path, 'w', newline='', encoding='utf-8')
+    writer = csv.DictWriter(out, fieldnames=fieldnames)
+    if not resume_from:
+        writer.writeheader()
+
+    def checkpoint(written: int) -> None:
+        out.flush()
+        os.fsync(out.fileno())
+        progress_path.write_text(f"{written} {out.tell()}")
+
     for i, row in enumerate(rows):
+        if i < resume_from:
+            continue
+
         issue_type = row['issue_type']
         subject = row['subject']
         year = row['year']
@@ -260,22 +305,13 @@ def enrich_audit(input_path: Path, output_path: Path, db_path: Path) -> None:
                     f"{subject} Y{year} {term} | {unit} | slide={slide}"
                 )
 
-        enriched_rows.append(row)
-
-    # Write enriched CSV
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        'issue_type', 'subject', 'year', 'term_period', 'unit',
-        'chapter', 'term', 'slide', 'context', 'review_reason',
-        'vocab_source', 'notes',
-        'occurrence_id', 'appears_unbolded', 'unbolded_slides', 'unbolded_context',
-        'decision'
-    ]
+        writer.writerow(row)
+        if (i + 1) % 100 == 0:
+            checkpoint(i + 1)
 
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(enriched_rows)
+    # Complete — the checkpoint is no longer needed
+    out.close()
+    progress_path.unlink(missing_ok=True)
 
     print()
     print("=" * 60)
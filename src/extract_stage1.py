@@ -11,9 +11,15 @@ No database writes in Stage 1—focuses on validating extraction logic.
 Created: 2026-02-22
 """
 
+import posixpath
 import re
+import sys
+import zipfile
+from functools import lru_cache
 from pathlib import Path
-from pptx import Presentation
+from typing import Iterator
+
+from lxml import etree
 
 
 # =============================================================================
@@ -34,6 +40,24 @@ NOISE_TERMS = {
     # Add more patterns as discovered during corpus processing
 }
 
+# 2026-10-16: Longest noise term — longer cleaned runs skip the lower() + set
+#             lookup entirely. Derived from NOISE_TERMS at import time.
+_NOISE_TERM_MAX_LEN = max(len(t) for t in NOISE_TERMS)
+
+# Stripped from the end of terms before storage and noise-term lookup
+TRAILING_PUNCTUATION = '.,;:!?'
+
+
+# 2026-10-16: Citation suffixes are the only noise check that needs a regex;
+#             Page N, numeric and URL checks use string methods in is_noise
+_RE_CITATION = re.compile(r'.+(?:Group|Inc|Ltd|LLC|Corp|Organization|Foundation)\.?$')
+# Last character of every citation suffix match (Group/Corp, Inc, Ltd, LLC,
+# Organization/Foundation, or a trailing period)
+_CITATION_LAST_CHARS = ('p', 'c', 'd', 'C', 'n', '.')
+_URL_PREFIXES = ('http://', 'https://', 'www.')
+_RE_CHAPTER = re.compile(r'^(\d+\.\s+.+)$')
+_RE_PICTURE_CREDIT = re.compile(r'picture credit', re.IGNORECASE)
+
 
 # =============================================================================
 # LAYER 1: FILTERING & CLEANING
@@ -56,29 +80,37 @@ def is_noise(text: str) -> bool:
     Returns:
         True if text should be filtered out, False if it's a valid term
     """
-    text = text.strip()
+    return _is_noise_stripped(text.strip())
 
-    # Filter "Page N" patterns
-    if re.match(r'^Page\s+\d+$', text, re.IGNORECASE):
-        return True
 
+def _is_noise_stripped(text: str) -> bool:
+    """
+    is_noise for text the caller has already stripped (extraction hot loop).
+
+    2026-10-16: Checks ordered by how often they hit in booklets (line
+    numbers and dictionary labels first, URLs last); the citation regex
+    only runs when the last character can end a citation suffix.
+    """
     # Filter pure numeric runs (with optional trailing period)
-    if re.match(r'^\d+\.?$', text):
+    digits = text[:-1] if text.endswith('.') else text
+    if digits.isdecimal():
         return True
 
-    # 2026-02-22: Filter URLs
-    if re.match(r'https?://', text, re.IGNORECASE):
+    # 2026-02-22: Filter noise terms from dictionary (clean first to handle trailing punctuation)
+    cleaned = text.rstrip(TRAILING_PUNCTUATION)
+    if len(cleaned) <= _NOISE_TERM_MAX_LEN and cleaned.lower() in NOISE_TERMS:
         return True
-    if re.match(r'www\.', text, re.IGNORECASE):
+
+    # Filter "Page N" patterns
+    if text[:4].lower() == 'page' and text[4:5].isspace() and text[4:].lstrip().isdecimal():
         return True
 
     # 2026-02-22: Filter common citation patterns
-    if re.match(r'.+(Group|Inc|Ltd|LLC|Corp|Organization|Foundation)\.?$', text):
+    if text.endswith(_CITATION_LAST_CHARS) and _RE_CITATION.match(text):
         return True
 
-    # 2026-02-22: Filter noise terms from dictionary (clean first to handle trailing punctuation)
-    cleaned = text.rstrip('.,;:!?')
-    if cleaned.lower() in NOISE_TERMS:
+    # 2026-02-22: Filter URLs
+    if text[:8].lower().startswith(_URL_PREFIXES):
         return True
 
     return False
@@ -97,7 +129,7 @@ def clean_term(text: str) -> str:
     Returns:
         Cleaned term
     """
-    return text.strip().rstrip('.,;:!?')
+    return text.strip().rstrip(TRAILING_PUNCTUATION)
 
 
 def flag_for_review(text: str, context: str) -> tuple[bool, str]:
@@ -105,6 +137,8 @@ def flag_for_review(text: str, context: str) -> tuple[bool, str]:
     Determine if term needs human review and why.
 
     2026-02-22: Enhanced flagging with specific reasons
+    2026-10-16: Term-only checks are memoised in _term_review_reasons;
+    only the context-length check runs per call
 
     Args:
         text: Cleaned term text
@@ -113,27 +147,43 @@ def flag_for_review(text: str, context: str) -> tuple[bool, str]:
     Returns:
         (needs_review: bool, reason: str)
     """
-    reasons = []
-
-    # Short terms
-    if len(text) < 5:
-        reasons.append('short_term')
+    reason, reason_with_heading = _term_review_reasons(text)
 
     # Very short context suggests heading-only
     if len(context) < 20:
-        reasons.append('potential_heading')
+        return True, reason_with_heading
+
+    if reason:
+        return True, reason
+    return False, None
+
+
+@lru_cache(maxsize=4096)
+def _term_review_reasons(text: str) -> tuple[str | None, str]:
+    """
+    Review reasons that depend only on the term, cached per distinct term.
+
+    Returns the joined reason string without and with 'potential_heading',
+    which sits between the short_term check and the remaining checks.
+    """
+    leading = []
+    trailing = []
+
+    # Short terms
+    if len(text) < 5:
+        leading.append('short_term')
 
     # Single word in all caps (except valid proper nouns)
     if text.isupper() and ' ' not in text and len(text) > 1:
-        reasons.append('all_caps')
+        trailing.append('all_caps')
 
     # Ends with colon (likely a heading)
     if text.endswith(':'):
-        reasons.append('heading_marker')
+        trailing.append('heading_marker')
 
-    if reasons:
-        return True, ', '.join(reasons)
-    return False, None
+    reason = ', '.join(leading + trailing) or None
+    reason_with_heading = ', '.join(leading + ['potential_heading'] + trailing)
+    return reason, reason_with_heading
 
 
 def detect_chapter(text: str) -> str:
@@ -149,27 +199,243 @@ def detect_chapter(text: str) -> str:
         Chapter heading if detected, None otherwise
     """
     text = text.strip()
-    match = re.match(r'^(\d+\.\s+.+)$', text)
+    match = _RE_CHAPTER.match(text)
     if match:
         return match.group(1)
     return None
 
 
+# =============================================================================
+# PPTX XML ACCESS
+# =============================================================================
+
+# 2026-10-16: Slide XML is read straight from the .pptx zip with lxml rather
+#             than through python-pptx's object model. The helpers below mirror
+#             python-pptx semantics: slides in sldIdLst order, text frames on
+#             p:sp shapes, a:br read as "\v", b="1"/"true" as bold.
+_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_P_SP = f"{{{_NS['p']}}}sp"
+_P_GRPSP = f"{{{_NS['p']}}}grpSp"
+_P_TXBODY = f"{{{_NS['p']}}}txBody"
+_A_R = f"{{{_NS['a']}}}r"
+_A_FLD = f"{{{_NS['a']}}}fld"
+_A_BR = f"{{{_NS['a']}}}br"
+_A_T = f"{{{_NS['a']}}}t"
+_A_RPR = f"{{{_NS['a']}}}rPr"
+_R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_XSD_TRUE = ('1', 'true')
+
+_XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+# Compiled once; answers "does this a:p contain any explicitly bold run?" in C
+_HAS_BOLD_RUN = etree.XPath("boolean(a:r/a:rPr[@b='1' or @b='true'])", namespaces=_NS)
+
+
+def _resolve_part_name(base_dir: str, target: str) -> str:
+    """Resolve a relationship target to a zip member name."""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(base_dir, target))
+
+
+def _read_rels(zf: zipfile.ZipFile, part_name: str) -> dict:
+    """Return {rId: (type, target)} from a part's .rels file."""
+    folder, filename = posixpath.split(part_name)
+    rels = etree.fromstring(zf.read(posixpath.join(folder, '_rels', f'{filename}.rels')), _XML_PARSER)
+    return {rel.get('Id'): (rel.get('Type'), rel.get('Target')) for rel in rels}
+
+
+def _slide_part_names(zf: zipfile.ZipFile) -> list[str]:
+    """
+    Return slide XML part names in presentation order.
+
+    Order comes from p:sldIdLst in presentation.xml (not file names, which
+    stop matching slide order once slides are moved in PowerPoint).
+    """
+    pres_target = next(
+        target for rel_type, target in _read_rels(zf, '').values()
+        if rel_type.endswith('/officeDocument')
+    )
+    pres_part = _resolve_part_name('', pres_target)
+    pres_rels = _read_rels(zf, pres_part)
+    pres = etree.fromstring(zf.read(pres_part), _XML_PARSER)
+
+    base_dir = posixpath.dirname(pres_part)
+    return [
+        _resolve_part_name(base_dir, pres_rels[sld_id.get(_R_ID)][1])
+        for sld_id in pres.iterfind('p:sldIdLst/p:sldId', _NS)
+    ]
+
+
+def _iter_text_paragraphs(slide_root):
+    """Yield a:p elements from each text-bearing shape on a slide, in shape order."""
+    sp_tree = slide_root.find('p:cSld/p:spTree', _NS)
+    if sp_tree is not None:
+        yield from _iter_shape_tree_paragraphs(sp_tree)
+
+
+def _iter_shape_tree_paragraphs(tree):
+    """
+    Yield a:p elements from p:sp shapes in a shape tree, recursing into groups.
+
+    2026-10-16: Group shapes (p:grpSp) are now descended into; bold terms in
+    grouped text boxes were previously never seen.
+    """
+    for shape in tree:
+        if shape.tag == _P_SP:
+            txBody = shape.find(_P_TXBODY)
+            if txBody is not None:
+                yield from txBody.iterfind('a:p', _NS)
+        elif shape.tag == _P_GRPSP:
+            yield from _iter_shape_tree_paragraphs(shape)
+
+
+def _paragraph_text(p) -> str:
+    """Concatenate run, field and line-break text of an a:p element."""
+    parts = []
+    for child in p:
+        if child.tag == _A_R or child.tag == _A_FLD:
+            t = child.find(_A_T)
+            if t is not None and t.text:
+                parts.append(t.text)
+        elif child.tag == _A_BR:
+            parts.append('\v')
+    return ''.join(parts)
+
+
+def iter_slide_paragraphs(pptx_path: str) -> Iterator[list[str]]:
+    """
+    Yield the non-empty paragraph texts of each slide, in presentation order.
+
+    Text is read as in iter_bold_runs (_iter_text_paragraphs and
+    _paragraph_text), for callers that scan all text rather than bold runs.
+    Raises if the deck cannot be opened.
+
+    Created: 2026-10-16
+    """
+    with zipfile.ZipFile(pptx_path) as zf:
+        for part_name in _slide_part_names(zf):
+            slide_root = etree.fromstring(zf.read(part_name), _XML_PARSER)
+            texts = []
+            for paragraph in _iter_text_paragraphs(slide_root):
+                para_text = _paragraph_text(paragraph)
+                if para_text:
+                    texts.append(para_text)
+            yield texts
+
+
 # =============================================================================
 # LAYER 2: EXTRACTION
 # =============================================================================
 
-def extract_bold_runs(pptx_path: str) -> dict:
+def iter_bold_runs(pptx_path: str, results: dict = None) -> Iterator[dict]:
     """
-    Extract bold terms from a PowerPoint file with chapter tracking.
+    Yield bold term dicts from a PowerPoint file one at a time.
 
     Core extraction algorithm:
-    1. Iterate through slides, shapes, paragraphs, runs
+    1. Iterate through slide XML parts, text-frame paragraphs, runs
     2. Detect chapter headings from paragraph text
     3. Extract runs where font.bold == True (explicit bold only)
     4. Apply noise filtering and cleaning
     5. Track slide number, chapter, and paragraph context
 
+    Errors propagate to the caller; extract_bold_runs collects them.
+
+    Created: 2026-10-16 — streaming form of extract_bold_runs; reads slide
+    XML directly from the zip (see PPTX XML ACCESS)
+
+    Args:
+        pptx_path: Path to PowerPoint file
+        results: Optional dict; 'total_slides' is set on it once known
+
+    Yields:
+        Term dicts with keys: term, slide, chapter, context, flagged, review_reason
+    """
+    current_chapter = None
+    in_credits_section = False  # 2026-02-22: Track Picture Credits section
+    # 2026-10-16: Repeated paragraph texts (e.g. recurring headings) share
+    #             one string object across the term dicts that reference them
+    shared_contexts = {}
+
+    with zipfile.ZipFile(pptx_path) as zf:
+        slide_parts = _slide_part_names(zf)
+        if results is not None:
+            results['total_slides'] = len(slide_parts)
+
+        for slide_num, part_name in enumerate(slide_parts, start=1):
+            slide_root = etree.fromstring(zf.read(part_name), _XML_PARSER)
+
+            for paragraph in _iter_text_paragraphs(slide_root):
+                # Get full paragraph text for context and chapter detection
+                para_text = _paragraph_text(paragraph).strip()
+
+                # 2026-02-22: Check if we've entered Picture Credits section
+                # 2026-10-16: Credits run to the end of the booklet, so stop
+                #             scanning there rather than skipping each paragraph
+                if _RE_PICTURE_CREDIT.search(para_text):
+                    in_credits_section = True
+                    break
+
+                # Check for chapter heading (scans ALL text, not just bold)
+                chapter_heading = detect_chapter(para_text)
+                if chapter_heading:
+                    current_chapter = chapter_heading
+
+                # 2026-10-16: Most paragraphs have no bold runs at all
+                if not _HAS_BOLD_RUN(paragraph):
+                    continue
+
+                # Extract bold runs
+                for run in paragraph.iterfind('a:r', _NS):
+                    # Only capture explicit bold (True), not inherited (None)
+                    rPr = run.find(_A_RPR)
+                    if rPr is None or rPr.get('b') not in _XSD_TRUE:
+                        continue
+
+                    t = run.find(_A_T)
+                    run_text = (t.text or '').strip() if t is not None else ''
+
+                    # Skip empty runs
+                    if not run_text:
+                        continue
+
+                    # Apply noise filter (run_text is already stripped)
+                    if _is_noise_stripped(run_text):
+                        continue
+
+                    # 2026-02-22: Clean and flag with enhanced review logic
+                    # 2026-10-16: Terms recur across slides, so intern them;
+                    #             clean_term inlined as run_text is stripped
+                    cleaned = sys.intern(run_text.rstrip(TRAILING_PUNCTUATION))
+                    needs_review, review_reason = flag_for_review(cleaned, para_text)
+
+                    # Yield extracted term with metadata
+                    yield {
+                        'term': cleaned,
+                        'slide': slide_num,
+                        'chapter': current_chapter,
+                        'context': shared_contexts.setdefault(para_text, para_text),
+                        'flagged': needs_review,
+                        'review_reason': review_reason
+                    }
+
+            # Nothing after the Picture Credits heading is extracted
+            if in_credits_section:
+                break
+
+
+def extract_bold_runs(pptx_path: str) -> dict:
+    """
+    Extract bold terms from a PowerPoint file with chapter tracking.
+
+    See iter_bold_runs for the extraction algorithm.
+
+    2026-10-16: Collects iter_bold_runs; terms extracted before an error
+    are kept alongside the error message
+
     Args:
         pptx_path: Path to PowerPoint file
 
@@ -185,65 +451,11 @@ def extract_bold_runs(pptx_path: str) -> dict:
         'errors': []
     }
 
-    current_chapter = None
-    in_credits_section = False  # 2026-02-22: Track Picture Credits section
+    add_term = results['terms'].append
 
     try:
-        prs = Presentation(pptx_path)
-        results['total_slides'] = len(prs.slides)
-
-        for slide_num, slide in enumerate(prs.slides, start=1):
-            for shape in slide.shapes:
-                # Skip shapes without text frames
-                if not hasattr(shape, 'text_frame'):
-                    continue
-
-                for paragraph in shape.text_frame.paragraphs:
-                    # Get full paragraph text for context and chapter detection
-                    para_text = paragraph.text.strip()
-
-                    # 2026-02-22: Check if we've entered Picture Credits section
-                    if 'picture credit' in para_text.lower():
-                        in_credits_section = True
-
-                    # Skip all bold terms if in credits section
-                    if in_credits_section:
-                        continue
-
-                    # Check for chapter heading (scans ALL text, not just bold)
-                    chapter_heading = detect_chapter(para_text)
-                    if chapter_heading:
-                        current_chapter = chapter_heading
-
-                    # Extract bold runs
-                    for run in paragraph.runs:
-                        # Only capture explicit bold (True), not inherited (None)
-                        if run.font.bold is not True:
-                            continue
-
-                        run_text = run.text.strip()
-
-                        # Skip empty runs
-                        if not run_text:
-                            continue
-
-                        # Apply noise filter
-                        if is_noise(run_text):
-                            continue
-
-                        # 2026-02-22: Clean and flag with enhanced review logic
-                        cleaned = clean_term(run_text)
-                        needs_review, review_reason = flag_for_review(cleaned, para_text)
-
-                        # Store extracted term with metadata
-                        results['terms'].append({
-                            'term': cleaned,
-                            'slide': slide_num,
-                            'chapter': current_chapter,
-                            'context': para_text,
-                            'flagged': needs_review,
-                            'review_reason': review_reason
-                        })
+        for term_data in iter_bold_runs(pptx_path, results):
+            add_term(term_data)
 
     except Exception as e:
         results['errors'].append(f"Extraction error: {str(e)}")
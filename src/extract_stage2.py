@@ -12,14 +12,21 @@ Reuses Stage 1 extraction functions as a library.
 Created: 2026-02-22
 """
 
+import os
 import re
 import csv
 import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
 # Import Stage 1 extraction functions
 from extract_stage1 import extract_bold_runs
+# 2026-10-16: Shared occurrences index definitions
+from init_db import OCCURRENCE_INDEXES, ensure_occurrence_indexes
 
 # Import vocab validator (optional — gracefully absent if python-docx not installed)
 # 2026-02-24: Added vocab validation integration
@@ -34,6 +41,26 @@ except ImportError:
 # METADATA PARSING
 # =============================================================================
 
+# 2026-10-16: Path-parsing patterns compiled once at import
+# Unit folder, e.g. "Y4 Hist Autumn 1 The Roman Republic" or "Year 4 Hist ..."
+_RE_UNIT_FOLDER = re.compile(r'(?:Year\s+)?Y?(\d+)\s+(Hist|Geog|Relig)\s+(\w+)\s+(\d+)\s+(.+)$')
+# Trailing " Booklet" / " FINAL" suffixes on sample filenames
+_RE_FILENAME_SUFFIX = re.compile(r'(\s+(?:Booklet|FINAL))+\s*$', re.IGNORECASE)
+# Sample filename stem, e.g. "Y4 Spring 2 Christianity in 3 empires"
+_RE_FILENAME = re.compile(r'(?:Year\s+)?Y?(\d+)\s+((?:Autumn|Spring|Summer)\s+\d+)\s+(.+)$', re.IGNORECASE)
+# 2026-10-16: Folder-name subject abbreviations, built once at import
+_SUBJECT_ABBREVIATIONS = {
+    'Hist': 'History',
+    'Geog': 'Geography',
+    'Relig': 'Religion'
+}
+# Subject abbreviations as standalone tokens (non-alpha boundaries), in priority order
+_RE_SUBJECT_TOKENS = (
+    (re.compile(r'(?<![a-z])hist(?![a-z])'), 'History'),
+    (re.compile(r'(?<![a-z])geog(?![a-z])'), 'Geography'),
+    (re.compile(r'(?<![a-z])relig(?![a-z])'), 'Religion'),
+)
+
 def parse_filename_metadata(filepath: str) -> dict:
     """
     Extract curriculum metadata from file path.
@@ -50,19 +77,18 @@ def parse_filename_metadata(filepath: str) -> dict:
     Returns:
         dict with keys: subject, year, term, unit, source_path
     """
-    path = Path(filepath)
-    filename = path.stem  # Filename without extension
+    # 2026-10-16: Name parsing uses plain os.path string operations
+    source_path = os.path.abspath(filepath)
+    parent_dir, basename = os.path.split(filepath)
+    filename = os.path.splitext(basename)[0]  # Filename without extension
 
     # Pattern 1 - Full corpus structure
     # Path structure: .../Y4 Hist Autumn 1 The Roman Republic/Y4 Autumn 1 The Roman Republic Booklet/file.pptx
     # Parse from the unit folder (parent.parent)
-    unit_folder = path.parent.parent.name  # e.g., "Y4 Hist Autumn 1 The Roman Republic"
+    unit_folder = os.path.basename(os.path.dirname(parent_dir))  # e.g., "Y4 Hist Autumn 1 The Roman Republic"
 
     # 2026-02-24: Extended to handle "Year N" prefix in folder names
-    corpus_match = re.match(
-        r'(?:Year\s+)?Y?(\d+)\s+(Hist|Geog|Relig)\s+(\w+)\s+(\d+)\s+(.+)$',
-        unit_folder
-    )
+    corpus_match = _RE_UNIT_FOLDER.match(unit_folder)
 
     if corpus_match:
         year = int(corpus_match.group(1))
@@ -82,19 +108,15 @@ def parse_filename_metadata(filepath: str) -> dict:
             'year': year,
             'term': term,
             'unit': unit,
-            'source_path': str(path.absolute())
+            'source_path': source_path
         }
 
     # Pattern 2 - Fall back to filename parsing (sample file pattern)
     # 2026-02-24: Extended to handle "Year N" prefix, lowercase "booklet",
     #             "FINAL" suffix, and filenames with no "Booklet" at all.
     # Strip known trailing suffixes before matching
-    clean_stem = re.sub(r'(\s+(?:Booklet|FINAL))+\s*$', '', filename, flags=re.IGNORECASE).strip()
-    match = re.match(
-        r'(?:Year\s+)?Y?(\d+)\s+((?:Autumn|Spring|Summer)\s+\d+)\s+(.+)$',
-        clean_stem,
-        re.IGNORECASE
-    )
+    clean_stem = _RE_FILENAME_SUFFIX.sub('', filename).strip()
+    match = _RE_FILENAME.match(clean_stem)
 
     if match:
         year = int(match.group(1))
@@ -105,14 +127,14 @@ def parse_filename_metadata(filepath: str) -> dict:
         term = term_raw.title().replace(' ', '')
 
         # Infer subject from unit name or filename
-        subject = infer_subject(filename, str(path.parent))
+        subject = infer_subject(filename, parent_dir)
 
         return {
             'subject': subject,
             'year': year,
             'term': term,
             'unit': unit,
-            'source_path': str(path.absolute())
+            'source_path': source_path
         }
 
     # If parsing fails, return None values
@@ -121,7 +143,7 @@ def parse_filename_metadata(filepath: str) -> dict:
         'year': None,
         'term': None,
         'unit': None,
-        'source_path': str(path.absolute())
+        'source_path': source_path
     }
 
 
@@ -137,12 +159,7 @@ def expand_subject_abbreviation(abbr: str) -> str:
     Returns:
         Full subject name
     """
-    mapping = {
-        'Hist': 'History',
-        'Geog': 'Geography',
-        'Relig': 'Religion'
-    }
-    return mapping.get(abbr, abbr)
+    return _SUBJECT_ABBREVIATIONS.get(abbr, abbr)
 
 
 def infer_subject(filename: str, parent_path: str) -> str:
@@ -173,12 +190,9 @@ def infer_subject(filename: str, parent_path: str) -> str:
 
     # Fallback: abbreviation as standalone token (non-alpha boundaries)
     text = f"{filename} {path_lower}"
-    if re.search(r'(?<![a-z])hist(?![a-z])', text):
-        return 'History'
-    elif re.search(r'(?<![a-z])geog(?![a-z])', text):
-        return 'Geography'
-    elif re.search(r'(?<![a-z])relig(?![a-z])', text):
-        return 'Religion'
+    for pattern, subject in _RE_SUBJECT_TOKENS:
+        if pattern.search(text):
+            return subject
 
     return 'History'
 
@@ -187,90 +201,125 @@ def infer_subject(filename: str, parent_path: str) -> str:
 # DATABASE OPERATIONS
 # =============================================================================
 
-def get_or_create_concept(cursor: sqlite3.Cursor, term: str, subject_area: str = None) -> int:
+# 2026-10-16: Connection tuning for bulk writes. WAL lets readers (e.g. the
+#             uplink) continue during a batch and, with synchronous=NORMAL,
+#             avoids a full fsync on every commit.
+WRITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+)
+
+
+def tune_connection(conn: sqlite3.Connection) -> None:
     """
-    Get existing concept_id or create new concept.
+    Apply WRITE_PRAGMAS to a new connection.
 
-    Args:
-        cursor: SQLite cursor
-        term: Concept term text
-        subject_area: Optional subject classification
+    Shared by the bulk writers (Stage 2, repair_chapters, vocab_first_cleanup).
+    sqlite3.connect already applies a 5 s busy timeout.
+    Created: 2026-10-16
+    """
+    for pragma in WRITE_PRAGMAS:
+        conn.execute(pragma)
 
-    Returns:
-        concept_id (int)
+
+def open_write_connection(db_path: str) -> sqlite3.Connection:
     """
-    # Check if concept exists
-    cursor.execute(
-        "SELECT concept_id FROM concepts WHERE term = ?",
-        (term,)
-    )
-    result = cursor.fetchone()
+    Open a SQLite connection tuned for bulk writes.
 
-    if result:
-        return result[0]
+    The connection is in autocommit mode (isolation_level=None); callers
+    delimit each unit of work with an explicit BEGIN and COMMIT/ROLLBACK.
 
-    # Create new concept
-    cursor.execute(
-        "INSERT INTO concepts (term, subject_area) VALUES (?, ?)",
-        (term, subject_area)
-    )
-    return cursor.lastrowid
+    Created: 2026-10-16
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    tune_connection(conn)
+    return conn
 
 
-def insert_occurrence(cursor: sqlite3.Cursor, concept_id: int, metadata: dict,
-                     term_data: dict) -> int:
+def load_concept_ids(conn: sqlite3.Connection) -> dict:
     """
-    Insert an occurrence record.
+    Load the whole term -> concept_id map in one query.
 
-    2026-02-22: Added needs_review and review_reason columns
-    2026-02-24: Added validation_status, vocab_confidence, vocab_match_type, vocab_source
+    The concept vocabulary is small (thousands of rows). Descending order
+    means the lowest id wins for any duplicate term.
 
-    Args:
-        cursor: SQLite cursor
-        concept_id: Foreign key to concepts table
-        metadata: File metadata (subject, year, term, unit, source_path)
-        term_data: Extracted term data (slide, chapter, context, flagged, review_reason,
-                   and optional validation fields)
+    Created: 2026-10-16
+    """
+    return dict(conn.execute(
+        "SELECT term, concept_id FROM concepts ORDER BY concept_id DESC"
+    ).fetchall())
+
+
+# 2026-10-16: Insert statements used by write_to_database
+_INSERT_CONCEPT_SQL = "INSERT INTO concepts (term, subject_area) VALUES (?, ?)"
+# 2026-02-22: needs_review and review_reason columns
+# 2026-02-24: validation_status, vocab_confidence, vocab_match_type, vocab_source
+_INSERT_OCCURRENCE_SQL = """
+    INSERT INTO occurrences (
+        concept_id, subject, year, term, unit, chapter,
+        slide_number, is_introduction, term_in_context, source_path,
+        needs_review, review_reason,
+        validation_status, vocab_confidence, vocab_match_type, vocab_source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    Returns:
-        occurrence_id (int)
-    """
-    cursor.execute("""
-        INSERT INTO occurrences (
-            concept_id, subject, year, term, unit, chapter,
-            slide_number, is_introduction, term_in_context, source_path,
-            needs_review, review_reason,
-            validation_status, vocab_confidence, vocab_match_type, vocab_source
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
-        concept_id,
-        metadata['subject'],
-        metadata['year'],
-        metadata['term'],
-        metadata['unit'],
-        term_data['chapter'],
-        term_data['slide'],
-        True,  # All bold terms in Stage 2 are introductions
-        term_data['context'],
-        metadata['source_path'],
-        1 if term_data['flagged'] else 0,
-        term_data.get('review_reason', None),
-        term_data.get('validation_status', None),
-        term_data.get('vocab_confidence', None),
-        term_data.get('vocab_match_type', None),
-        term_data.get('vocab_source', None)
-    ))
-    return cursor.lastrowid
-
-
-def write_to_database(db_path: str, metadata: dict, extraction_results: dict) -> dict:
+# 2026-10-16: Runs of this many files drop the occurrences indexes
+#             (init_db.OCCURRENCE_INDEXES) and rebuild them once at the end
+#             rather than updating every index on every inserted row; if
+#             a run is killed, migrate_add_occurrence_indexes.py restores them
+BULK_LOAD_MIN_FILES = 20
+
+# 2026-10-16: Checkpoint the WAL every N files of a batch run, so it stays
+#             bounded instead of growing until an automatic checkpoint stalls
+#             a write
+WAL_CHECKPOINT_INTERVAL = 50
+
+
+@contextmanager
+def deferred_occurrence_indexes(conn: sqlite3.Connection):
+    """
+    Drop the occurrences indexes for the duration of a bulk load.
+
+    The indexes are recreated on exit, including when the load fails or is
+    interrupted. Queries from other connections run unindexed meanwhile.
+    If the process is killed first, migrate_add_occurrence_indexes.py
+    recreates them.
+
+    Created: 2026-10-16
+    """
+    for name, _ in OCCURRENCE_INDEXES:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    try:
+        yield
+    finally:
+        ensure_occurrence_indexes(conn)
+
+
+def write_to_database(conn: sqlite3.Connection, metadata: dict, extraction_results: dict,
+                      concept_ids: dict = None) -> dict:
     """
     Write extraction results to SQLite database.
 
+    2026-10-16: All writes for a file run in one explicit transaction on a
+    WAL-mode connection (see open_write_connection), and
+    occurrences are inserted with a single executemany. Existing concept
+    ids are loaded into a dict up front, replacing the per-term COUNT(*)
+    and SELECT round-trips, and a file's new concepts are inserted
+    together. The former get_or_create_concept and insert_occurrence
+    helpers are inlined.
+    2026-10-16: Takes an open connection instead of a path, so a batch run
+    shares one connection (and its page cache) across files.
+    2026-10-16: Optional concept_ids cache (from load_concept_ids) is used
+    and extended in place instead of reloading the map for every file.
+
     Args:
-        db_path: Path to SQLite database file
+        conn: Connection from open_write_connection()
         metadata: File metadata from parse_filename_metadata()
         extraction_results: Results from extract_bold_runs()
+        concept_ids: Optional term -> concept_id cache shared across calls;
+            only valid while this connection is the database's only writer
 
     Returns:
         dict with write statistics
@@ -281,37 +330,82 @@ def write_to_database(db_path: str, metadata: dict, extraction_results: dict) ->
         'occurrences_created': 0,
         'errors': []
     }
+    created_terms = []
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        for term_data in extraction_results['terms']:
-            term = term_data['term']
-
-            # Get or create concept
-            existing_count = cursor.execute(
-                "SELECT COUNT(*) FROM concepts WHERE term = ?", (term,)
-            ).fetchone()[0]
-
-            concept_id = get_or_create_concept(
-                cursor, term, metadata['subject']
-            )
-
-            if existing_count > 0:
-                stats['concepts_reused'] += 1
-            else:
-                stats['concepts_created'] += 1
-
-            # Insert occurrence
-            insert_occurrence(cursor, concept_id, metadata, term_data)
-            stats['occurrences_created'] += 1
-
-        conn.commit()
-        conn.close()
+        # Commits on success, rolls back the whole file on error.
+        # IMMEDIATE takes the write lock up front, so a concurrent writer
+        # fails here rather than midway through the file.
+        with conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            execute = cursor.execute
+
+            # Per-file values, read once rather than per term
+            subject = metadata['subject']
+            year = metadata['year']
+            term_period = metadata['term']
+            unit = metadata['unit']
+            source_path = metadata['source_path']
+
+            if concept_ids is None:
+                concept_ids = load_concept_ids(conn)
+
+            # Create this file's new concepts in one batch, in first-appearance
+            # order. The write lock from BEGIN IMMEDIATE means every id above
+            # the current maximum afterwards is one of ours.
+            terms = extraction_results['terms']
+            created_terms = [term for term in dict.fromkeys(t['term'] for t in terms)
+                             if term not in concept_ids]
+            if created_terms:
+                execute("SELECT COALESCE(MAX(concept_id), 0) FROM concepts")
+                last_id = cursor.fetchone()[0]
+                cursor.executemany(
+                    _INSERT_CONCEPT_SQL, [(term, subject) for term in created_terms]
+                )
+                execute("SELECT term, concept_id FROM concepts WHERE concept_id > ?", (last_id,))
+                concept_ids.update(cursor.fetchall())
+
+            # Occurrence rows are generated as executemany consumes them,
+            # rather than held as a second full list alongside terms
+            def occurrence_rows():
+                for term_data in terms:
+                    # 2026-02-22: needs_review and review_reason columns
+                    # 2026-02-24: validation_status, vocab_confidence, vocab_match_type, vocab_source
+                    get = term_data.get
+                    yield (
+                        concept_ids[term_data['term']],
+                        subject,
+                        year,
+                        term_period,
+                        unit,
+                        term_data['chapter'],
+                        term_data['slide'],
+                        True,  # All bold terms in Stage 2 are introductions
+                        term_data['context'],
+                        source_path,
+                        1 if term_data['flagged'] else 0,
+                        get('review_reason'),
+                        get('validation_status'),
+                        get('vocab_confidence'),
+                        get('vocab_match_type'),
+                        get('vocab_source')
+                    )
+
+            cursor.executemany(_INSERT_OCCURRENCE_SQL, occurrence_rows())
+
+            created = len(created_terms)
+            stats['concepts_created'] = created
+            stats['concepts_reused'] = len(terms) - created
+            stats['occurrences_created'] = len(terms)
 
     except Exception as e:
         stats['errors'].append(f"Database error: {str(e)}")
+        # The transaction rolled back, so ids handed out for new concepts
+        # are gone; drop them from a shared cache
+        if concept_ids is not None:
+            for term in created_terms:
+                concept_ids.pop(term, None)
 
     return stats
 
@@ -320,6 +414,17 @@ def write_to_database(db_path: str, metadata: dict, extraction_results: dict) ->
 # CSV EXPORT
 # =============================================================================
 
+# 2026-02-22: Added review_reason column
+# 2026-02-24: Added validation columns
+CSV_FIELDNAMES = (
+    'term', 'slide', 'chapter', 'context', 'flagged', 'review_reason',
+    'subject', 'year', 'term_period', 'unit',
+    'validation_status', 'vocab_confidence', 'vocab_match_type'
+)
+
+# 2026-10-16: Output buffer for CSV export (fewer write syscalls per file)
+CSV_BUFFER_SIZE = 1 << 20
+
 def export_to_csv(csv_path: str, metadata: dict, extraction_results: dict) -> bool:
     """
     Export extraction results to CSV for human review.
@@ -327,6 +432,11 @@ def export_to_csv(csv_path: str, metadata: dict, extraction_results: dict) -> bo
     CSV columns:
     - term, slide, chapter, context, flagged, review_reason, subject, year, term, unit
 
+    2026-10-16: Rows are written as tuples with csv.writer through a 1 MiB
+    file buffer instead of per-row dicts through DictWriter
+    2026-10-16: Unencodable characters are replaced rather than failing the
+    whole export
+
     Args:
         csv_path: Output CSV file path
         metadata: File metadata
@@ -335,33 +445,34 @@ def export_to_csv(csv_path: str, metadata: dict, extraction_results: dict) -> bo
     Returns:
         True if successful, False otherwise
     """
+    subject = metadata['subject']
+    year = metadata['year']
+    term_period = metadata['term']
+    unit = metadata['unit']
+
     try:
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            # 2026-02-22: Added review_reason column
-            # 2026-02-24: Added validation columns
-            writer = csv.DictWriter(f, fieldnames=[
-                'term', 'slide', 'chapter', 'context', 'flagged', 'review_reason',
-                'subject', 'year', 'term_period', 'unit',
-                'validation_status', 'vocab_confidence', 'vocab_match_type'
-            ])
-            writer.writeheader()
-
-            for term_data in extraction_results['terms']:
-                writer.writerow({
-                    'term': term_data['term'],
-                    'slide': term_data['slide'],
-                    'chapter': term_data['chapter'] or '',
-                    'context': term_data['context'],
-                    'flagged': 'YES' if term_data['flagged'] else 'NO',
-                    'review_reason': term_data.get('review_reason', ''),
-                    'subject': metadata['subject'],
-                    'year': metadata['year'],
-                    'term_period': metadata['term'],
-                    'unit': metadata['unit'],
-                    'validation_status': term_data.get('validation_status', ''),
-                    'vocab_confidence': term_data.get('vocab_confidence', ''),
-                    'vocab_match_type': term_data.get('vocab_match_type', '')
-                })
+        with open(csv_path, 'w', newline='', encoding='utf-8', errors='replace',
+                  buffering=CSV_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDNAMES)
+            writer.writerows(
+                (
+                    term_data['term'],
+                    term_data['slide'],
+                    term_data['chapter'] or '',
+                    term_data['context'],
+                    'YES' if term_data['flagged'] else 'NO',
+                    term_data.get('review_reason', ''),
+                    subject,
+                    year,
+                    term_period,
+                    unit,
+                    term_data.get('validation_status', ''),
+                    term_data.get('vocab_confidence', ''),
+                    term_data.get('vocab_match_type', '')
+                )
+                for term_data in extraction_results['terms']
+            )
 
         return True
 
@@ -374,20 +485,15 @@ def export_to_csv(csv_path: str, metadata: dict, extraction_results: dict) -> bo
 # MAIN EXECUTION
 # =============================================================================
 
-def process_file(pptx_path: str, db_path: str, csv_output_dir: str = None) -> dict:
+def _new_results(pptx_path: str) -> dict:
     """
-    Complete Stage 2 pipeline: extract, parse metadata, write to DB, export CSV.
+    Empty per-file results dict, as returned by extract_file().
 
-    Args:
-        pptx_path: Path to PPTX file
-        db_path: Path to SQLite database
-        csv_output_dir: Optional directory for CSV export
-
-    Returns:
-        dict with processing results and statistics
+    Created: 2026-10-16
     """
-    results = {
+    return {
         'file': pptx_path,
+        'display_name': os.path.basename(pptx_path),
         'success': False,
         'metadata': None,
         'extraction': None,
@@ -396,9 +502,35 @@ def process_file(pptx_path: str, db_path: str, csv_output_dir: str = None) -> di
         'errors': []
     }
 
+
+def extract_file(pptx_path: str, csv_output_dir: str = None,
+                 verbose: bool = True) -> dict:
+    """
+    Stage 2 steps that do not touch the database: parse metadata, extract,
+    validate against the vocab list, export CSV.
+
+    Needs no shared state, so process_corpus runs it in worker processes.
+    The returned dict is passed to write_file_results() to finish the file.
+
+    Created: 2026-10-16 (split out of process_file)
+
+    Args:
+        pptx_path: Path to PPTX file
+        csv_output_dir: Optional directory for CSV export
+        verbose: Print per-step progress (default True)
+
+    Returns:
+        dict with processing results; 'success' is set by write_file_results()
+    """
+    # 2026-10-16: Base name computed once, for log lines and print_results
+    results = _new_results(pptx_path)
+    display_name = results['display_name']
+
+    log = print if verbose else (lambda *args, **kwargs: None)
+
     try:
         # Step 1: Parse metadata
-        print(f"Parsing metadata from: {Path(pptx_path).name}")
+        log(f"Parsing metadata from: {display_name}")
         metadata = parse_filename_metadata(pptx_path)
         results['metadata'] = metadata
 
@@ -407,9 +539,8 @@ def process_file(pptx_path: str, db_path: str, csv_output_dir: str = None) -> di
             return results
 
         # Step 2: Extract bold terms (reuse Stage 1)
-        print(f"Extracting bold terms...")
+        log(f"Extracting bold terms...")
         extraction = extract_bold_runs(pptx_path)
-        results['extraction'] = extraction
 
         if extraction['errors']:
             results['errors'].extend(extraction['errors'])
@@ -418,93 +549,256 @@ def process_file(pptx_path: str, db_path: str, csv_output_dir: str = None) -> di
         if VOCAB_VALIDATION_AVAILABLE:
             vocab_path = find_vocab_list(pptx_path)
             if vocab_path:
-                print(f"Validating against vocab list...")
+                log(f"Validating against vocab list...")
                 try:
-                    extraction = validate_extraction(extraction, vocab_path)
+                    # 2026-10-16: Only the missed count is reported here
+                    extraction = validate_extraction(
+                        extraction, vocab_path, include_missed_terms=False
+                    )
                     vstats = extraction.get('validation_stats', {})
                     results['validation_stats'] = vstats
-                    print(f"  Vocab: {vstats.get('vocab_list', '?')} "
+                    log(f"  Vocab: {vstats.get('vocab_list', '?')} "
                           f"({vstats.get('vocab_terms_total', 0)} terms)")
-                    print(f"  Confirmed: {vstats.get('extracted_confirmed', 0)}  "
+                    log(f"  Confirmed: {vstats.get('extracted_confirmed', 0)}  "
                           f"Potential noise: {vstats.get('extracted_noise', 0)}  "
-                          f"Missed: {len(vstats.get('missed_terms', []))}")
+                          f"Missed: {vstats.get('missed_terms_count', 0)}")
                 except Exception as e:
-                    print(f"  Vocab validation failed: {e}")
+                    log(f"  Vocab validation failed: {e}")
             else:
-                print(f"  No vocab list found — skipping validation")
-
-        # Step 3: Write to database
-        print(f"Writing to database: {db_path}")
-        db_stats = write_to_database(db_path, metadata, extraction)
-        results['db_stats'] = db_stats
+                log(f"  No vocab list found — skipping validation")
 
-        if db_stats['errors']:
-            results['errors'].extend(db_stats['errors'])
+        # Set once extraction (and validation) is complete, so
+        # write_file_results only sees finished extractions
+        results['extraction'] = extraction
 
-        # Step 4: Export to CSV (optional)
+        # Step 3: Export to CSV (optional)
         if csv_output_dir:
-            csv_filename = f"{Path(pptx_path).stem}_extracted.csv"
+            csv_filename = f"{os.path.splitext(display_name)[0]}_extracted.csv"
             csv_path = Path(csv_output_dir) / csv_filename
-            print(f"Exporting to CSV: {csv_path}")
+            log(f"Exporting to CSV: {csv_path}")
 
             if export_to_csv(str(csv_path), metadata, extraction):
                 results['csv_path'] = str(csv_path)
             else:
                 results['errors'].append("CSV export failed")
 
-        results['success'] = len(results['errors']) == 0
-
     except Exception as e:
         results['errors'].append(f"Processing error: {str(e)}")
 
     return results
 
 
+def write_file_results(results: dict, conn: sqlite3.Connection, verbose: bool = True,
+                       concept_ids: dict = None) -> dict:
+    """
+    Final Stage 2 step: write an extract_file() result to the database.
+
+    Created: 2026-10-16 (split out of process_file)
+
+    Args:
+        results: Results dict from extract_file()
+        conn: Connection from open_write_connection()
+        verbose: Print per-step progress (default True)
+        concept_ids: Optional term -> concept_id cache (see write_to_database)
+
+    Returns:
+        The same results dict, with db_stats and success filled in
+    """
+    if results['extraction'] is None:
+        return results
+
+    if verbose:
+        print(f"Writing to database...")
+    db_stats = write_to_database(conn, results['metadata'], results['extraction'], concept_ids)
+    results['db_stats'] = db_stats
+
+    if db_stats['errors']:
+        results['errors'].extend(db_stats['errors'])
+
+    results['success'] = len(results['errors']) == 0
+    return results
+
+
+def process_file(pptx_path: str, db_path: str, csv_output_dir: str = None,
+                 verbose: bool = True) -> dict:
+    """
+    Complete Stage 2 pipeline: extract, parse metadata, write to DB, export CSV.
+
+    2026-10-16: Added verbose flag so batch runs can suppress per-step output
+    2026-10-16: Now extract_file() followed by write_file_results(); the
+                CSV export runs before the database write
+
+    Args:
+        pptx_path: Path to PPTX file
+        db_path: Path to SQLite database
+        csv_output_dir: Optional directory for CSV export
+        verbose: Print per-step progress (default True)
+
+    Returns:
+        dict with processing results and statistics
+    """
+    results = extract_file(pptx_path, csv_output_dir, verbose)
+    if results['extraction'] is None:
+        return results
+
+    log = print if verbose else (lambda *args, **kwargs: None)
+    log(f"Opening database: {db_path}")
+    try:
+        conn = open_write_connection(db_path)
+    except Exception as e:
+        results['errors'].append(f"Database error: {str(e)}")
+        return results
+
+    try:
+        return write_file_results(results, conn, verbose)
+    finally:
+        conn.close()
+
+
+def process_corpus(pptx_paths: list, db_path: str, csv_output_dir: str = None,
+                   workers: int = None, verbose: bool = True):
+    """
+    Run the Stage 2 pipeline over many files, extracting in parallel.
+
+    extract_file runs in worker processes. Each result is written to the
+    database from this (parent) process over one connection held for the
+    whole run, so SQLite only ever has one writer. Results are yielded in
+    the same order as pptx_paths, as each file is written. The concept map
+    is loaded once and carried from file to file. For runs of
+    BULK_LOAD_MIN_FILES or more, the occurrences indexes are dropped for
+    the duration and rebuilt at the end. The WAL is checkpointed every
+    WAL_CHECKPOINT_INTERVAL files, and truncated once the run completes.
+
+    Per-step output is only printed on the serial path (workers=1 or a
+    single file); worker output would interleave.
+
+    Created: 2026-10-16
+    2026-10-16: Failures are isolated per file. A worker that raises (or a
+    broken pool), a failed database write, or a connection that cannot be
+    opened yields a results dict with success False and the error, and the
+    run continues with the next file.
+
+    Args:
+        pptx_paths: Paths to PPTX files
+        db_path: Path to SQLite database
+        csv_output_dir: Optional directory for CSV export
+        workers: Number of worker processes (default: os.cpu_count())
+        verbose: Print per-step progress on the serial path (default True)
+
+    Yields:
+        process_file()-style results dict per path
+    """
+    if not pptx_paths:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    try:
+        conn = open_write_connection(db_path)
+    except Exception as e:
+        for pptx_path in pptx_paths:
+            results = _new_results(pptx_path)
+            results['errors'].append(f"Database error: {str(e)}")
+            yield results
+        return
+
+    try:
+        concept_ids = load_concept_ids(conn)
+
+        with ExitStack() as stack:
+            if len(pptx_paths) >= BULK_LOAD_MIN_FILES:
+                stack.enter_context(deferred_occurrence_indexes(conn))
+
+            if workers == 1 or len(pptx_paths) < 2:
+                extract = partial(extract_file, csv_output_dir=csv_output_dir, verbose=verbose)
+                pending = [partial(extract, pptx_path) for pptx_path in pptx_paths]
+            else:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=min(workers, len(pptx_paths)))
+                )
+                extract = partial(extract_file, csv_output_dir=csv_output_dir, verbose=False)
+                pending = [executor.submit(extract, pptx_path).result
+                           for pptx_path in pptx_paths]
+
+            for files_written, (pptx_path, extracted) in enumerate(zip(pptx_paths, pending), 1):
+                try:
+                    results = extracted()
+                except Exception as e:
+                    results = _new_results(pptx_path)
+                    results['errors'].append(f"Processing error: {str(e)}")
+                try:
+                    results = write_file_results(results, conn, verbose, concept_ids)
+                except Exception as e:
+                    results['errors'].append(f"Database error: {str(e)}")
+                    results['success'] = False
+                yield results
+                if files_written % WAL_CHECKPOINT_INTERVAL == 0:
+                    conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    finally:
+        # Fold the WAL back into the database and reset it to zero length.
+        # In the finally so it also runs when the caller closes the generator
+        # at its last yield; a failed checkpoint must not mask an error
+        # already propagating.
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            pass
+        conn.close()
+
+
 def print_results(results: dict):
     """
     Print processing results summary.
 
+    2026-10-16: Lines are accumulated and written in a single call
+
     Args:
         results: Results dict from process_file()
     """
-    print("\n" + "=" * 60)
-    print("=== STAGE 2 PROCESSING RESULTS ===")
-    print("=" * 60)
+    lines = []
+    out = lines.append
 
-    print(f"File: {Path(results['file']).name}")
-    print(f"Success: {'✓' if results['success'] else '✗'}")
+    out("\n" + "=" * 60)
+    out("=== STAGE 2 PROCESSING RESULTS ===")
+    out("=" * 60)
+
+    out(f"File: {results.get('display_name') or os.path.basename(results['file'])}")
+    out(f"Success: {'✓' if results['success'] else '✗'}")
 
     if results['metadata']:
         m = results['metadata']
-        print(f"\nMetadata:")
-        print(f"  Subject: {m['subject']}")
-        print(f"  Year: {m['year']}")
-        print(f"  Term: {m['term']}")
-        print(f"  Unit: {m['unit']}")
+        out(f"\nMetadata:")
+        out(f"  Subject: {m['subject']}")
+        out(f"  Year: {m['year']}")
+        out(f"  Term: {m['term']}")
+        out(f"  Unit: {m['unit']}")
 
     if results['extraction']:
         e = results['extraction']
-        print(f"\nExtraction:")
-        print(f"  Slides processed: {e['total_slides']}")
-        print(f"  Terms extracted: {len(e['terms'])}")
-        print(f"  Flagged: {sum(1 for t in e['terms'] if t['flagged'])}")
+        out(f"\nExtraction:")
+        out(f"  Slides processed: {e['total_slides']}")
+        out(f"  Terms extracted: {len(e['terms'])}")
+        out(f"  Flagged: {sum(1 for t in e['terms'] if t['flagged'])}")
 
     if results['db_stats']:
         s = results['db_stats']
-        print(f"\nDatabase:")
-        print(f"  New concepts: {s['concepts_created']}")
-        print(f"  Existing concepts: {s['concepts_reused']}")
-        print(f"  Occurrences created: {s['occurrences_created']}")
+        out(f"\nDatabase:")
+        out(f"  New concepts: {s['concepts_created']}")
+        out(f"  Existing concepts: {s['concepts_reused']}")
+        out(f"  Occurrences created: {s['occurrences_created']}")
 
     if results['csv_path']:
-        print(f"\nCSV exported to: {results['csv_path']}")
+        out(f"\nCSV exported to: {results['csv_path']}")
 
     if results['errors']:
-        print(f"\nErrors:")
+        out(f"\nErrors:")
         for error in results['errors']:
-            print(f"  - {error}")
+            out(f"  - {error}")
+
+    out("=" * 60)
 
-    print("=" * 60)
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
 def main():
@@ -22,6 +22,7 @@ Originally created: 2026-02-26
 """
 
 import os
+from collections import Counter
 from pathlib import Path
 
 import networkx as nx
@@ -144,6 +145,61 @@ def build_graph(conn_string: str = PG_CONN_STRING) -> nx.DiGraph:
 # CANDIDATE EDGE GENERATION
 # =============================================================================
 
+# 2026-10-16: SQL counterpart of curriculum_position() for get_candidate_edges
+_TERM_RANK_SQL = (
+    "CASE o.term "
+    + " ".join(f"WHEN '{term}' THEN {rank}" for term, rank in TERM_ORDER.items())
+    + " ELSE 0 END"
+)
+
+_CANDIDATE_EDGES_SQL = f"""
+    WITH ordered AS (
+        SELECT o.occurrence_id, o.concept_id, c.term AS concept_term,
+               o.subject, o.year, o.term AS term_period,
+               o.unit, o.chapter,
+               {_TERM_RANK_SQL} AS term_rank,
+               COALESCE(o.slide_number, 0) AS slide_pos
+        FROM occurrences o
+        JOIN concepts c ON o.concept_id = c.concept_id
+        WHERE o.validation_status = 'confirmed'
+          -- Singleton concepts cannot form a pair; drop them before the sort
+          AND o.concept_id IN (
+              SELECT concept_id FROM occurrences
+              WHERE validation_status = 'confirmed'
+              GROUP BY concept_id
+              HAVING COUNT(*) >= 2
+          )
+    ),
+    chained AS (
+        SELECT ordered.*,
+               LAG(occurrence_id) OVER w AS prev_occurrence_id,
+               LAG(subject)       OVER w AS prev_subject,
+               LAG(year)          OVER w AS prev_year,
+               LAG(term_period)   OVER w AS prev_term_period,
+               LAG(unit)          OVER w AS prev_unit,
+               LAG(chapter)       OVER w AS prev_chapter,
+               LAG(term_rank)     OVER w AS prev_term_rank,
+               LAG(slide_pos)     OVER w AS prev_slide_pos
+        FROM ordered
+        WINDOW w AS (
+            PARTITION BY concept_id
+            ORDER BY year, term_rank, slide_pos, occurrence_id
+        )
+    )
+    SELECT ch.*,
+           EXISTS (
+               SELECT 1 FROM edges e
+               WHERE e.from_occurrence = ch.prev_occurrence_id
+                 AND e.to_occurrence = ch.occurrence_id
+           ) AS already_confirmed
+    FROM chained ch
+    WHERE ch.prev_occurrence_id IS NOT NULL
+      AND (ch.prev_year, ch.prev_term_rank, ch.prev_slide_pos)
+          <> (ch.year, ch.term_rank, ch.slide_pos)
+    ORDER BY ch.concept_id, ch.year, ch.term_rank, ch.slide_pos, ch.occurrence_id
+"""
+
+
 def get_candidate_edges(conn_string: str = PG_CONN_STRING) -> list[dict]:
     """
     Generate candidate occurrence→occurrence edges for human review.
@@ -152,78 +208,43 @@ def get_candidate_edges(conn_string: str = PG_CONN_STRING) -> list[dict]:
     - Sort by curriculum position (year, term, slide, occurrence_id)
     - Generate sequential chain: O1→O2, O2→O3, ...
     - Skip pairs at the same curriculum position
+
+    2026-10-16: Sorting, chaining and the already-confirmed check run in one
+    query (LAG over a per-concept window) instead of in Python; rows are
+    streamed from a server-side cursor straight into the result dicts
     """
     conn = psycopg2.connect(conn_string)
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT o.occurrence_id, o.concept_id, c.term AS concept_term,
-                       o.subject, o.year, o.term AS term_period,
-                       o.unit, o.chapter, o.slide_number
-                FROM occurrences o
-                JOIN concepts c ON o.concept_id = c.concept_id
-                WHERE o.validation_status = 'confirmed'
-                ORDER BY o.concept_id, o.year, o.term, o.slide_number, o.occurrence_id
-            """)
-            rows = [dict(r) for r in cursor.fetchall()]
-
-            cursor.execute("SELECT from_occurrence, to_occurrence FROM edges")
-            confirmed_pairs = {(r['from_occurrence'], r['to_occurrence']) for r in cursor.fetchall()}
+        # Named (server-side) cursor: rows arrive in batches of
+        # cursor.itersize instead of being fetched into one list up front
+        with conn.cursor(name='candidate_edges', cursor_factory=RealDictCursor) as cursor:
+            cursor.execute(_CANDIDATE_EDGES_SQL)
+            candidates = [
+                {
+                    'from_occurrence_id': row['prev_occurrence_id'],
+                    'to_occurrence_id':   row['occurrence_id'],
+                    'term':               row['concept_term'],
+                    'from_subject':       row['prev_subject'],
+                    'from_year':          row['prev_year'],
+                    'from_term':          row['prev_term_period'],
+                    'from_unit':          row['prev_unit'],
+                    'from_chapter':       row['prev_chapter'] or '',
+                    'to_subject':         row['subject'],
+                    'to_year':            row['year'],
+                    'to_term':            row['term_period'],
+                    'to_unit':            row['unit'],
+                    'to_chapter':         row['chapter'] or '',
+                    'edge_type':          (
+                        'within_subject' if row['prev_subject'] == row['subject']
+                        else 'cross_subject'
+                    ),
+                    'already_confirmed':  bool(row['already_confirmed']),
+                }
+                for row in cursor
+            ]
     finally:
         conn.close()
 
-    # Group by concept
-    from_concept: dict[int, list[dict]] = {}
-    for row in rows:
-        cid = row['concept_id']
-        from_concept.setdefault(cid, []).append(row)
-
-    candidates = []
-    for concept_id, occs in from_concept.items():
-        if len(occs) < 2:
-            continue
-
-        occs_sorted = sorted(
-            occs,
-            key=lambda o: (
-                curriculum_position(o['year'], o['term_period'], o['slide_number']),
-                o['occurrence_id'],
-            ),
-        )
-
-        for i in range(len(occs_sorted) - 1):
-            fr = occs_sorted[i]
-            to = occs_sorted[i + 1]
-
-            fr_pos = curriculum_position(fr['year'], fr['term_period'], fr['slide_number'])
-            to_pos = curriculum_position(to['year'], to['term_period'], to['slide_number'])
-            if fr_pos == to_pos:
-                continue
-
-            edge_type = (
-                'within_subject' if fr['subject'] == to['subject']
-                else 'cross_subject'
-            )
-            candidates.append({
-                'from_occurrence_id': fr['occurrence_id'],
-                'to_occurrence_id':   to['occurrence_id'],
-                'term':               fr['concept_term'],
-                'from_subject':       fr['subject'],
-                'from_year':          fr['year'],
-                'from_term':          fr['term_period'],
-                'from_unit':          fr['unit'],
-                'from_chapter':       fr['chapter'] or '',
-                'to_subject':         to['subject'],
-                'to_year':            to['year'],
-                'to_term':            to['term_period'],
-                'to_unit':            to['unit'],
-                'to_chapter':         to['chapter'] or '',
-                'edge_type':          edge_type,
-                'already_confirmed':  (
-                    fr['occurrence_id'], to['occurrence_id']
-                ) in confirmed_pairs,
-            })
-
     return candidates
 
 
@@ -232,39 +253,44 @@ def get_candidate_edges(conn_string: str = PG_CONN_STRING) -> list[dict]:
 # =============================================================================
 
 def graph_stats(G: nx.DiGraph) -> dict:
-    """Return summary statistics for the knowledge graph."""
-    concept_nodes = [n for n, d in G.nodes(data=True) if d.get('type') == 'concept']
-    occ_nodes     = [n for n, d in G.nodes(data=True) if d.get('type') == 'occurrence']
-
-    confirmed_edges = [
-        (u, v) for u, v, d in G.edges(data=True)
-        if d.get('edge_nature') is not None
-    ]
+    """
+    Return summary statistics for the knowledge graph.
 
-    by_edge_type   = {}
-    by_edge_nature = {}
+    2026-10-16: One pass over nodes and one over edges
+    """
+    concept_nodes = []
+    occ_count = 0
+    subjects = set()
+    for n, d in G.nodes(data=True):
+        node_type = d.get('type')
+        if node_type == 'concept':
+            concept_nodes.append(n)
+        elif node_type == 'occurrence':
+            occ_count += 1
+            if d.get('subject'):
+                subjects.add(d['subject'])
+
+    confirmed_edges = 0
+    by_edge_type   = Counter()
+    by_edge_nature = Counter()
     for _, _, d in G.edges(data=True):
-        if d.get('edge_type'):
-            by_edge_type[d['edge_type']] = by_edge_type.get(d['edge_type'], 0) + 1
-        if d.get('edge_nature'):
-            by_edge_nature[d['edge_nature']] = by_edge_nature.get(d['edge_nature'], 0) + 1
-
-    load_bearing = [
-        n for n in concept_nodes
-        if G.out_degree(n) >= 2
-    ]
-
-    subjects = set(
-        d.get('subject') for _, d in G.nodes(data=True)
-        if d.get('type') == 'occurrence' and d.get('subject')
-    )
+        edge_type = d.get('edge_type')
+        if edge_type:
+            by_edge_type[edge_type] += 1
+        edge_nature = d.get('edge_nature')
+        if edge_nature is not None:
+            confirmed_edges += 1
+            if edge_nature:
+                by_edge_nature[edge_nature] += 1
+
+    load_bearing = sum(1 for _, degree in G.out_degree(concept_nodes) if degree >= 2)
 
     return {
         'concepts':              len(concept_nodes),
-        'occurrences':           len(occ_nodes),
-        'confirmed_edges':       len(confirmed_edges),
-        'load_bearing_concepts': len(load_bearing),
+        'occurrences':           occ_count,
+        'confirmed_edges':       confirmed_edges,
+        'load_bearing_concepts': load_bearing,
         'subjects':              sorted(subjects),
-        'by_edge_type':          by_edge_type,
-        'by_edge_nature':        by_edge_nature,
+        'by_edge_type':          dict(by_edge_type),
+        'by_edge_nature':        dict(by_edge_nature),
     }
@@ -12,6 +12,41 @@ import sqlite3
 from pathlib import Path
 
 
+# 2026-10-16: Secondary indexes on occurrences. extract_stage2 drops and
+#             rebuilds these around large batch loads;
+#             migrate_add_occurrence_indexes.py recreates any that are missing.
+OCCURRENCE_INDEXES = (
+    ("idx_occurrences_concept_id", "occurrences(concept_id)"),
+    ("idx_occurrences_is_introduction", "occurrences(is_introduction)"),
+    # 2026-10-16: Backs the batch_process resume check (DISTINCT source_path)
+    ("idx_occurrences_source_path", "occurrences(source_path)"),
+    # 2026-10-16: Backs vocab_first_cleanup's noise delete by status
+    ("idx_occurrences_validation_status", "occurrences(validation_status)"),
+    # 2026-10-16: Covers the per-unit DISTINCT listing and unit lookups
+    ("idx_occurrences_unit", "occurrences(subject, year, term, unit, source_path)"),
+)
+
+
+def ensure_occurrence_indexes(conn: sqlite3.Connection) -> list[str]:
+    """
+    Create any of OCCURRENCE_INDEXES missing from the database.
+
+    Returns the names of the indexes created.
+    Created: 2026-10-16
+    """
+    existing = {
+        name for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'occurrences'"
+        )
+    }
+    created = []
+    for name, target in OCCURRENCE_INDEXES:
+        if name not in existing:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+            created.append(name)
+    return created
+
+
 def init_database():
     """Initialize the OWL Knowledge Map database with schema and indexes."""
 
@@ -35,6 +70,11 @@ def init_database():
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # 2026-10-16: WAL is persistent, so the database is created in WAL mode
+    #             and every later connection (stage 2 writes, uplink reads)
+    #             starts in it without the journal-mode switch
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Create concepts table
     cursor.execute("""
         CREATE TABLE concepts (
@@ -83,14 +123,15 @@ def init_database():
     """)
 
     # Create indexes for performance
-    cursor.execute("""
-        CREATE INDEX idx_occurrences_concept_id
-        ON occurrences(concept_id)
-    """)
+    # 2026-10-16: occurrences secondary indexes come from OCCURRENCE_INDEXES
+    for name, target in OCCURRENCE_INDEXES:
+        cursor.execute(f"CREATE INDEX {name} ON {target}")
 
+    # 2026-10-16: One vocab_first_cleanup recovery per concept, unit and slide
     cursor.execute("""
-        CREATE INDEX idx_occurrences_is_introduction
-        ON occurrences(is_introduction)
+        CREATE UNIQUE INDEX idx_occurrences_recovery_unique
+        ON occurrences(concept_id, subject, year, term, unit, IFNULL(slide_number, -1))
+        WHERE vocab_match_type = 'vocab_first_recovery'
     """)
 
     cursor.execute("""
@@ -109,7 +150,8 @@ def init_database():
 
     print(f"✓ Database initialized successfully at: {db_path}")
     print(f"✓ Created tables: concepts, occurrences, edges")
-    print(f"✓ Created 4 indexes for performance")
+    print(f"✓ Created 8 indexes for performance")
+    print(f"✓ Journal mode: WAL")
     print(f"\nVerify schema with: sqlite3 {db_path} \".schema\"")
 
 
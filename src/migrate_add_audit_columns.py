@@ -16,18 +16,21 @@ import sqlite3
 from pathlib import Path
 
 
-def column_exists(cursor: sqlite3.Cursor, table: str, column: str) -> bool:
-    cursor.execute(f"PRAGMA table_info({table})")
-    return any(row[1] == column for row in cursor.fetchall())
-
-
 def migrate(db_path: Path) -> None:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # 2026-10-16: Also moves databases created before init_db.py switched to
+    #             WAL onto it (the mode is persistent once set)
+    cursor.execute("PRAGMA journal_mode=WAL")
+
+    # 2026-10-16: Existing columns read once, not once per check
+    cursor.execute("PRAGMA table_info(occurrences)")
+    columns = {row[1] for row in cursor.fetchall()}
+
     added = []
 
-    if not column_exists(cursor, 'occurrences', 'audit_decision'):
+    if 'audit_decision' not in columns:
         cursor.execute(
             "ALTER TABLE occurrences ADD COLUMN audit_decision TEXT"
         )
@@ -36,7 +39,7 @@ def migrate(db_path: Path) -> None:
     else:
         print("  audit_decision — already exists, skipped")
 
-    if not column_exists(cursor, 'occurrences', 'audit_notes'):
+    if 'audit_notes' not in columns:
         cursor.execute(
             "ALTER TABLE occurrences ADD COLUMN audit_notes TEXT"
         )
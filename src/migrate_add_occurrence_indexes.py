@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Migration: Add occurrences indexes to older databases
+
+Creates the secondary indexes on occurrences that init_db.py now builds
+(init_db.OCCURRENCE_INDEXES), for databases created before they were added:
+source_path (batch_process resume check), validation_status
+(vocab_first_cleanup step 1) and the per-unit index (vocab_first_cleanup
+unit listing). Also restores them after a Stage 2 bulk load that was killed
+before it could rebuild the indexes it had dropped.
+
+Idempotent — safe to re-run. Only missing indexes are created.
+
+Run from project root: python src/migrate_add_occurrence_indexes.py
+
+Created: 2026-10-16
+"""
+
+import sqlite3
+from pathlib import Path
+
+from init_db import ensure_occurrence_indexes
+
+
+def migrate(db_path: Path) -> None:
+    conn = sqlite3.connect(db_path)
+
+    created = ensure_occurrence_indexes(conn)
+
+    conn.commit()
+    conn.close()
+
+    if created:
+        print(f"  Added indexes: {', '.join(created)}")
+    else:
+        print("  All occurrences indexes already exist, skipped")
+    print("Migration complete.")
+
+
+def main() -> int:
+    project_root = Path(__file__).parent.parent
+    db_path = project_root / "db" / "owl_knowledge_map.db"
+
+    if not db_path.exists():
+        print(f"ERROR: Database not found at {db_path}")
+        return 1
+
+    print(f"Migrating: {db_path}")
+    migrate(db_path)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -91,19 +91,38 @@ def migrate():
         # ---- Edges ----
         rows = sqlite_conn.execute("SELECT * FROM edges ORDER BY edge_id").fetchall()
         print(f"Migrating {len(rows)} edges...")
+        # 2026-10-16: PostgreSQL allows one edge per (from, to) pair
+        #             (idx_edges_pair_unique). SQLite does not, so a repeated
+        #             pair is folded into the first edge_id with the later
+        #             row's values, as a re-confirmation in uplink.confirm_edge
+        #             would do.
+        duplicates = 0
         for r in rows:
             pg_cursor.execute("""
                 INSERT INTO edges (
                     edge_id, from_occurrence, to_occurrence,
                     edge_type, edge_nature, confirmed_by, confirmed_date
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT (from_occurrence, to_occurrence) DO UPDATE
+                SET edge_type      = EXCLUDED.edge_type,
+                    edge_nature    = EXCLUDED.edge_nature,
+                    confirmed_by   = EXCLUDED.confirmed_by,
+                    confirmed_date = EXCLUDED.confirmed_date
+                RETURNING (xmax = 0) AS inserted
             """, (
                 r["edge_id"], r["from_occurrence"], r["to_occurrence"],
                 r["edge_type"], r["edge_nature"], r["confirmed_by"], r["confirmed_date"]
             ))
+            if not pg_cursor.fetchone()[0]:
+                duplicates += 1
+        if duplicates:
+            print(f"  Folded {duplicates} duplicate edge pairs into their first edge")
         if rows:
             pg_cursor.execute("SELECT setval('edges_edge_id_seq', (SELECT MAX(edge_id) FROM edges))")
 
+        # ---- Derived views (migration 008) ----
+        pg_cursor.execute("REFRESH MATERIALIZED VIEW concept_stats")
+
         pg_conn.commit()
         print("\n✓ Migration complete.")
 
@@ -22,6 +22,7 @@ Created: 2026-02-26
 """
 
 import argparse
+import os
 import re
 import sqlite3
 import sys
@@ -29,6 +30,7 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from extract_stage2 import tune_connection
 from vocab_validator import find_vocab_list, parse_vocab_docx
 from vocab_validator import _normalise  # noqa: PLC2701
 
@@ -50,18 +52,26 @@ def get_all_units(cursor: sqlite3.Cursor) -> list[dict]:
     ]
 
 
-def get_unit_occurrences(cursor: sqlite3.Cursor, subject, year, term, unit) -> list[dict]:
-    """Return all occurrences + concept terms for a unit. Created: 2026-02-26"""
+def get_occurrences_by_unit(cursor: sqlite3.Cursor) -> dict[tuple, list[dict]]:
+    """
+    Return all occurrences + concept terms, keyed by (subject, year, term, unit).
+
+    Created: 2026-02-26 (as get_unit_occurrences, one query per unit)
+    2026-10-16: One JOINed query for every unit, grouped in a single pass
+    """
     cursor.execute("""
-        SELECT o.occurrence_id, c.term AS concept_term, o.chapter
+        SELECT o.subject, o.year, o.term, o.unit,
+               o.occurrence_id, c.term AS concept_term, o.chapter
         FROM occurrences o
         JOIN concepts c ON o.concept_id = c.concept_id
-        WHERE o.subject=? AND o.year=? AND o.term=? AND o.unit=?
-    """, (subject, year, term, unit))
-    return [
-        {'occurrence_id': r[0], 'concept_term': r[1], 'chapter': r[2]}
-        for r in cursor.fetchall()
-    ]
+        ORDER BY o.subject, o.year, o.term, o.unit, o.occurrence_id
+    """)
+    by_unit: dict[tuple, list[dict]] = {}
+    for r in cursor:
+        by_unit.setdefault(r[:4], []).append(
+            {'occurrence_id': r[4], 'concept_term': r[5], 'chapter': r[6]}
+        )
+    return by_unit
 
 
 # =============================================================================
@@ -70,6 +80,8 @@ def get_unit_occurrences(cursor: sqlite3.Cursor, subject, year, term, unit) -> l
 
 _PAGE_RE = re.compile(r'[\t ]+Page\s+\d+\s*$', re.IGNORECASE)
 
+_UPDATE_CHAPTER_SQL = "UPDATE occurrences SET chapter=? WHERE occurrence_id=?"
+
 
 def clean_chapter_string(chapter: str | None) -> str | None:
     """
@@ -80,9 +92,14 @@ def clean_chapter_string(chapter: str | None) -> str | None:
     Returns the cleaned string, or None if input is None/empty.
 
     Created: 2026-02-26
+    2026-10-16: Strings that end in neither a digit nor whitespace cannot
+    change, so they skip the regex
     """
     if not chapter:
         return chapter
+    last = chapter[-1]
+    if not last.isdigit() and not last.isspace():
+        return chapter
     cleaned = _PAGE_RE.sub('', chapter).rstrip()
     return cleaned if cleaned else chapter
 
@@ -97,31 +114,36 @@ def pass1_clean_dirty_chapters(
     Returns count of rows updated.
 
     Created: 2026-02-26
+    2026-10-16: Updates are collected and applied with one executemany
     """
     cursor.execute("""
         SELECT occurrence_id, chapter FROM occurrences
         WHERE chapter LIKE '%Page%'
     """)
     rows = cursor.fetchall()
-    updated = 0
+    updates: list[tuple[str, int]] = []
 
     for occ_id, chapter in rows:
         cleaned = clean_chapter_string(chapter)
         if cleaned != chapter:
-            updated += 1
-            if not dry_run:
-                cursor.execute(
-                    "UPDATE occurrences SET chapter=? WHERE occurrence_id=?",
-                    (cleaned, occ_id)
-                )
+            updates.append((cleaned, occ_id))
 
-    return updated
+    if updates and not dry_run:
+        cursor.executemany(_UPDATE_CHAPTER_SQL, updates)
+
+    return len(updates)
 
 
 # =============================================================================
 # PASS 2 — FIX CHAPTER NUMBER MISMATCHES
 # =============================================================================
 
+# 2026-10-16: Chapter patterns compiled once at import
+# Leading chapter number: '1. The Roman Empire', 'Chapter 2', '3'
+_CHAPTER_NUM_RE = re.compile(r'^(?:Chapter\s+)?(\d+)', re.IGNORECASE)
+# Full chapter title of the form 'N. Title' (not a bare number)
+_NUMBERED_TITLE_RE = re.compile(r'^\d+\.')
+
 def chapter_number_from_string(chapter_str: str | None) -> str | None:
     """
     Extract leading chapter number from a chapter string.
@@ -135,41 +157,51 @@ def chapter_number_from_string(chapter_str: str | None) -> str | None:
     """
     if not chapter_str:
         return None
-    m = re.match(r'^(?:Chapter\s+)?(\d+)', chapter_str.strip(), re.IGNORECASE)
+    m = _CHAPTER_NUM_RE.match(chapter_str.strip())
     return m.group(1) if m else None
 
 
-def build_term_chapter_map(vocab_data: dict) -> dict[str, str]:
+TermChapterMaps = tuple[dict[str, str], dict[str, str]]
+
+
+def build_term_chapter_map(vocab_data: dict) -> TermChapterMaps:
     """
     Build lowercased-term → chapter_number map from parsed vocab data.
 
     Created: 2026-02-26
+    2026-10-16: Also returns a normalised-term → chapter_number map, so the
+    normalised fallback in lookup_vocab_chapter is one dict lookup. Where
+    several vocab terms normalise alike, the first (in lowercased-map order)
+    wins, matching the old linear scan.
     """
     mapping = {}
     for ch_num, ch_terms in vocab_data['chapters'].items():
         for t in ch_terms:
             mapping[t.lower()] = ch_num
-    return mapping
+
+    norm_mapping: dict[str, str] = {}
+    for vt, ch in mapping.items():
+        norm_mapping.setdefault(_normalise(vt), ch)
+
+    return mapping, norm_mapping
 
 
-def lookup_vocab_chapter(term: str, term_chapter_map: dict[str, str]) -> str | None:
+def lookup_vocab_chapter(term: str, term_chapter_map: TermChapterMaps) -> str | None:
     """
     Look up vocab chapter for a term — exact then normalised match.
 
     Created: 2026-02-26
     """
-    if term.lower() in term_chapter_map:
-        return term_chapter_map[term.lower()]
-    norm = _normalise(term)
-    for vt, ch in term_chapter_map.items():
-        if _normalise(vt) == norm:
-            return ch
-    return None
+    lower_map, norm_map = term_chapter_map
+    ch = lower_map.get(term.lower())
+    if ch is not None:
+        return ch
+    return norm_map.get(_normalise(term))
 
 
 def build_reliable_chapter_title_map(
     occurrences: list[dict],
-    term_chapter_map: dict[str, str]
+    vocab_chapters: dict[str, str | None]
 ) -> dict[str, str]:
     """
     Build chapter_number → full_chapter_title from non-conflicted occurrences.
@@ -179,6 +211,7 @@ def build_reliable_chapter_title_map(
     to look up titles for conflicted occurrences.
 
     Created: 2026-02-26
+    2026-10-16: Takes concept_term → vocab chapter, resolved once per unit
     """
     title_map: dict[str, str] = {}
 
@@ -188,14 +221,14 @@ def build_reliable_chapter_title_map(
         db_num = chapter_number_from_string(occ['chapter'])
         if not db_num:
             continue
-        vocab_num = lookup_vocab_chapter(occ['concept_term'], term_chapter_map)
+        vocab_num = vocab_chapters[occ['concept_term']]
         if not vocab_num:
             continue
         # Non-conflicted: DB chapter number == vocab chapter number
         if db_num == vocab_num and vocab_num not in title_map:
             # Use this occurrence's chapter string as the reliable title
             # Only accept strings that actually start with 'N.' (not bare numbers)
-            if re.match(r'^\d+\.', occ['chapter'].strip()):
+            if _NUMBERED_TITLE_RE.match(occ['chapter'].strip()):
                 title_map[vocab_num] = occ['chapter']
 
     return title_map
@@ -216,43 +249,69 @@ def pass2_fix_chapter_mismatches(
     Returns dict: fixed, no_vocab, fallback_to_number.
 
     Created: 2026-02-26
+    2026-10-16: Each unit's updates are applied with one executemany and
+    written back to the cached rows (a unit split across several source files
+    is visited once per file and must see its earlier fixes)
+    2026-10-16: Vocab lookup is cached per unit folder and the parsed term map
+    per vocab file, so files sharing a vocab list parse it once per run
+    2026-10-16: Occurrences for all units are fetched up front in one query
     """
     units = get_all_units(cursor)
+    # Read occurrences after Pass 1 (chapters already cleaned)
+    occurrences_by_unit = get_occurrences_by_unit(cursor)
     counts = {'fixed': 0, 'no_vocab': 0, 'fallback_to_number': 0}
 
+    # unit folder -> vocab list path; vocab list path -> term map or parse error
+    vocab_paths: dict[str, str | None] = {}
+    vocab_term_maps: dict[str, TermChapterMaps | Exception] = {}
+
     for unit_meta in units:
         source_path = unit_meta['source_path']
         if not source_path:
             counts['no_vocab'] += 1
             continue
 
-        vocab_path = find_vocab_list(source_path)
+        # find_vocab_list searches the booklet's unit folder (parent.parent)
+        unit_folder = os.path.dirname(os.path.dirname(source_path))
+        if unit_folder not in vocab_paths:
+            vocab_paths[unit_folder] = find_vocab_list(source_path)
+        vocab_path = vocab_paths[unit_folder]
         if not vocab_path:
             counts['no_vocab'] += 1
             continue
 
-        try:
-            vocab_data = parse_vocab_docx(vocab_path)
-        except Exception as e:
-            print(f"  [WARN] Vocab parse error for {unit_meta['unit']}: {e}")
+        if vocab_path not in vocab_term_maps:
+            try:
+                vocab_term_maps[vocab_path] = build_term_chapter_map(
+                    parse_vocab_docx(vocab_path)
+                )
+            except Exception as e:
+                vocab_term_maps[vocab_path] = e
+        term_chapter_map = vocab_term_maps[vocab_path]
+        if isinstance(term_chapter_map, Exception):
+            print(f"  [WARN] Vocab parse error for {unit_meta['unit']}: {term_chapter_map}")
             counts['no_vocab'] += 1
             continue
 
-        term_chapter_map = build_term_chapter_map(vocab_data)
-
-        # Read occurrences after Pass 1 (chapters already cleaned)
-        occurrences = get_unit_occurrences(
-            cursor,
-            unit_meta['subject'], unit_meta['year'],
-            unit_meta['term'], unit_meta['unit']
+        occurrences = occurrences_by_unit.get(
+            (unit_meta['subject'], unit_meta['year'],
+             unit_meta['term'], unit_meta['unit']),
+            []
         )
 
+        # Each distinct concept term is looked up once per unit
+        vocab_chapters = {
+            t: lookup_vocab_chapter(t, term_chapter_map)
+            for t in {occ['concept_term'] for occ in occurrences}
+        }
+
         # Build reliable title map from non-conflicted occurrences
-        title_map = build_reliable_chapter_title_map(occurrences, term_chapter_map)
+        title_map = build_reliable_chapter_title_map(occurrences, vocab_chapters)
+        updates: list[tuple[str, dict]] = []
 
         # Find and fix conflicted occurrences
         for occ in occurrences:
-            vocab_chapter = lookup_vocab_chapter(occ['concept_term'], term_chapter_map)
+            vocab_chapter = vocab_chapters[occ['concept_term']]
             if not vocab_chapter:
                 continue  # Term not in vocab list; skip
 
@@ -284,11 +343,17 @@ def pass2_fix_chapter_mismatches(
                 )
 
             counts['fixed'] += 1
-            if not dry_run:
-                cursor.execute(
-                    "UPDATE occurrences SET chapter=? WHERE occurrence_id=?",
-                    (correct_title, occ['occurrence_id'])
-                )
+            updates.append((correct_title, occ))
+
+        if updates and not dry_run:
+            cursor.executemany(
+                _UPDATE_CHAPTER_SQL,
+                [(title, occ['occurrence_id']) for title, occ in updates]
+            )
+            # Keep the cached rows in step with the database for the unit's
+            # next source file
+            for title, occ in updates:
+                occ['chapter'] = title
 
     return counts
 
@@ -319,6 +384,7 @@ def main() -> int:
         print()
 
     conn = sqlite3.connect(db_path)
+    tune_connection(conn)
     cursor = conn.cursor()
 
     # ------------------------------------------------------------------
@@ -21,11 +21,29 @@ Originally created: 2026-02-26
 
 import logging
 import os
+import sys
+import threading
+import time
+from datetime import date
 from pathlib import Path
 
+import anvil.media
 import anvil.server
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+# 2026-10-16: Graph dependencies imported once at startup. The audit and
+#             corpus functions work without them; graph functions check
+#             _HAS_GRAPH (graph_builder itself imports networkx).
+try:
+    import networkx as nx
+    import plotly.graph_objects as go
+    from graph_builder import get_candidate_edges
+    _HAS_GRAPH = True
+except ImportError:
+    _HAS_GRAPH = False
 
 # =============================================================================
 # CONFIGURATION
@@ -36,6 +54,21 @@ PG_CONN_STRING = os.environ.get(
     "dbname=owl user=htmadmin password=dev host=localhost port=5432"
 )
 
+# 2026-10-16: Per-click review writes (save_audit_decision, confirm_edge)
+#             commit without waiting for their WAL flush; PostgreSQL's WAL
+#             writer flushes them in batches. A server crash can lose the
+#             last fraction of a second of clicks but never corrupts data,
+#             and a lost click is simply made again.
+_ASYNC_COMMIT_SQL = "SET LOCAL synchronous_commit = off"
+
+# 2026-10-16: Connections are pooled across calls; uplink calls run on
+#             worker threads, so allow a few concurrent connections
+DB_POOL_MIN = 1
+DB_POOL_MAX = 8
+# 2026-10-16: Seconds a call waits for a free pooled connection when all
+#             DB_POOL_MAX are checked out, before giving up
+DB_POOL_WAIT = 30
+
 # Uplink key — set via environment variable or replace the fallback string
 UPLINK_KEY = os.environ.get("ANVIL_UPLINK_KEY", "YOUR_UPLINK_KEY_HERE")
 
@@ -51,26 +84,123 @@ log = logging.getLogger(__name__)
 # DATABASE HELPERS
 # =============================================================================
 
+class PreparingConnection(psycopg2.extensions.connection):
+    """
+    Connection that remembers the server-side prepared statements it holds.
+
+    Created: 2026-10-16
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
+
+_pool: ThreadedConnectionPool | None = None
+_pool_lock = threading.Lock()
+# 2026-10-16: One slot per pooled connection; ThreadedConnectionPool.getconn()
+#             raises PoolError when exhausted instead of waiting
+_pool_slots = threading.BoundedSemaphore(DB_POOL_MAX)
+
+
 def get_conn() -> psycopg2.extensions.connection:
-    """Open a read/write connection with RealDictCursor as default cursor."""
-    conn = psycopg2.connect(PG_CONN_STRING)
-    return conn
+    """
+    Take a read/write connection from the pool. Return it with put_conn().
+
+    2026-10-16: Pooled instead of a new connection per call
+    2026-10-16: Waits up to DB_POOL_WAIT seconds for a free connection when
+    the pool is exhausted
+    """
+    global _pool
+    if not _pool_slots.acquire(timeout=DB_POOL_WAIT):
+        raise PoolError(
+            f"no database connection free after {DB_POOL_WAIT}s "
+            f"({DB_POOL_MAX} in use)"
+        )
+    try:
+        if _pool is None:
+            with _pool_lock:
+                if _pool is None:
+                    _pool = ThreadedConnectionPool(
+                        DB_POOL_MIN, DB_POOL_MAX, PG_CONN_STRING,
+                        connection_factory=PreparingConnection
+                    )
+        return _pool.getconn()
+    except BaseException:
+        _pool_slots.release()
+        raise
+
+
+def put_conn(conn: psycopg2.extensions.connection) -> None:
+    """
+    Return a connection to the pool, ending any open transaction.
+
+    Connections that fail the rollback are closed rather than reused.
+    Created: 2026-10-16
+    """
+    try:
+        conn.rollback()
+        broken = False
+    except psycopg2.Error:
+        broken = True
+    try:
+        _pool.putconn(conn, close=broken or bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+
+def execute_prepared(cursor, name: str, sql: str, params: tuple) -> None:
+    """
+    Run sql ($1, $2, ... placeholders) as a named server-side prepared statement.
+
+    The statement is PREPAREd the first time its connection runs `name`, so
+    repeat calls on a pooled connection skip parsing and planning.
+    Created: 2026-10-16
+    """
+    conn = cursor.connection
+    if name not in conn.prepared:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        conn.prepared.add(name)
+    cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+
 
+# 2026-10-16: Callables use plain tuple cursors and these helpers zip rows
+#             with the column names once, instead of building a RealDictRow
+#             per row and then copying it into a dict.
 
 def fetchall(cursor) -> list[dict]:
     """Return all rows as plain dicts."""
-    return [dict(r) for r in cursor.fetchall()]
+    cols = [d[0] for d in cursor.description]
+    return [dict(zip(cols, r)) for r in cursor.fetchall()]
 
 
 def fetchone(cursor) -> dict | None:
     """Return one row as a plain dict, or None."""
     row = cursor.fetchone()
-    return dict(row) if row else None
+    return dict(zip([d[0] for d in cursor.description], row)) if row else None
+
+
+def refresh_concept_stats(cursor) -> None:
+    """
+    Recompute the concept_stats materialised view (migration 008).
+
+    Call after any change to confirmed occurrences. Created: 2026-10-16
+    """
+    cursor.execute("REFRESH MATERIALIZED VIEW concept_stats")
 
 
 # Issue types that appear in the audit queue — mirrors audit_terms.py categories
 AUDIT_ISSUE_TYPES = ('missed_from_extraction', 'potential_noise', 'high_priority_review')
 
+# 2026-10-16: Review-queue sort key. occurrence_id breaks ties so the order is
+#             total and a page can resume strictly after its last row.
+_AUDIT_QUEUE_KEY = "o.subject, o.year, o.term, o.unit, c.term, o.occurrence_id"
+_AUDIT_QUEUE_KEY_DESC = ", ".join(f"{col} DESC" for col in _AUDIT_QUEUE_KEY.split(", "))
+
+_AUDIT_QUEUE_FILTER = (
+    "(o.needs_review = 1 OR o.validation_status IN ('potential_noise', 'high_priority_review'))"
+)
+
 
 # =============================================================================
 # PHASE A — AUDIT REVIEW FUNCTIONS
@@ -83,7 +213,8 @@ def get_audit_queue(
     term: str = None,
     issue_type: str = None,
     page: int = 0,
-    page_size: int = 50
+    page_size: int = 50,
+    after: list = None
 ) -> dict:
     """
     Return a paginated list of occurrences requiring review.
@@ -93,14 +224,20 @@ def get_audit_queue(
       - validation_status IN ('potential_noise', 'high_priority_review')
 
     Filters: subject, year, term (curriculum period), issue_type.
-    Returns dict with keys: rows (list of dicts), total, page, page_size.
+    Returns dict with keys: rows (list of dicts), total, page, page_size,
+    next_cursor.
+
+    2026-10-16: Pass the previous call's next_cursor as `after` to fetch the
+    page following it with an index seek instead of OFFSET (page is then
+    ignored). total is only counted on calls without `after` and is None
+    otherwise; next_cursor is None once the queue is exhausted.
+    2026-10-16: total comes from COUNT(*) OVER () on the page query; the
+    separate COUNT only runs when an OFFSET page comes back empty.
     """
     conditions = []
     params: list = []
 
-    conditions.append(
-        "(o.needs_review = 1 OR o.validation_status IN ('potential_noise', 'high_priority_review'))"
-    )
+    conditions.append(_AUDIT_QUEUE_FILTER)
 
     if subject:
         conditions.append("o.subject = %s")
@@ -122,6 +259,11 @@ def get_audit_queue(
             )
 
     where_clause = " AND ".join(conditions)
+    page_where = where_clause
+    page_params = list(params)
+    if after:
+        page_where += f" AND ({_AUDIT_QUEUE_KEY}) > (%s, %s, %s, %s, %s, %s)"
+        page_params += list(after)
 
     count_sql = f"""
         SELECT COUNT(*) FROM occurrences o
@@ -147,52 +289,79 @@ def get_audit_queue(
             o.vocab_match_type,
             o.vocab_source,
             o.audit_decision,
-            o.audit_notes
+            o.audit_notes{'' if after else ", COUNT(*) OVER () AS _total"}
         FROM occurrences o
         JOIN concepts c ON o.concept_id = c.concept_id
-        WHERE {where_clause}
-        ORDER BY o.subject, o.year, o.term, o.unit, c.term
+        WHERE {page_where}
+        ORDER BY {_AUDIT_QUEUE_KEY}
         LIMIT %s OFFSET %s
     """
+    offset = 0 if after else page * page_size
 
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(count_sql, params)
-            total = cursor.fetchone()["count"]
-            cursor.execute(select_sql, params + [page_size, page * page_size])
+        with conn.cursor() as cursor:
+            cursor.execute(select_sql, page_params + [page_size, offset])
             rows = fetchall(cursor)
+            total = None
+            if rows and not after:
+                total = rows[0]['_total']
+                for r in rows:
+                    del r['_total']
+            elif not after:
+                # Empty page: the window total is unavailable past the end
+                total = 0
+                if offset:
+                    cursor.execute(count_sql, params)
+                    total = cursor.fetchone()[0]
     finally:
-        conn.close()
+        put_conn(conn)
+
+    next_cursor = None
+    if len(rows) == page_size:
+        last = rows[-1]
+        next_cursor = [
+            last['subject'], last['year'], last['term_period'],
+            last['unit'], last['term'], last['occurrence_id'],
+        ]
 
-    log.info("get_audit_queue: returned %d/%d rows (page %d)", len(rows), total, page)
-    return {"rows": rows, "total": total, "page": page, "page_size": page_size}
+    log.info("get_audit_queue: returned %d/%s rows (page %d)", len(rows), total, page)
+    return {
+        "rows": rows, "total": total, "page": page, "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
 
 
 @anvil.server.callable
 def get_audit_stats() -> dict:
-    """Return summary counts for the audit queue."""
+    """
+    Return summary counts for the audit queue.
+
+    2026-10-16: Aggregate FILTERs instead of CASE; every column read is in
+    the covering review-queue index (migration 009), so this is an
+    index-only scan of the queue rows
+    """
     sql = """
         SELECT
-            COUNT(*)                                                        AS total_issues,
-            COUNT(CASE WHEN audit_decision IS NOT NULL THEN 1 END)          AS reviewed,
-            COUNT(CASE WHEN audit_decision IS NULL THEN 1 END)              AS pending,
-            COUNT(CASE WHEN validation_status = 'potential_noise' THEN 1 END)      AS potential_noise,
-            COUNT(CASE WHEN validation_status = 'high_priority_review' THEN 1 END) AS high_priority_review,
-            COUNT(CASE WHEN needs_review = 1
-                        AND validation_status NOT IN ('potential_noise', 'high_priority_review')
-                        THEN 1 END)                                         AS missed_from_extraction
+            COUNT(*)                                                           AS total_issues,
+            COUNT(*) FILTER (WHERE audit_decision IS NOT NULL)                 AS reviewed,
+            COUNT(*) FILTER (WHERE audit_decision IS NULL)                     AS pending,
+            COUNT(*) FILTER (WHERE validation_status = 'potential_noise')      AS potential_noise,
+            COUNT(*) FILTER (WHERE validation_status = 'high_priority_review') AS high_priority_review,
+            COUNT(*) FILTER (WHERE needs_review = 1
+                               AND validation_status NOT IN ('potential_noise', 'high_priority_review'))
+                                                                               AS missed_from_extraction
         FROM occurrences
         WHERE needs_review = 1
            OR validation_status IN ('potential_noise', 'high_priority_review')
     """
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        with conn.cursor() as cursor:
             cursor.execute(sql)
             row = fetchone(cursor)
     finally:
-        conn.close()
+        put_conn(conn)
 
     log.info("get_audit_stats: total=%s reviewed=%s pending=%s",
              row['total_issues'], row['reviewed'], row['pending'])
@@ -201,7 +370,11 @@ def get_audit_stats() -> dict:
 
 @anvil.server.callable
 def get_term_detail(occurrence_id: int) -> dict | None:
-    """Return full occurrence record + concept term for a single occurrence."""
+    """
+    Return full occurrence record + concept term for a single occurrence.
+
+    2026-10-16: Runs as a prepared statement
+    """
     sql = """
         SELECT
             o.occurrence_id,
@@ -227,15 +400,15 @@ def get_term_detail(occurrence_id: int) -> dict | None:
             o.source_path
         FROM occurrences o
         JOIN concepts c ON o.concept_id = c.concept_id
-        WHERE o.occurrence_id = %s
+        WHERE o.occurrence_id = $1
     """
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(sql, (occurrence_id,))
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, 'term_detail', sql, (occurrence_id,))
             row = fetchone(cursor)
     finally:
-        conn.close()
+        put_conn(conn)
 
     if not row:
         log.warning("get_term_detail: occurrence_id %d not found", occurrence_id)
@@ -249,6 +422,10 @@ def save_audit_decision(occurrence_id: int, decision: str, notes: str = None) ->
 
     Valid decisions: 'keep', 'delete', 'add', 'skip'.
     Passing decision=None clears the decision (marks as unreviewed).
+
+    2026-10-16: One prepared UPDATE ... RETURNING; no row back means the
+    occurrence does not exist
+    2026-10-16: Commits asynchronously (see _ASYNC_COMMIT_SQL)
     """
     valid_decisions = {'keep', 'delete', 'add', 'skip', None}
     if decision not in valid_decisions:
@@ -257,20 +434,18 @@ def save_audit_decision(occurrence_id: int, decision: str, notes: str = None) ->
     conn = get_conn()
     try:
         with conn.cursor() as cursor:
-            cursor.execute(
-                "SELECT occurrence_id FROM occurrences WHERE occurrence_id = %s",
-                (occurrence_id,)
+            cursor.execute(_ASYNC_COMMIT_SQL)
+            execute_prepared(
+                cursor, 'save_audit_decision',
+                "UPDATE occurrences SET audit_decision = $1, audit_notes = $2"
+                " WHERE occurrence_id = $3 RETURNING occurrence_id",
+                (decision, notes, occurrence_id)
             )
             if not cursor.fetchone():
                 return {'ok': False, 'message': f"Occurrence {occurrence_id} not found."}
-
-            cursor.execute(
-                "UPDATE occurrences SET audit_decision = %s, audit_notes = %s WHERE occurrence_id = %s",
-                (decision, notes, occurrence_id)
-            )
         conn.commit()
     finally:
-        conn.close()
+        put_conn(conn)
 
     log.info("save_audit_decision: occurrence_id=%d decision=%s", occurrence_id, decision)
     return {'ok': True, 'message': f"Decision '{decision}' saved for occurrence {occurrence_id}."}
@@ -286,52 +461,66 @@ def apply_pending_decisions() -> dict:
       'delete' → DELETE occurrence; clean orphan concepts
       'add'    → not applicable here; logged as skipped
       'skip'   → no action
+
+    2026-10-16: Keeps and deletes are each applied as one statement, selecting
+    rows by audit_decision in the same transaction (no id round-trip, and no
+    decision can change between read and write). A failure rolls the whole
+    run back and is counted in errors.
+    2026-10-16: Orphan cleanup only checks the concepts of deleted rows
     """
     conn = get_conn()
     counts = {'deleted': 0, 'kept': 0, 'skipped': 0, 'errors': 0, 'orphans_cleaned': 0}
 
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute("""
-                SELECT o.occurrence_id, o.audit_decision
-                FROM occurrences o
-                WHERE o.audit_decision IS NOT NULL
-            """)
-            rows = fetchall(cursor)
-
         with conn.cursor() as cursor:
-            for row in rows:
-                occ_id = row['occurrence_id']
-                decision = row['audit_decision']
-                try:
-                    if decision == 'keep':
-                        cursor.execute(
-                            "UPDATE occurrences SET validation_status = 'confirmed' WHERE occurrence_id = %s",
-                            (occ_id,)
-                        )
-                        counts['kept'] += 1
-                    elif decision == 'delete':
-                        cursor.execute(
-                            "DELETE FROM occurrences WHERE occurrence_id = %s",
-                            (occ_id,)
-                        )
-                        counts['deleted'] += 1
-                    elif decision in ('skip', 'add'):
-                        counts['skipped'] += 1
-                except Exception as e:
-                    counts['errors'] += 1
-                    log.error("apply_pending_decisions: error on occurrence_id=%d: %s", occ_id, e)
-
-            if counts['deleted'] > 0:
-                cursor.execute("""
-                    DELETE FROM concepts
-                    WHERE concept_id NOT IN (SELECT DISTINCT concept_id FROM occurrences)
-                """)
-                counts['orphans_cleaned'] = cursor.rowcount
+            try:
+                cursor.execute(
+                    "SELECT COUNT(*) FROM occurrences WHERE audit_decision IN ('skip', 'add')"
+                )
+                counts['skipped'] = cursor.fetchone()[0]
+
+                cursor.execute(
+                    "UPDATE occurrences SET validation_status = 'confirmed' WHERE audit_decision = 'keep'"
+                )
+                counts['kept'] = cursor.rowcount
+
+                cursor.execute(
+                    "DELETE FROM occurrences WHERE audit_decision = 'delete' RETURNING concept_id"
+                )
+                deleted_rows = cursor.fetchall()
+                counts['deleted'] = len(deleted_rows)
+                deleted_concepts = list({r[0] for r in deleted_rows if r[0] is not None})
+
+                # Only concepts that just lost an occurrence can have become
+                # orphans; probe each one instead of scanning all occurrences
+                if deleted_concepts:
+                    cursor.execute("""
+                        DELETE FROM concepts c
+                        WHERE c.concept_id = ANY(%s)
+                          AND NOT EXISTS (
+                              SELECT 1 FROM occurrences o WHERE o.concept_id = c.concept_id
+                          )
+                    """, (deleted_concepts,))
+                    counts['orphans_cleaned'] = cursor.rowcount
+
+                if counts['kept'] or counts['deleted']:
+                    refresh_concept_stats(cursor)
+            except Exception as e:
+                # The transaction is aborted; nothing from this run is applied
+                conn.rollback()
+                log.error("apply_pending_decisions: batch failed, rolled back: %s", e)
+                cursor.execute(
+                    "SELECT COUNT(*) FROM occurrences WHERE audit_decision IN ('keep', 'delete')"
+                )
+                counts.update(kept=0, deleted=0, orphans_cleaned=0,
+                              errors=cursor.fetchone()[0])
 
         conn.commit()
     finally:
-        conn.close()
+        put_conn(conn)
+
+    if counts['kept'] or counts['deleted']:
+        _invalidate_candidates()
 
     log.info(
         "apply_pending_decisions: deleted=%d kept=%d skipped=%d orphans=%d errors=%d",
@@ -347,48 +536,67 @@ def apply_pending_decisions() -> dict:
 
 @anvil.server.callable
 def get_adjacent_occurrence_ids(occurrence_id: int) -> dict:
-    """Return prev/next occurrence_ids in the review queue for navigation."""
-    sql = """
-        SELECT o.occurrence_id FROM occurrences o
-        JOIN concepts c ON o.concept_id = c.concept_id
-        WHERE o.needs_review = 1
-           OR o.validation_status IN ('potential_noise', 'high_priority_review')
-        ORDER BY o.subject, o.year, o.term, o.unit, c.term
+    """
+    Return prev/next occurrence_ids in the review queue for navigation.
+
+    2026-10-16: Seeks one row either side of the anchor's queue position
+    instead of fetching the whole queue
+    """
+    sql = f"""
+        WITH anchor AS (
+            SELECT o.subject, o.year, o.term, o.unit, c.term AS concept_term, o.occurrence_id
+            FROM occurrences o
+            JOIN concepts c ON o.concept_id = c.concept_id
+            WHERE o.occurrence_id = %s AND {_AUDIT_QUEUE_FILTER}
+        )
+        SELECT
+            (SELECT o.occurrence_id FROM occurrences o
+             JOIN concepts c ON o.concept_id = c.concept_id
+             WHERE {_AUDIT_QUEUE_FILTER}
+               AND ({_AUDIT_QUEUE_KEY}) < (a.subject, a.year, a.term, a.unit, a.concept_term, a.occurrence_id)
+             ORDER BY {_AUDIT_QUEUE_KEY_DESC}
+             LIMIT 1) AS prev,
+            (SELECT o.occurrence_id FROM occurrences o
+             JOIN concepts c ON o.concept_id = c.concept_id
+             WHERE {_AUDIT_QUEUE_FILTER}
+               AND ({_AUDIT_QUEUE_KEY}) > (a.subject, a.year, a.term, a.unit, a.concept_term, a.occurrence_id)
+             ORDER BY {_AUDIT_QUEUE_KEY}
+             LIMIT 1) AS next
+        FROM anchor a
     """
     conn = get_conn()
     try:
         with conn.cursor() as cursor:
-            cursor.execute(sql)
-            ids = [r[0] for r in cursor.fetchall()]
+            cursor.execute(sql, (occurrence_id,))
+            row = cursor.fetchone()
     finally:
-        conn.close()
+        put_conn(conn)
 
-    if occurrence_id not in ids:
+    if not row:
         return {'prev': None, 'next': None}
 
-    idx = ids.index(occurrence_id)
-    return {
-        'prev': ids[idx - 1] if idx > 0 else None,
-        'next': ids[idx + 1] if idx < len(ids) - 1 else None
-    }
+    return {'prev': row[0], 'next': row[1]}
 
 
 @anvil.server.callable
 def get_filter_options() -> dict:
-    """Return distinct values for filter dropdowns: subjects, years, terms."""
+    """
+    Return distinct values for filter dropdowns: subjects, years, terms.
+
+    2026-10-16: All three lists come back as arrays from one statement
+    """
     conn = get_conn()
     try:
         with conn.cursor() as cursor:
-            cursor.execute("SELECT DISTINCT subject FROM occurrences ORDER BY subject")
-            subjects = [r[0] for r in cursor.fetchall()]
-
-            cursor.execute("SELECT DISTINCT year FROM occurrences ORDER BY year")
-            years = [r[0] for r in cursor.fetchall()]
-
-            cursor.execute("SELECT DISTINCT term FROM occurrences ORDER BY term")
-            terms = [r[0] for r in cursor.fetchall()]
+            cursor.execute("""
+                SELECT
+                    ARRAY(SELECT DISTINCT subject FROM occurrences ORDER BY subject),
+                    ARRAY(SELECT DISTINCT year FROM occurrences ORDER BY year),
+                    ARRAY(SELECT DISTINCT term FROM occurrences ORDER BY term)
+            """)
+            subjects, years, terms = cursor.fetchone()
     finally:
-        conn.close()
+        put_conn(conn)
 
     return {
         'subjects': subjects,
@@ -424,7 +632,7 @@ def get_dashboard_stats() -> dict:
             by_subject = {r[0]: r[1] for r in cursor.fetchall()}
             occurrences = sum(by_subject.values())
     finally:
-        conn.close()
+        put_conn(conn)
 
     log.info("get_dashboard_stats: concepts=%d occurrences=%d confirmed_edges=%d",
              concepts, occurrences, confirmed_edges)
@@ -460,7 +668,7 @@ def get_words_per_year() -> dict:
             """)
             rows = cursor.fetchall()
     finally:
-        conn.close()
+        put_conn(conn)
 
     result = {}
     totals = {3: 0, 4: 0, 5: 0, 6: 0}
@@ -485,7 +693,11 @@ def get_corpus(
     page: int = 0,
     page_size: int = 50
 ) -> dict:
-    """Return a paginated list of all confirmed occurrences for the corpus browser."""
+    """
+    Return a paginated list of all confirmed occurrences for the corpus browser.
+
+    2026-10-16: Curriculum order via the term_ordinal column (migration 011)
+    """
     conditions = ["o.validation_status = 'confirmed'"]
     params: list = []
 
@@ -526,25 +738,19 @@ def get_corpus(
         FROM occurrences o
         JOIN concepts c ON o.concept_id = c.concept_id
         WHERE {where}
-        ORDER BY o.year,
-                 CASE o.term
-                     WHEN 'Autumn1' THEN 1 WHEN 'Autumn2' THEN 2
-                     WHEN 'Spring1' THEN 3 WHEN 'Spring2' THEN 4
-                     WHEN 'Summer1' THEN 5 WHEN 'Summer2' THEN 6
-                     ELSE 7 END,
-                 o.subject, c.term
+        ORDER BY o.year, o.term_ordinal, o.subject, c.term
         LIMIT %s OFFSET %s
     """
 
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        with conn.cursor() as cursor:
             cursor.execute(count_sql, params)
-            total = cursor.fetchone()["count"]
+            total = cursor.fetchone()[0]
             cursor.execute(select_sql, params + [page_size, page * page_size])
             rows = fetchall(cursor)
     finally:
-        conn.close()
+        put_conn(conn)
 
     log.info("get_corpus: returned %d/%d rows (page %d)", len(rows), total, page)
     return {"rows": rows, "total": total, "page": page, "page_size": page_size}
@@ -562,54 +768,63 @@ def get_graph_figure(
     edge_type: str = None
 ) -> dict:
     """Build a Plotly network graph figure from concepts + occurrences + edges."""
-    try:
-        import networkx as nx
-        import plotly.graph_objects as go
-    except ImportError:
+    if not _HAS_GRAPH:
         log.error("get_graph_figure: networkx or plotly not installed")
         return {}
 
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            node_sql = """
-                SELECT c.concept_id, c.term, c.subject_area, COUNT(o.occurrence_id) AS occ_count
-                FROM concepts c
-                JOIN occurrences o ON c.concept_id = o.concept_id
-                WHERE 1=1
-            """
+        with conn.cursor() as cursor:
+            node_where = "1=1"
             node_params: list = []
             if subject:
-                node_sql += " AND o.subject = %s"
+                node_where += " AND o.subject = %s"
                 node_params.append(subject)
             if year_from is not None:
-                node_sql += " AND o.year >= %s"
+                node_where += " AND o.year >= %s"
                 node_params.append(int(year_from))
             if year_to is not None:
-                node_sql += " AND o.year <= %s"
+                node_where += " AND o.year <= %s"
                 node_params.append(int(year_to))
-            node_sql += " GROUP BY c.concept_id"
 
+            node_sql = f"""
+                SELECT c.concept_id, c.term, c.subject_area, COUNT(o.occurrence_id) AS occ_count
+                FROM concepts c
+                JOIN occurrences o ON c.concept_id = o.concept_id
+                WHERE {node_where}
+                GROUP BY c.concept_id
+            """
             cursor.execute(node_sql, node_params)
             nodes = fetchall(cursor)
 
-            edge_sql = """
-                SELECT e.from_occurrence, e.to_occurrence, e.edge_type, e.edge_nature,
+            # 2026-10-16: Only edges between two displayed concepts are
+            #             returned (semi-join on the node filter)
+            edge_sql = f"""
+                WITH nodes AS (
+                    SELECT DISTINCT c.concept_id
+                    FROM concepts c
+                    JOIN occurrences o ON c.concept_id = o.concept_id
+                    WHERE {node_where}
+                )
+                SELECT e.edge_type, e.edge_nature,
                        ofrom.concept_id AS from_concept, oto.concept_id AS to_concept
                 FROM edges e
                 JOIN occurrences ofrom ON e.from_occurrence = ofrom.occurrence_id
                 JOIN occurrences oto ON e.to_occurrence = oto.occurrence_id
+                JOIN nodes nf ON nf.concept_id = ofrom.concept_id
+                JOIN nodes nt ON nt.concept_id = oto.concept_id
                 WHERE e.confirmed_by IS NOT NULL
             """
-            edge_params: list = []
+            edge_params = list(node_params)
             if edge_type:
                 edge_sql += " AND e.edge_type = %s"
                 edge_params.append(edge_type)
+            edge_sql += " ORDER BY e.edge_id"
 
             cursor.execute(edge_sql, edge_params)
             edges = fetchall(cursor)
     finally:
-        conn.close()
+        put_conn(conn)
 
     if not nodes:
         return {}
@@ -617,15 +832,13 @@ def get_graph_figure(
     G = nx.DiGraph()
     subject_colours = {'History': '#3B82F6', 'Geography': '#22C55E', 'Religion': '#EF4444'}
 
-    node_ids = {n['concept_id'] for n in nodes}
     for n in nodes:
         G.add_node(n['concept_id'], term=n['term'], subject_area=n['subject_area'],
                    occ_count=n['occ_count'])
 
     for e in edges:
-        if e['from_concept'] in node_ids and e['to_concept'] in node_ids:
-            G.add_edge(e['from_concept'], e['to_concept'],
-                       edge_type=e['edge_type'], edge_nature=e['edge_nature'])
+        G.add_edge(e['from_concept'], e['to_concept'],
+                   edge_type=e['edge_type'], edge_nature=e['edge_nature'])
 
     if len(G.nodes) == 0:
         return {}
@@ -634,26 +847,37 @@ def get_graph_figure(
 
     edge_x, edge_y = [], []
     for u, v in G.edges():
-        x0, y0 = pos[u]; x1, y1 = pos[v]
-        edge_x += [x0, x1, None]
-        edge_y += [y0, y1, None]
+        (x0, y0), (x1, y1) = pos[u], pos[v]
+        edge_x.extend((x0, x1, None))
+        edge_y.extend((y0, y1, None))
 
     edge_trace = go.Scatter(
         x=edge_x, y=edge_y, mode='lines',
         line=dict(width=1, color='#888'), hoverinfo='none'
     )
 
+    # 2026-10-16: Nodes bucketed by subject in one pass, and each subject's
+    #             trace columns filled in one loop (every node is in G)
+    nodes_by_subject: dict[str, list[dict]] = {subj: [] for subj in subject_colours}
+    for n in nodes:
+        bucket = nodes_by_subject.get(n.get('subject_area'))
+        if bucket is not None:
+            bucket.append(n)
+
     node_traces = []
     for subj, colour in subject_colours.items():
-        subj_nodes = [n for n in nodes if n.get('subject_area') == subj and n['concept_id'] in G.nodes]
+        subj_nodes = nodes_by_subject[subj]
         if not subj_nodes:
             continue
-        nx_vals = [pos[n['concept_id']][0] for n in subj_nodes]
-        ny_vals = [pos[n['concept_id']][1] for n in subj_nodes]
-        sizes = [max(8, min(30, n['occ_count'] * 3)) for n in subj_nodes]
-        texts = [n['term'] for n in subj_nodes]
-        hover = [f"{n['term']}<br>{subj}<br>{n['occ_count']} occurrences" for n in subj_nodes]
-        cids = [n['concept_id'] for n in subj_nodes]
+        nx_vals, ny_vals, sizes, texts, hover, cids = [], [], [], [], [], []
+        for n in subj_nodes:
+            x, y = pos[n['concept_id']]
+            nx_vals.append(x)
+            ny_vals.append(y)
+            sizes.append(max(8, min(30, n['occ_count'] * 3)))
+            texts.append(n['term'])
+            hover.append(f"{n['term']}<br>{subj}<br>{n['occ_count']} occurrences")
+            cids.append(n['concept_id'])
 
         node_traces.append(go.Scatter(
             x=nx_vals, y=ny_vals, mode='markers+text',
@@ -682,10 +906,15 @@ def get_graph_figure(
 
 @anvil.server.callable
 def get_concept_detail(concept_id: int) -> dict | None:
-    """Return concept + all occurrences + all confirmed edges for a concept."""
+    """
+    Return concept + all occurrences + all confirmed edges for a concept.
+
+    2026-10-16: Occurrences read in curriculum order from
+    idx_occurrences_curriculum (migration 011)
+    """
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        with conn.cursor() as cursor:
             cursor.execute("SELECT * FROM concepts WHERE concept_id = %s", (concept_id,))
             concept = fetchone(cursor)
             if not concept:
@@ -695,67 +924,138 @@ def get_concept_detail(concept_id: int) -> dict | None:
                 SELECT o.*
                 FROM occurrences o
                 WHERE o.concept_id = %s
-                ORDER BY o.year,
-                         CASE o.term
-                             WHEN 'Autumn1' THEN 1 WHEN 'Autumn2' THEN 2
-                             WHEN 'Spring1' THEN 3 WHEN 'Spring2' THEN 4
-                             WHEN 'Summer1' THEN 5 WHEN 'Summer2' THEN 6
-                             ELSE 7 END,
-                         o.slide_number
+                ORDER BY o.year, o.term_ordinal, o.slide_number
             """, (concept_id,))
             occurrences = fetchall(cursor)
 
-            occ_ids = [o['occurrence_id'] for o in occurrences]
-            if occ_ids:
+            if occurrences:
+                # 2026-10-16: One index-driven branch per edge end instead of
+                #             an OR over both; UNION keeps each edge once
                 cursor.execute("""
+                    WITH occ AS (
+                        SELECT occurrence_id FROM occurrences WHERE concept_id = %s
+                    ),
+                    matched AS (
+                        SELECT e.edge_id FROM edges e
+                        JOIN occ ON e.from_occurrence = occ.occurrence_id
+                        UNION
+                        SELECT e.edge_id FROM edges e
+                        JOIN occ ON e.to_occurrence = occ.occurrence_id
+                    )
                     SELECT e.*, c_from.term AS from_term, c_to.term AS to_term,
                            ofrom.year AS from_year, ofrom.term AS from_term_period, ofrom.unit AS from_unit,
                            oto.year AS to_year, oto.term AS to_term_period, oto.unit AS to_unit
-                    FROM edges e
+                    FROM matched m
+                    JOIN edges e ON e.edge_id = m.edge_id
                     JOIN occurrences ofrom ON e.from_occurrence = ofrom.occurrence_id
                     JOIN occurrences oto ON e.to_occurrence = oto.occurrence_id
                     JOIN concepts c_from ON ofrom.concept_id = c_from.concept_id
                     JOIN concepts c_to ON oto.concept_id = c_to.concept_id
-                    WHERE e.from_occurrence = ANY(%s)
-                       OR e.to_occurrence = ANY(%s)
-                """, (occ_ids, occ_ids))
+                    ORDER BY e.edge_id
+                """, (concept_id,))
                 edges = fetchall(cursor)
             else:
                 edges = []
     finally:
-        conn.close()
+        put_conn(conn)
 
     return {'concept': concept, 'occurrences': occurrences, 'edges': edges}
 
 
 @anvil.server.callable
 def get_load_bearing_concepts(min_occurrences: int = 2) -> list[dict]:
-    """Return concepts with min_occurrences or more, sorted by occurrence count."""
+    """
+    Return concepts with min_occurrences or more, sorted by occurrence count.
+
+    2026-10-16: Reads the precomputed concept_stats view instead of
+    aggregating confirmed occurrences per call
+    """
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+        with conn.cursor() as cursor:
             cursor.execute("""
                 SELECT c.concept_id, c.term, c.subject_area,
-                       COUNT(*) AS occ_count,
-                       STRING_AGG(DISTINCT o.subject, ',')  AS subjects,
-                       MIN(o.year) AS first_year,
-                       MAX(o.year) AS last_year
-                FROM concepts c
-                JOIN occurrences o ON c.concept_id = o.concept_id
-                WHERE o.validation_status = 'confirmed'
-                GROUP BY c.concept_id
-                HAVING COUNT(*) >= %s
-                ORDER BY occ_count DESC, c.term
+                       s.occ_count, s.subjects, s.first_year, s.last_year
+                FROM concept_stats s
+                JOIN concepts c ON c.concept_id = s.concept_id
+                WHERE s.occ_count >= %s
+                ORDER BY s.occ_count DESC, c.term
             """, (min_occurrences,))
             rows = fetchall(cursor)
     finally:
-        conn.close()
+        put_conn(conn)
 
     log.info("get_load_bearing_concepts: %d concepts with >= %d occurrences",
              len(rows), min_occurrences)
     return rows
 
 
+# 2026-10-16: get_candidate_edges() rebuilds every candidate from the full
+#             confirmed set, so its result is kept for CANDIDATE_CACHE_TTL
+#             seconds, with the filtered list for each filter combination
+#             alongside. confirm_edge swaps in rows with the pair marked
+#             confirmed; apply_pending_decisions drops them. The TTL bounds
+#             staleness from writes made outside the uplink.
+#             Uplink calls run on their own threads: the cache is one
+#             (loaded_at, rows, filtered) snapshot, replaced whole under
+#             _candidate_lock and never modified in place.
+CANDIDATE_CACHE_TTL = 60
+
+_candidate_snapshot: tuple[float, list[dict], dict] | None = None
+_candidate_lock = threading.Lock()
+
+
+def _cached_candidates(subject: str, edge_type: str, include_confirmed: bool) -> list[dict]:
+    """Return filtered candidate edges, rebuilding the cache when stale. Created: 2026-10-16"""
+    global _candidate_snapshot
+    key = (subject, edge_type, bool(include_confirmed))
+    with _candidate_lock:
+        now = time.monotonic()
+        if (_candidate_snapshot is None
+                or now - _candidate_snapshot[0] > CANDIDATE_CACHE_TTL):
+            _candidate_snapshot = (now, get_candidate_edges(PG_CONN_STRING), {})
+
+        loaded_at, rows, filtered = _candidate_snapshot
+        candidates = filtered.get(key)
+        if candidates is None:
+            candidates = rows
+            if not include_confirmed:
+                candidates = [c for c in candidates if not c['already_confirmed']]
+            if subject:
+                candidates = [
+                    c for c in candidates
+                    if c['from_subject'] == subject or c['to_subject'] == subject
+                ]
+            if edge_type:
+                candidates = [c for c in candidates if c['edge_type'] == edge_type]
+            _candidate_snapshot = (loaded_at, rows, {**filtered, key: candidates})
+    return candidates
+
+
+def _mark_candidate_confirmed(from_occurrence_id: int, to_occurrence_id: int) -> None:
+    """Swap in cached candidates with a pair flagged as confirmed. Created: 2026-10-16"""
+    global _candidate_snapshot
+    with _candidate_lock:
+        if _candidate_snapshot is None:
+            return
+        loaded_at, rows, _ = _candidate_snapshot
+        rows = [
+            dict(c, already_confirmed=True)
+            if (c['from_occurrence_id'] == from_occurrence_id
+                and c['to_occurrence_id'] == to_occurrence_id)
+            else c
+            for c in rows
+        ]
+        _candidate_snapshot = (loaded_at, rows, {})
+
+
+def _invalidate_candidates() -> None:
+    """Drop cached candidate edges. Created: 2026-10-16"""
+    global _candidate_snapshot
+    with _candidate_lock:
+        _candidate_snapshot = None
+
+
 @anvil.server.callable
 def get_candidate_edges_list(
     subject: str = None,
@@ -764,22 +1064,16 @@ def get_candidate_edges_list(
     page: int = 0,
     page_size: int = 50
 ) -> dict:
-    """Return paginated candidate edges for the edge confirmation review workflow."""
-    import sys
-    sys.path.insert(0, str(Path(__file__).parent))
-    from graph_builder import get_candidate_edges
+    """
+    Return paginated candidate edges for the edge confirmation review workflow.
 
-    candidates = get_candidate_edges(PG_CONN_STRING)
+    2026-10-16: Served from the candidate cache (see CANDIDATE_CACHE_TTL)
+    """
+    if not _HAS_GRAPH:
+        log.error("get_candidate_edges_list: networkx not installed")
+        return {'rows': [], 'total': 0, 'page': page, 'page_size': page_size}
 
-    if not include_confirmed:
-        candidates = [c for c in candidates if not c['already_confirmed']]
-    if subject:
-        candidates = [
-            c for c in candidates
-            if c['from_subject'] == subject or c['to_subject'] == subject
-        ]
-    if edge_type:
-        candidates = [c for c in candidates if c['edge_type'] == edge_type]
+    candidates = _cached_candidates(subject, edge_type, include_confirmed)
 
     total = len(candidates)
     paged = candidates[page * page_size: (page + 1) * page_size]
@@ -801,9 +1095,11 @@ def confirm_edge(
 
     edge_nature: 'reinforcement' | 'extension' | 'application'
     Idempotent — updates existing edge if the pair already exists.
-    """
-    from datetime import date
 
+    2026-10-16: One upsert on the unique (from, to) pair (migration 010)
+    2026-10-16: Both statements run as prepared statements
+    2026-10-16: Commits asynchronously (see _ASYNC_COMMIT_SQL)
+    """
     valid_natures = {'reinforcement', 'extension', 'application'}
     if edge_nature not in valid_natures:
         return {
@@ -815,62 +1111,54 @@ def confirm_edge(
 
     conn = get_conn()
     try:
-        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-            cursor.execute(
-                "SELECT occurrence_id, subject FROM occurrences WHERE occurrence_id = %s",
-                (from_occurrence_id,)
-            )
-            fr_row = fetchone(cursor)
-            cursor.execute(
-                "SELECT occurrence_id, subject FROM occurrences WHERE occurrence_id = %s",
-                (to_occurrence_id,)
-            )
-            to_row = fetchone(cursor)
+        with conn.cursor() as cursor:
+            # Subjects are NOT NULL, so NULL means the occurrence is missing
+            execute_prepared(cursor, 'edge_subjects', """
+                SELECT
+                    (SELECT subject FROM occurrences WHERE occurrence_id = $1) AS from_subject,
+                    (SELECT subject FROM occurrences WHERE occurrence_id = $2) AS to_subject
+            """, (from_occurrence_id, to_occurrence_id))
+            subjects = fetchone(cursor)
 
-            if not fr_row:
+            if subjects['from_subject'] is None:
                 return {'ok': False, 'message': f"from_occurrence_id {from_occurrence_id} not found."}
-            if not to_row:
+            if subjects['to_subject'] is None:
                 return {'ok': False, 'message': f"to_occurrence_id {to_occurrence_id} not found."}
 
             if not edge_type:
                 edge_type = (
-                    'within_subject' if fr_row['subject'] == to_row['subject']
+                    'within_subject' if subjects['from_subject'] == subjects['to_subject']
                     else 'cross_subject'
                 )
 
             today = date.today().isoformat()
 
-            cursor.execute(
-                "SELECT edge_id FROM edges WHERE from_occurrence = %s AND to_occurrence = %s",
-                (from_occurrence_id, to_occurrence_id)
-            )
-            existing = fetchone(cursor)
-
-            if existing:
-                cursor.execute("""
-                    UPDATE edges
-                    SET edge_type = %s, edge_nature = %s, confirmed_by = %s, confirmed_date = %s
-                    WHERE edge_id = %s
-                """, (edge_type, edge_nature, confirmed_by.strip(), today, existing['edge_id']))
-                edge_id = existing['edge_id']
-                action = 'updated'
-            else:
-                cursor.execute("""
-                    INSERT INTO edges (
-                        from_occurrence, to_occurrence,
-                        edge_type, edge_nature, confirmed_by, confirmed_date
-                    ) VALUES (%s, %s, %s, %s, %s, %s)
-                    RETURNING edge_id
-                """, (
-                    from_occurrence_id, to_occurrence_id,
-                    edge_type, edge_nature, confirmed_by.strip(), today
-                ))
-                edge_id = cursor.fetchone()['edge_id']
-                action = 'inserted'
+            cursor.execute(_ASYNC_COMMIT_SQL)
+            # xmax is 0 only on a freshly inserted row version
+            execute_prepared(cursor, 'confirm_edge', """
+                INSERT INTO edges (
+                    from_occurrence, to_occurrence,
+                    edge_type, edge_nature, confirmed_by, confirmed_date
+                ) VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (from_occurrence, to_occurrence) DO UPDATE
+                SET edge_type      = EXCLUDED.edge_type,
+                    edge_nature    = EXCLUDED.edge_nature,
+                    confirmed_by   = EXCLUDED.confirmed_by,
+                    confirmed_date = EXCLUDED.confirmed_date
+                RETURNING edge_id, (xmax = 0) AS inserted
+            """, (
+                from_occurrence_id, to_occurrence_id,
+                edge_type, edge_nature, confirmed_by.strip(), today
+            ))
+            row = fetchone(cursor)
+            edge_id = row['edge_id']
+            action = 'inserted' if row['inserted'] else 'updated'
 
         conn.commit()
     finally:
-        conn.close()
+        put_conn(conn)
+
+    _mark_candidate_confirmed(from_occurrence_id, to_occurrence_id)
 
     log.info("confirm_edge: %s edge_id=%d %d→%d nature=%s by=%s",
              action, edge_id, from_occurrence_id, to_occurrence_id,
@@ -892,18 +1180,17 @@ def get_page_image(occurrence_id: int):
     Return the rendered booklet page as an Anvil media object.
     Returns None if page_image_path is not yet populated.
     """
-    import anvil.media
-
     conn = get_conn()
     try:
         with conn.cursor() as cursor:
-            cursor.execute(
-                "SELECT source_path FROM occurrences WHERE occurrence_id = %s",
+            execute_prepared(
+                cursor, 'page_image_path',
+                "SELECT source_path FROM occurrences WHERE occurrence_id = $1",
                 (occurrence_id,)
             )
             row = cursor.fetchone()
     finally:
-        conn.close()
+        put_conn(conn)
 
     if not row:
         log.warning("get_page_image: occurrence_id %d not found", occurrence_id)
@@ -27,29 +27,48 @@ Brings the existing database to a vocab-first state in four steps:
       supplementary vocab not used in the booklet body.
 
 Usage:
-    python src/vocab_first_cleanup.py [--dry-run] [--skip-promote]
+    python src/vocab_first_cleanup.py [--dry-run] [--skip-promote] [--workers N]
 
 Arguments:
     --dry-run       Print counts only; do not modify the database.
     --skip-promote  Skip Step 2 (keep confirmed_with_flag for manual review).
+    --workers N     Step 4 worker processes (default: CPU count; 1 = serial).
 
 Created: 2026-02-26
 """
 
 import argparse
+import functools
+import os
 import re
 import sqlite3
 import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import accumulate
 from pathlib import Path
+from typing import Iterator
 
 # Allow imports from src/ when invoked from project root
 sys.path.insert(0, str(Path(__file__).parent))
 
-from pptx import Presentation
+from extract_stage1 import iter_slide_paragraphs
+from extract_stage2 import tune_connection
+
+# 2026-10-16: pyahocorasick is optional; when installed, step 4 finds term
+#             candidates with one automaton (see search_terms_in_paragraphs)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 # _normalise is a private helper in vocab_validator; used here for fuzzy
 # chapter lookup in Step 3. Same project, so acceptable.
-from vocab_validator import find_vocab_list, match_term, parse_vocab_docx
+from vocab_validator import (
+    build_match_index, find_vocab_list, match_term, parse_vocab_docx
+)
 from vocab_validator import _normalise  # noqa: PLC2701
 
 
@@ -57,85 +76,186 @@ from vocab_validator import _normalise  # noqa: PLC2701
 # DATABASE HELPERS
 # =============================================================================
 
+# 2026-10-16: Rows are streamed in batches of this size rather than with one
+#             fetchall
+FETCH_ARRAYSIZE = 512
+
+
+def _iter_rows(
+    cursor: sqlite3.Cursor,
+    sql: str,
+    params: tuple,
+    columns: tuple[str, ...]
+) -> Iterator[dict]:
+    """
+    Run a query on a fresh cursor and yield its rows as dicts.
+
+    A separate cursor lets callers write through their own cursor while the
+    rows are still streaming.
+
+    Created: 2026-10-16
+    """
+    read_cursor = cursor.connection.cursor()
+    read_cursor.arraysize = FETCH_ARRAYSIZE
+    try:
+        read_cursor.execute(sql, params)
+        while True:
+            rows = read_cursor.fetchmany()
+            if not rows:
+                break
+            yield from (dict(zip(columns, r)) for r in rows)
+    finally:
+        read_cursor.close()
+
+
 def get_all_units(cursor: sqlite3.Cursor) -> list[dict]:
     """
     Return distinct units from occurrences with one source_path each.
 
     Created: 2026-02-26
+    2026-10-16: Built from the streamed rows (see _iter_rows)
+    2026-10-16: Read straight from idx_occurrences_unit (init_db.py; older
+    databases: migrate_add_occurrence_indexes.py), with no temp B-tree for
+    the DISTINCT or ORDER BY
     """
-    cursor.execute("""
+    return list(_iter_rows(
+        cursor,
+        """
         SELECT DISTINCT subject, year, term, unit, source_path
         FROM occurrences
         ORDER BY subject, year, term, unit
-    """)
-    return [
-        {
-            'subject': r[0], 'year': r[1], 'term': r[2],
-            'unit': r[3], 'source_path': r[4]
-        }
-        for r in cursor.fetchall()
-    ]
+        """,
+        (),
+        ('subject', 'year', 'term', 'unit', 'source_path')
+    ))
 
 
-def get_unit_occurrences(
+def iter_unit_occurrences(
     cursor: sqlite3.Cursor,
     subject: str,
     year: int,
     term: str,
     unit: str
-) -> list[dict]:
+) -> Iterator[dict]:
     """
-    Return all occurrences + concept terms for a unit.
+    Yield all occurrences + concept terms for a unit.
 
-    Created: 2026-02-26
+    Created: 2026-02-26 (as get_unit_occurrences, returning a list)
+    2026-10-16: Streams rows via fetchmany (see _iter_rows)
     """
-    cursor.execute("""
+    return _iter_rows(
+        cursor,
+        """
         SELECT o.occurrence_id, c.term AS concept_term, o.chapter,
                o.slide_number, o.validation_status
         FROM occurrences o
         JOIN concepts c ON o.concept_id = c.concept_id
         WHERE o.subject=? AND o.year=? AND o.term=? AND o.unit=?
-    """, (subject, year, term, unit))
-    return [
-        {
-            'occurrence_id': r[0], 'concept_term': r[1], 'chapter': r[2],
-            'slide_number': r[3], 'validation_status': r[4]
-        }
-        for r in cursor.fetchall()
-    ]
+        """,
+        (subject, year, term, unit),
+        ('occurrence_id', 'concept_term', 'chapter',
+         'slide_number', 'validation_status')
+    )
 
 
 def cleanup_orphan_concepts(cursor: sqlite3.Cursor) -> int:
     """
     Remove concepts with no remaining occurrences. Returns count deleted.
 
+    Called by step1_delete_noise after its bulk DELETE.
+
     Created: 2026-02-26
+    2026-10-16: NOT EXISTS probes idx_occurrences_concept_id per concept
+    instead of building the DISTINCT set. Unlike NOT IN, a NULL concept_id
+    in occurrences no longer stops every orphan from being removed.
     """
     cursor.execute("""
         DELETE FROM concepts
-        WHERE concept_id NOT IN (SELECT DISTINCT concept_id FROM occurrences)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM occurrences o WHERE o.concept_id = concepts.concept_id
+        )
     """)
     return cursor.rowcount
 
 
-def get_or_create_concept(cursor: sqlite3.Cursor, term: str) -> int:
+# 2026-10-16: INSERT ... RETURNING needs SQLite 3.35+; older builds insert
+#             new concepts one row at a time
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def get_or_create_concepts(
+    cursor: sqlite3.Cursor,
+    terms: set[str]
+) -> dict[str, int]:
     """
-    Return concept_id for term; insert if not found.
+    Return a term -> concept_id map for terms, inserting any not found.
 
-    Created: 2026-02-26
+    Where a term has several concepts the lowest id wins.
+
+    Created: 2026-02-26 (as get_or_create_concept, one term per call)
+    2026-10-16: Resolves a whole set of terms with one lookup query, and
+    inserts the missing terms with one multi-row INSERT ... RETURNING
+    (SQLite 3.35+). concepts.term is not unique, so ON CONFLICT cannot be
+    used to fold the lookup into the insert.
+    2026-10-16: Falls back to one INSERT per term (lastrowid) on SQLite
+    builds older than 3.35
     """
-    cursor.execute("SELECT concept_id FROM concepts WHERE term = ?", (term,))
-    row = cursor.fetchone()
-    if row:
-        return row[0]
-    cursor.execute("INSERT INTO concepts (term) VALUES (?)", (term,))
-    return cursor.lastrowid
+    if not terms:
+        return {}
+    wanted = list(terms)
+    cursor.execute(
+        f"SELECT term, concept_id FROM concepts WHERE term IN ({','.join('?' * len(wanted))})"
+        " ORDER BY concept_id DESC",
+        wanted
+    )
+    concept_ids = dict(cursor.fetchall())
+    missing = [t for t in wanted if t not in concept_ids]
+    if missing and not _SQLITE_HAS_RETURNING:
+        for term in missing:
+            cursor.execute("INSERT INTO concepts (term) VALUES (?)", (term,))
+            concept_ids[term] = cursor.lastrowid
+    elif missing:
+        cursor.execute(
+            f"INSERT INTO concepts (term) VALUES {','.join(['(?)'] * len(missing))}"
+            " RETURNING term, concept_id",
+            missing
+        )
+        concept_ids.update(cursor.fetchall())
+    return concept_ids
 
 
 # =============================================================================
 # PPTX TEXT SEARCH
 # =============================================================================
 
+@functools.lru_cache(maxsize=4096)
+def _compile_term_pattern(term_lower: str) -> re.Pattern:
+    """
+    Return the compiled word-boundary pattern for a lowercased term.
+
+    Created: 2026-10-16
+    """
+    return re.compile(
+        r'(?<![a-zA-Z])' + re.escape(term_lower) + r'(?![a-zA-Z])',
+        re.IGNORECASE
+    )
+
+
+def _extract_slide_paragraphs(pptx_path: str) -> list[list[str]]:
+    """
+    Return the non-empty paragraph texts of a PPTX, one list per slide.
+
+    Paragraph text is assembled across all runs (bold and unbolded) to catch
+    terms split at run boundaries. Raises if the deck cannot be opened.
+
+    Created: 2026-10-16
+    2026-10-16: Slide XML is read straight from the zip by stage 1's
+    iter_slide_paragraphs rather than through python-pptx. Grouped text
+    boxes are now searched, and line breaks separate words.
+    """
+    return list(iter_slide_paragraphs(pptx_path))
+
+
 def search_term_in_pptx(pptx_path: str, term: str) -> dict:
     """
     Search all text (bold and unbolded) in a PPTX for a term.
@@ -149,39 +269,157 @@ def search_term_in_pptx(pptx_path: str, term: str) -> dict:
         first_context : paragraph text of first match
         error         : str (only present on failure)
 
+    2026-10-16: Delegates to search_terms_in_paragraphs.
+
     Created: 2026-02-26
     """
     try:
-        prs = Presentation(pptx_path)
+        slide_paragraphs = _extract_slide_paragraphs(pptx_path)
     except Exception as e:
         return {'found': False, 'slides': [], 'first_context': '', 'error': str(e)}
+    return search_terms_in_paragraphs(slide_paragraphs, [term])[term.lower()]
+
+
+def _regex_hit_finder(keys: list[str]):
+    """
+    Return a function yielding (start, key index) for every term hit in a text.
+
+    Scans with one alternation of every term, longest first. The alternation
+    sits in a lookahead so matches may overlap, and shorter terms that are
+    prefixes of the term found at a position are checked there with their
+    own pattern.
 
-    pattern = re.compile(
-        r'(?<![a-zA-Z])' + re.escape(term) + r'(?![a-zA-Z])',
+    Created: 2026-10-16
+    """
+    # One capturing group per term; m.lastindex identifies the term matched
+    combined = re.compile(
+        r'(?<![a-zA-Z])(?=(?:'
+        + '|'.join('(' + re.escape(k) + ')' for k in keys)
+        + r')(?![a-zA-Z]))',
         re.IGNORECASE
     )
+    # Prefixes are compared as the patterns match, i.e. case-insensitively
+    shorter_prefixes = [
+        [
+            j for j in range(i + 1, len(keys))
+            if re.match(re.escape(keys[j]), k, re.IGNORECASE)
+        ]
+        for i, k in enumerate(keys)
+    ]
+
+    def find_hits(text: str) -> Iterator[tuple[int, int]]:
+        for m in combined.finditer(text):
+            i = m.lastindex - 1
+            yield m.start(), i
+            for j in shorter_prefixes[i]:
+                if _compile_term_pattern(keys[j]).match(text, m.start()):
+                    yield m.start(), j
+
+    return find_hits
+
+
+# Lowercase characters that re.IGNORECASE also equates with a character of a
+# different lowercase form (e.g. long s with s), which lower() matching misses
+_IGNORECASE_EXTRA = frozenset(
+    '\xb5\u0131\u017f\u0345\u0390\u03b0\u03b2\u03b5\u03b8\u03b9\u03ba\u03bc'
+    '\u03c0\u03c1\u03c2\u03c3\u03c6\u03d0\u03d1\u03d5\u03d6\u03f0\u03f1\u03f5'
+    '\u0432\u0434\u043e\u0441\u0442\u044a\u0463\u1c80\u1c81\u1c82\u1c83\u1c84'
+    '\u1c85\u1c86\u1c87\u1c88\u1e61\u1e9b\u1fbe\u1fd3\u1fe3\ua64b\ufb05\ufb06'
+)
 
-    matching_slides = []
-    first_context = ''
 
-    for slide_idx, slide in enumerate(prs.slides, start=1):
-        slide_matched = False
-        for shape in slide.shapes:
-            if not shape.has_text_frame:
+def _automaton_hit_finder(keys: list[str]):
+    """
+    Return a function yielding (start, key index) for every term hit in a text.
+
+    An Aho-Corasick automaton over the terms finds every occurrence in the
+    lowercased text, overlaps included, in one pass. Each candidate is then
+    confirmed with the term's word-boundary pattern, so hits are the same
+    as _regex_hit_finder's. Texts that lowercase to a different length or
+    contain an _IGNORECASE_EXTRA character are scanned with the per-term
+    patterns instead; terms containing one use _regex_hit_finder.
+
+    Created: 2026-10-16
+    """
+    if any(not _IGNORECASE_EXTRA.isdisjoint(k) for k in keys):
+        return _regex_hit_finder(keys)
+
+    automaton = ahocorasick.Automaton()
+    for i, k in enumerate(keys):
+        automaton.add_word(k, i)
+    automaton.make_automaton()
+
+    def find_hits(text: str) -> Iterator[tuple[int, int]]:
+        lowered = text.lower()
+        if len(lowered) != len(text) or not _IGNORECASE_EXTRA.isdisjoint(lowered):
+            for i, k in enumerate(keys):
+                for m in _compile_term_pattern(k).finditer(text):
+                    yield m.start(), i
+            return
+        for end, i in automaton.iter(lowered):
+            start = end - len(keys[i]) + 1
+            if _compile_term_pattern(keys[i]).match(text, start):
+                yield start, i
+
+    return find_hits
+
+
+def search_terms_in_paragraphs(
+    slide_paragraphs: list[list[str]],
+    terms: list[str]
+) -> dict[str, dict]:
+    """
+    Search extracted slide paragraphs for several terms in a single pass.
+
+    Matching is as in search_term_in_pptx. Each slide is scanned once for
+    every term (see _regex_hit_finder).
+
+    Returns dict keyed by lowercased term, each value shaped like the
+    search_term_in_pptx result.
+
+    Created: 2026-10-16
+    2026-10-16: Uses an Aho-Corasick automaton (_automaton_hit_finder) when
+    pyahocorasick is installed; results are unchanged.
+    """
+    keys = sorted({t.lower() for t in terms}, key=len, reverse=True)
+    if not keys:
+        return {}
+
+    if AHOCORASICK_AVAILABLE:
+        find_hits = _automaton_hit_finder(keys)
+    else:
+        find_hits = _regex_hit_finder(keys)
+
+    matching_slides = {k: [] for k in keys}
+    first_context = {}
+
+    for slide_idx, texts in enumerate(slide_paragraphs, start=1):
+        # 2026-10-16: The slide's paragraphs are scanned as one newline-joined
+        #             string. Newline is a non-letter, so the word boundaries
+        #             match the per-paragraph scan; a paragraph is only
+        #             located (by offset) for a first_context.
+        slide_text = '\n'.join(texts)
+        para_starts = None
+        for start, j in find_hits(slide_text):
+            if para_starts is None:
+                para_starts = list(accumulate((len(t) + 1 for t in texts), initial=0))
+            para_idx = bisect_right(para_starts, start) - 1
+            # A term containing a newline could match across two paragraphs
+            if start + len(keys[j]) >= para_starts[para_idx + 1]:
                 continue
-            for para in shape.text_frame.paragraphs:
-                para_text = ''.join(run.text for run in para.runs)
-                if para_text and pattern.search(para_text):
-                    slide_matched = True
-                    if not first_context:
-                        first_context = para_text.strip()
-        if slide_matched:
-            matching_slides.append(slide_idx)
+            slides = matching_slides[keys[j]]
+            if not slides or slides[-1] != slide_idx:
+                slides.append(slide_idx)
+            if not first_context.get(keys[j]):
+                first_context[keys[j]] = texts[para_idx].strip()
 
     return {
-        'found': bool(matching_slides),
-        'slides': sorted(matching_slides),
-        'first_context': first_context
+        k: {
+            'found': bool(matching_slides[k]),
+            'slides': matching_slides[k],
+            'first_context': first_context.get(k, '')
+        }
+        for k in keys
     }
 
 
@@ -207,37 +445,47 @@ def chapter_number_from_db_string(chapter_str: str | None) -> str | None:
     return m.group(1) if m else None
 
 
-def build_term_chapter_map(vocab_data: dict) -> dict[str, str]:
+TermChapterMaps = tuple[dict[str, str], dict[str, str]]
+
+
+def build_term_chapter_map(vocab_data: dict) -> TermChapterMaps:
     """
     Build a lowercased-term → chapter_number map from parsed vocab data.
 
     Created: 2026-02-26
+    2026-10-16: Also returns a normalised-term → chapter_number map, so the
+    normalised fallback in lookup_vocab_chapter is one dict lookup. Where
+    several vocab terms normalise alike, the first (in lowercased-map order)
+    wins, matching the old linear scan.
     """
     mapping = {}
     for ch_num, ch_terms in vocab_data['chapters'].items():
         for t in ch_terms:
             mapping[t.lower()] = ch_num
-    return mapping
+
+    norm_mapping: dict[str, str] = {}
+    for vt, ch in mapping.items():
+        norm_mapping.setdefault(_normalise(vt), ch)
+
+    return mapping, norm_mapping
 
 
 def lookup_vocab_chapter(
     term: str,
-    term_chapter_map: dict[str, str]
+    term_chapter_map: TermChapterMaps
 ) -> str | None:
     """
     Look up vocab chapter for a term using exact then normalised matching.
 
     Created: 2026-02-26
     """
+    lower_map, norm_map = term_chapter_map
     # Exact (case-insensitive)
-    if term.lower() in term_chapter_map:
-        return term_chapter_map[term.lower()]
+    ch = lower_map.get(term.lower())
+    if ch is not None:
+        return ch
     # Normalised (punctuation stripped)
-    norm = _normalise(term)
-    for vt, ch in term_chapter_map.items():
-        if _normalise(vt) == norm:
-            return ch
-    return None
+    return norm_map.get(_normalise(term))
 
 
 # =============================================================================
@@ -254,15 +502,15 @@ def step1_delete_noise(
     Returns (occurrences_deleted, orphan_concepts_deleted).
 
     Created: 2026-02-26
+    2026-10-16: The COUNT only runs for --dry-run; the delete goes through
+    idx_occurrences_validation_status
     """
-    cursor.execute("""
-        SELECT COUNT(*) FROM occurrences
-        WHERE validation_status IN ('potential_noise', 'high_priority_review')
-    """)
-    count = cursor.fetchone()[0]
-
     if dry_run:
-        return count, 0
+        cursor.execute("""
+            SELECT COUNT(*) FROM occurrences
+            WHERE validation_status IN ('potential_noise', 'high_priority_review')
+        """)
+        return cursor.fetchone()[0], 0
 
     cursor.execute("""
         DELETE FROM occurrences
@@ -310,9 +558,17 @@ def step2_promote_flagged(
 # STEP 3: UPDATE CHAPTERS FROM VOCAB LISTS
 # =============================================================================
 
+_UPDATE_CHAPTER_SQL = "UPDATE occurrences SET chapter=? WHERE occurrence_id=?"
+
+# 2026-10-16: Chapter fills are applied with executemany in batches of up to
+#             this many rows
+UPDATE_BATCH_SIZE = 1000
+
+
 def step3_update_chapters(
     cursor: sqlite3.Cursor,
-    dry_run: bool
+    dry_run: bool,
+    units: list[dict] = None
 ) -> dict:
     """
     Populate NULL/empty chapter fields from vocab list chapter structure.
@@ -329,9 +585,13 @@ def step3_update_chapters(
         no_vocab  : units skipped due to missing vocab list
 
     Created: 2026-02-26
+    2026-10-16: Fills are collected and applied with executemany
+    2026-10-16: Takes units from the caller (get_all_units) if given
     """
-    units = get_all_units(cursor)
+    if units is None:
+        units = get_all_units(cursor)
     counts = {'filled': 0, 'conflicts': 0, 'no_vocab': 0}
+    pending_updates: list[tuple[str, int]] = []
 
     for unit_meta in units:
         source_path = unit_meta['source_path']
@@ -353,7 +613,7 @@ def step3_update_chapters(
 
         term_chapter_map = build_term_chapter_map(vocab_data)
 
-        occurrences = get_unit_occurrences(
+        occurrences = iter_unit_occurrences(
             cursor,
             unit_meta['subject'], unit_meta['year'],
             unit_meta['term'], unit_meta['unit']
@@ -369,10 +629,10 @@ def step3_update_chapters(
             if not occ['chapter'] or not occ['chapter'].strip():
                 # NULL or empty — fill in vocab chapter number
                 if not dry_run:
-                    cursor.execute(
-                        "UPDATE occurrences SET chapter=? WHERE occurrence_id=?",
-                        (str(vocab_chapter), occ['occurrence_id'])
-                    )
+                    pending_updates.append((str(vocab_chapter), occ['occurrence_id']))
+                    if len(pending_updates) >= UPDATE_BATCH_SIZE:
+                        cursor.executemany(_UPDATE_CHAPTER_SQL, pending_updates)
+                        pending_updates.clear()
                 counts['filled'] += 1
 
             elif db_chapter_num and db_chapter_num != vocab_chapter:
@@ -385,6 +645,12 @@ def step3_update_chapters(
                     f"DB='{occ['chapter']}' vocab_chapter='{vocab_chapter}'"
                 )
 
+        # Flushed per unit: a unit split across several source files is
+        # visited once per file and must see the chapters already filled
+        if pending_updates:
+            cursor.executemany(_UPDATE_CHAPTER_SQL, pending_updates)
+            pending_updates.clear()
+
     return counts
 
 
@@ -392,9 +658,188 @@ def step3_update_chapters(
 # STEP 4: RECOVER MISSED VOCAB TERMS
 # =============================================================================
 
+# 2026-10-16: One recovered occurrence per concept, unit and slide. Partial,
+#             because Stage 2 legitimately stores a term once per bold run,
+#             so other occurrences may repeat this key. A term that already
+#             occurs in the unit is never "missed", so recovered rows are
+#             the only ones an insert here could duplicate.
+_CREATE_RECOVERY_INDEX_SQL = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_occurrences_recovery_unique
+    ON occurrences(concept_id, subject, year, term, unit, IFNULL(slide_number, -1))
+    WHERE vocab_match_type = 'vocab_first_recovery'
+"""
+
+_INSERT_RECOVERED_SQL = """
+    INSERT OR IGNORE INTO occurrences (
+        concept_id, subject, year, term, unit, chapter,
+        slide_number, is_introduction, term_in_context, source_path,
+        needs_review, review_reason,
+        validation_status, vocab_confidence,
+        vocab_match_type, vocab_source
+    ) VALUES (
+        ?, ?, ?, ?, ?, ?,
+        ?, 0,
+        ?, ?,
+        0, NULL,
+        'confirmed', 1.0,
+        'vocab_first_recovery', ?
+    )
+"""
+
+
+def _scan_unit(source_path: str | None) -> dict | None:
+    """
+    Load a unit's vocab list and deck text from disk for step 4.
+
+    Runs in a worker process (see step4_recover_missed), so it touches no
+    database state; failures come back as messages rather than raising.
+
+    source_path is None when the unit has no PPTX on disk (step 4 checks
+    each distinct path once).
+
+    Returns None if the PPTX or vocab list is missing, otherwise dict:
+        vocab_path       : str
+        vocab_data       : parse_vocab_docx() result, or None
+        vocab_error      : str (only present if the vocab list failed to parse)
+        slide_paragraphs : _extract_slide_paragraphs() result, or None
+        pptx_error       : str (only present if the PPTX failed to open)
+
+    Created: 2026-10-16
+    """
+    # Require both PPTX on disk and vocab list
+    if not source_path:
+        return None
+    vocab_path = find_vocab_list(source_path)
+    if not vocab_path:
+        return None
+
+    scan = {'vocab_path': vocab_path, 'vocab_data': None, 'slide_paragraphs': None}
+    try:
+        scan['vocab_data'] = parse_vocab_docx(vocab_path)
+    except Exception as e:
+        scan['vocab_error'] = str(e)
+        return scan
+    try:
+        scan['slide_paragraphs'] = _extract_slide_paragraphs(source_path)
+    except Exception as e:
+        scan['pptx_error'] = str(e)
+    return scan
+
+
+def _recover_unit(
+    cursor: sqlite3.Cursor,
+    unit_meta: dict,
+    scan: dict | None,
+    dry_run: bool,
+    counts: dict
+) -> None:
+    """
+    Match one unit's vocab list against the DB and insert what the deck has.
+
+    Updates counts in place (see step4_recover_missed).
+
+    Created: 2026-02-26 (as the body of step4_recover_missed's unit loop)
+    """
+    source_path = unit_meta['source_path']
+    subject = unit_meta['subject']
+    year = unit_meta['year']
+    term = unit_meta['term']
+    unit = unit_meta['unit']
+
+    if scan is None:
+        counts['no_source'] += 1
+        return
+
+    if 'vocab_error' in scan:
+        print(f"  [WARN] Vocab parse error for {unit}: {scan['vocab_error']}")
+        counts['no_source'] += 1
+        return
+    vocab_data = scan['vocab_data']
+
+    # Current DB terms for this unit
+    db_terms = [
+        occ['concept_term']
+        for occ in iter_unit_occurrences(cursor, subject, year, term, unit)
+    ]
+
+    # 2026-10-16: Vocab term → chapter, built once per unit; a term listed
+    #             in several chapters keeps its first, as the old scan did
+    term_to_chapter: dict[str, str] = {}
+    for ch_num, ch_terms in vocab_data['chapters'].items():
+        for t in ch_terms:
+            term_to_chapter.setdefault(t, ch_num)
+
+    # Find vocab terms not in DB
+    db_index = build_match_index(db_terms)
+    missed = []
+    for vocab_term in vocab_data['all_terms']:
+        result = match_term(vocab_term, db_terms, db_index)
+        if not result['matched']:
+            missed.append({'term': vocab_term, 'chapter': term_to_chapter.get(vocab_term)})
+
+    if not missed:
+        return
+
+    vocab_source = Path(scan['vocab_path']).name
+
+    # 2026-10-16: The deck is parsed once per unit and all of the unit's
+    #             missed terms are searched in one pass over its text
+    if 'pptx_error' in scan:
+        print(f"  [ERROR] PPTX read failed for {unit}: {scan['pptx_error']}")
+        counts['not_found'] += len(missed)
+        return
+    search_results = search_terms_in_paragraphs(
+        scan['slide_paragraphs'], [m['term'] for m in missed]
+    )
+
+    # (term_text, chapter, slide_number, term_in_context) per recovery
+    found: list[tuple] = []
+
+    for missed_item in missed:
+        term_text = missed_item['term']
+        search_result = search_results[term_text.lower()]
+
+        if not search_result['found']:
+            counts['not_found'] += 1
+            continue
+
+        # Term found unbolded in PPTX — recover as confirmed occurrence
+        slide_number = search_result['slides'][0] if search_result['slides'] else None
+        term_in_context = search_result['first_context'] or None
+        chapter = (
+            str(missed_item['chapter']) if missed_item['chapter'] else None
+        )
+
+        found.append((term_text, chapter, slide_number, term_in_context))
+
+    if dry_run:
+        counts['recovered'] += len(found)
+        return
+    if not found:
+        return
+
+    # 2026-10-16: Concepts and the inserts are each one statement per unit
+    #             rather than per term
+    concept_ids = get_or_create_concepts(cursor, {f[0] for f in found})
+
+    # Idempotent — idx_occurrences_recovery_unique makes a duplicate a no-op,
+    # and rowcount only counts the rows actually inserted
+    cursor.executemany(_INSERT_RECOVERED_SQL, [
+        (
+            concept_ids[term_text], subject, year, term, unit, chapter,
+            slide_number, term_in_context, source_path,
+            vocab_source
+        )
+        for term_text, chapter, slide_number, term_in_context in found
+    ])
+    counts['recovered'] += cursor.rowcount
+
+
 def step4_recover_missed(
     cursor: sqlite3.Cursor,
-    dry_run: bool
+    dry_run: bool,
+    workers: int = None,
+    units: list[dict] = None
 ) -> dict:
     """
     Find vocab list terms absent from the DB and recover them via PPTX search.
@@ -412,125 +857,45 @@ def step4_recover_missed(
         no_source  : units skipped due to missing PPTX or vocab list
 
     Created: 2026-02-26
+    2026-10-16: A unit's recoveries are written in one batch (see
+    get_or_create_concepts)
+    2026-10-16: Vocab lists and deck text are loaded in worker processes
+    (_scan_unit). Matching and all writes stay in this process, in unit
+    order, so a unit split across several source files still sees its
+    earlier recoveries. workers defaults to os.cpu_count(); 1 = serial.
+    2026-10-16: Duplicate recoveries are ignored by a partial unique index
+    (idx_occurrences_recovery_unique) instead of a SELECT per unit
+    2026-10-16: Takes units from the caller (get_all_units) if given
     """
-    units = get_all_units(cursor)
+    if units is None:
+        units = get_all_units(cursor)
     counts = {'recovered': 0, 'not_found': 0, 'no_source': 0}
     total_units = len(units)
+    if not dry_run:
+        cursor.execute(_CREATE_RECOVERY_INDEX_SQL)
+    workers = workers or os.cpu_count() or 1
+    # 2026-10-16: Each distinct source path is checked on disk once
+    on_disk = {
+        p: os.path.exists(p) for p in {u['source_path'] for u in units} if p
+    }
+    source_paths = [
+        u['source_path'] if on_disk.get(u['source_path']) else None
+        for u in units
+    ]
 
-    for i, unit_meta in enumerate(units, 1):
-        source_path = unit_meta['source_path']
-        subject = unit_meta['subject']
-        year = unit_meta['year']
-        term = unit_meta['term']
-        unit = unit_meta['unit']
-
-        if i % 5 == 0 or i == total_units:
-            print(f"  Step 4: unit {i}/{total_units}...")
-
-        # Require both PPTX on disk and vocab list
-        if not source_path or not Path(source_path).exists():
-            counts['no_source'] += 1
-            continue
-
-        vocab_path = find_vocab_list(source_path)
-        if not vocab_path:
-            counts['no_source'] += 1
-            continue
-
-        try:
-            vocab_data = parse_vocab_docx(vocab_path)
-        except Exception as e:
-            print(f"  [WARN] Vocab parse error for {unit}: {e}")
-            counts['no_source'] += 1
-            continue
-
-        # Current DB terms for this unit
-        occurrences = get_unit_occurrences(cursor, subject, year, term, unit)
-        db_terms = [occ['concept_term'] for occ in occurrences]
-
-        # Find vocab terms not in DB
-        missed = []
-        for vocab_term in vocab_data['all_terms']:
-            result = match_term(vocab_term, db_terms)
-            if not result['matched']:
-                chapter_num = None
-                for ch_num, ch_terms in vocab_data['chapters'].items():
-                    if vocab_term in ch_terms:
-                        chapter_num = ch_num
-                        break
-                missed.append({'term': vocab_term, 'chapter': chapter_num})
-
-        if not missed:
-            continue
-
-        vocab_source = Path(vocab_path).name
-
-        for missed_item in missed:
-            term_text = missed_item['term']
-            search_result = search_term_in_pptx(source_path, term_text)
-
-            if 'error' in search_result:
-                print(
-                    f"  [ERROR] PPTX search failed for '{term_text}' "
-                    f"in {unit}: {search_result['error']}"
-                )
-                counts['not_found'] += 1
-                continue
-
-            if not search_result['found']:
-                counts['not_found'] += 1
-                continue
-
-            # Term found unbolded in PPTX — recover as confirmed occurrence
-            slide_number = search_result['slides'][0] if search_result['slides'] else None
-            term_in_context = search_result['first_context'] or None
-            chapter = (
-                str(missed_item['chapter']) if missed_item['chapter'] else None
+    with ExitStack() as stack:
+        if workers == 1 or total_units < 2:
+            scans = map(_scan_unit, source_paths)
+        else:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(workers, total_units))
             )
+            scans = executor.map(_scan_unit, source_paths, chunksize=2)
 
-            counts['recovered'] += 1
-
-            if dry_run:
-                continue
-
-            concept_id = get_or_create_concept(cursor, term_text)
-
-            # Idempotent check — avoid duplicating an existing occurrence
-            cursor.execute("""
-                SELECT occurrence_id FROM occurrences
-                WHERE concept_id=? AND subject=? AND year=? AND term=? AND unit=?
-                AND (
-                    slide_number IS ? OR
-                    (slide_number IS NULL AND ? IS NULL)
-                )
-            """, (
-                concept_id, subject, year, term, unit,
-                slide_number, slide_number
-            ))
-            if cursor.fetchone():
-                counts['recovered'] -= 1  # Already exists; don't double-count
-                continue
-
-            cursor.execute("""
-                INSERT INTO occurrences (
-                    concept_id, subject, year, term, unit, chapter,
-                    slide_number, is_introduction, term_in_context, source_path,
-                    needs_review, review_reason,
-                    validation_status, vocab_confidence,
-                    vocab_match_type, vocab_source
-                ) VALUES (
-                    ?, ?, ?, ?, ?, ?,
-                    ?, 0,
-                    ?, ?,
-                    0, NULL,
-                    'confirmed', 1.0,
-                    'vocab_first_recovery', ?
-                )
-            """, (
-                concept_id, subject, year, term, unit, chapter,
-                slide_number, term_in_context, source_path,
-                vocab_source
-            ))
+        for i, (unit_meta, scan) in enumerate(zip(units, scans), 1):
+            if i % 5 == 0 or i == total_units:
+                print(f"  Step 4: unit {i}/{total_units}...")
+            _recover_unit(cursor, unit_meta, scan, dry_run, counts)
 
     return counts
 
@@ -551,6 +916,10 @@ def main() -> int:
         '--skip-promote', action='store_true',
         help='Skip Step 2 (confirmed_with_flag promotion).'
     )
+    parser.add_argument(
+        '--workers', type=int,
+        help='Step 4 worker processes (default: CPU count; 1 = serial).'
+    )
     args = parser.parse_args()
 
     project_root = Path(__file__).parent.parent
@@ -565,8 +934,13 @@ def main() -> int:
         print()
 
     conn = sqlite3.connect(db_path)
+    tune_connection(conn)
     cursor = conn.cursor()
 
+    # 2026-10-16: Steps 1–4 run in one explicit transaction, committed or
+    #             rolled back below; a real run takes the write lock up front
+    cursor.execute("BEGIN" if args.dry_run else "BEGIN IMMEDIATE")
+
     # ------------------------------------------------------------------
     # Step 1
     # ------------------------------------------------------------------
@@ -595,11 +969,15 @@ def main() -> int:
             print(f"  Promoted {promoted} occurrences")
     print()
 
+    # 2026-10-16: Steps 3 and 4 add or remove no units, so the list read
+    #             after Step 1's deletes serves both
+    units = get_all_units(cursor)
+
     # ------------------------------------------------------------------
     # Step 3
     # ------------------------------------------------------------------
     print("Step 3: Updating chapters from vocab list structure...")
-    ch_counts = step3_update_chapters(cursor, args.dry_run)
+    ch_counts = step3_update_chapters(cursor, args.dry_run, units)
     if args.dry_run:
         print(f"  Would fill {ch_counts['filled']} NULL chapters")
     else:
@@ -614,7 +992,7 @@ def main() -> int:
     # Step 4
     # ------------------------------------------------------------------
     print("Step 4: Recovering missed vocab terms from PPTX text...")
-    rec_counts = step4_recover_missed(cursor, args.dry_run)
+    rec_counts = step4_recover_missed(cursor, args.dry_run, args.workers, units)
     if args.dry_run:
         print(f"  Would recover {rec_counts['recovered']} terms (found unbolded in PPTX)")
         print(f"  Not found in PPTX: {rec_counts['not_found']} (supplementary vocab)")
@@ -8,11 +8,37 @@ against them. Assigns confidence scores and validation status to each term.
 Created: 2026-02-24
 """
 
+import functools
+import hashlib
+import os
+import posixpath
 import re
+import sys
+import zipfile
 from difflib import SequenceMatcher
+from itertools import chain
 from pathlib import Path
+from typing import Iterator
 
-from docx import Document
+from lxml import etree
+
+# 2026-10-16: rapidfuzz is optional; when installed it pre-screens fuzzy
+#             candidates in C (see match_term)
+try:
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+    from rapidfuzz.process import extract as _extract_scores
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# 2026-10-16: Compiled once at import rather than on every call
+_RE_CHAPTER = re.compile(r'^Chapter\s+(\d+)', re.IGNORECASE)
+# 2026-10-16: _normalise strips punctuation with str.translate
+_PUNCTUATION_TABLE = str.maketrans('', '', '.,;:!?\'"()[]{}')
+
+FUZZY_THRESHOLD = 0.9
+# rapidfuzz scores 0-100; the margin absorbs float rounding at the threshold
+_FUZZY_PRESCREEN_CUTOFF = FUZZY_THRESHOLD * 100 - 0.01
 
 
 # =============================================================================
@@ -31,6 +57,8 @@ def find_vocab_list(pptx_path: str) -> str | None:
     5. Return the most recently modified file
 
     Created: 2026-02-24
+    2026-10-16: The search is cached per unit folder (see
+    _find_vocab_list_in)
 
     Args:
         pptx_path: Full path to PPTX booklet file
@@ -38,41 +66,210 @@ def find_vocab_list(pptx_path: str) -> str | None:
     Returns:
         Absolute path to best vocab .docx, or None if not found
     """
-    unit_folder = Path(pptx_path).parent.parent
+    return _find_vocab_list_in(str(Path(pptx_path).parent.parent))
 
+
+@functools.lru_cache(maxsize=1024)
+def _find_vocab_list_in(unit_folder: str) -> str | None:
+    """
+    Search a unit folder's vocab folders for the best vocab list .docx.
+
+    Walks with os.scandir, listing each directory once. Files are visited in
+    the same order as Path.rglob (a directory's files, then its subfolders
+    depth-first, not following symlinks), so mtime ties resolve as before,
+    and only the final candidates are stat'ed. The result is cached for the
+    life of the process; the folder is not re-read if files change.
+
+    Created: 2026-10-16 (from find_vocab_list)
+    """
     # 2026-02-24: Two passes — prefer chapter-ordered, fall back to A-Z
     az_files = []
     chapter_files = []
 
-    for child in unit_folder.iterdir():
-        if not child.is_dir():
-            continue
-        if 'vocab' not in child.name.lower():
-            continue
-        for docx_file in child.rglob('*.docx'):
-            if docx_file.name.startswith('.') or docx_file.name.startswith('~$'):
+    def walk(folder: str) -> None:
+        try:
+            with os.scandir(folder) as it:
+                entries = list(it)
+        except PermissionError:
+            return
+        for entry in entries:
+            name = entry.name
+            if not name.endswith('.docx'):
+                continue
+            if name.startswith('.') or name.startswith('~$'):
                 continue
-            name_lower = docx_file.name.lower()
+            name_lower = name.lower()
             # 2026-02-24: Only accept files with 'vocab' in the filename
             # (filters out stray commercial/admin docs in vocab folders)
             if 'vocab' not in name_lower:
                 continue
             if name_lower.startswith('a-z') or ' a-z' in name_lower or '_a-z' in name_lower:
-                az_files.append(docx_file)
+                az_files.append(entry)
             else:
-                chapter_files.append(docx_file)
+                chapter_files.append(entry)
+        for entry in entries:
+            if entry.is_dir() and not entry.is_symlink():
+                walk(entry.path)
+
+    with os.scandir(unit_folder) as it:
+        for child in it:
+            if child.is_dir() and 'vocab' in child.name.lower():
+                walk(child.path)
 
     candidates = chapter_files if chapter_files else az_files
     if not candidates:
         return None
 
-    return str(max(candidates, key=lambda f: f.stat().st_mtime))
+    return max(candidates, key=lambda f: f.stat().st_mtime).path
 
 
 # =============================================================================
 # VOCAB LIST PARSING
 # =============================================================================
 
+# 2026-10-16: document.xml is streamed straight from the .docx zip with lxml
+#             rather than loaded through python-docx. The helpers below mirror
+#             python-docx semantics: body-level w:p only (not tables), text
+#             from w:r and w:hyperlink runs, and paragraph style names
+#             resolved through styles.xml with the default style as fallback.
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_BODY = f'{{{_W_NS}}}body'
+_W_P = f'{{{_W_NS}}}p'
+_W_R = f'{{{_W_NS}}}r'
+_W_HYPERLINK = f'{{{_W_NS}}}hyperlink'
+_W_T = f'{{{_W_NS}}}t'
+_W_BR = f'{{{_W_NS}}}br'
+_W_TYPE = f'{{{_W_NS}}}type'
+_W_VAL = f'{{{_W_NS}}}val'
+_W_STYLE_ID = f'{{{_W_NS}}}styleId'
+_W_DEFAULT = f'{{{_W_NS}}}default'
+_W_STYLE = f'{{{_W_NS}}}style'
+_W_NAME = f'{{{_W_NS}}}name'
+_W_PSTYLE_PATH = f'{{{_W_NS}}}pPr/{{{_W_NS}}}pStyle'
+
+# Run children with a text equivalent (w:t and w:br are handled separately)
+_RUN_TEXT = {
+    f'{{{_W_NS}}}tab': '\t',
+    f'{{{_W_NS}}}ptab': '\t',
+    f'{{{_W_NS}}}cr': '\n',
+    f'{{{_W_NS}}}noBreakHyphen': '-',
+}
+
+# Built-in styles stored under lowercase names (python-docx's BabelFish)
+_UI_STYLE_NAMES = {
+    'caption': 'Caption', 'footer': 'Footer', 'header': 'Header',
+    **{f'heading {n}': f'Heading {n}' for n in range(1, 10)},
+}
+
+_XML_PARSER = etree.XMLParser(resolve_entities=False)
+
+
+def _docx_part_names(zf: zipfile.ZipFile) -> tuple[str, str | None]:
+    """Return the main document part name and its styles part name (or None)."""
+    def rels(part_name: str) -> list[tuple[str, str]]:
+        folder, filename = posixpath.split(part_name)
+        rels_name = posixpath.join(folder, '_rels', f'{filename}.rels')
+        if rels_name not in zf.NameToInfo:
+            return []
+        root = etree.fromstring(zf.read(rels_name), _XML_PARSER)
+        return [(rel.get('Type'), rel.get('Target')) for rel in root]
+
+    def resolve(base_dir: str, target: str) -> str:
+        if target.startswith('/'):
+            return target.lstrip('/')
+        return posixpath.normpath(posixpath.join(base_dir, target))
+
+    document_part = resolve('', next(
+        target for rel_type, target in rels('')
+        if rel_type.endswith('/officeDocument')
+    ))
+    styles_part = next(
+        (
+            resolve(posixpath.dirname(document_part), target)
+            for rel_type, target in rels(document_part)
+            if rel_type.endswith('/styles')
+        ),
+        None
+    )
+    return document_part, styles_part
+
+
+def _paragraph_style_names(zf: zipfile.ZipFile, styles_part: str | None) -> dict:
+    """
+    Return {style id: UI name} for paragraph styles, with None → the default.
+
+    Ids that are missing or not paragraph styles are left out; python-docx
+    resolves those to the default paragraph style too.
+    """
+    if styles_part is None:
+        # python-docx falls back to its template, where the default is Normal
+        return {None: 'Normal'}
+
+    styles = etree.fromstring(zf.read(styles_part), _XML_PARSER)
+    first_by_id = {}
+    default_name = None
+    for style in styles.iterchildren(_W_STYLE):
+        name_el = style.find(_W_NAME)
+        name = None if name_el is None else name_el.get(_W_VAL)
+        if name is not None:
+            name = _UI_STYLE_NAMES.get(name, name)
+        is_paragraph = style.get(_W_TYPE, 'paragraph') == 'paragraph'
+        first_by_id.setdefault(style.get(_W_STYLE_ID), (is_paragraph, name))
+        if is_paragraph and style.get(_W_DEFAULT) in ('1', 'true', 'on'):
+            default_name = name  # The last default in document order wins
+
+    names = {
+        style_id: name
+        for style_id, (is_paragraph, name) in first_by_id.items()
+        if style_id and is_paragraph
+    }
+    names[None] = default_name
+    return names
+
+
+def _run_text(r) -> str:
+    """Text of a w:r element, as python-docx's Run.text."""
+    parts = []
+    for child in r:
+        tag = child.tag
+        if tag == _W_T:
+            if child.text:
+                parts.append(child.text)
+        elif tag == _W_BR:
+            if child.get(_W_TYPE, 'textWrapping') == 'textWrapping':
+                parts.append('\n')
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return ''.join(parts)
+
+
+def _iter_body_paragraphs(document_xml) -> Iterator[tuple[str, str | None]]:
+    """
+    Yield (text, style id) for each body-level paragraph of document.xml.
+
+    Paragraphs are cleared as they are read, so memory stays flat however
+    long the document.
+    """
+    for _, p in etree.iterparse(
+        document_xml, events=('end',), tag=_W_P, resolve_entities=False
+    ):
+        body = p.getparent()
+        if body is None or body.tag != _W_BODY:
+            continue
+
+        parts = []
+        for child in p:
+            if child.tag == _W_R:
+                parts.append(_run_text(child))
+            elif child.tag == _W_HYPERLINK:
+                parts.extend(_run_text(r) for r in child.iterchildren(_W_R))
+        p_style = p.find(_W_PSTYLE_PATH)
+        yield ''.join(parts), None if p_style is None else p_style.get(_W_VAL)
+
+        p.clear()
+        while p.getprevious() is not None:
+            del body[0]
+
 def parse_vocab_docx(docx_path: str) -> dict:
     """
     Parse a vocabulary list .docx into structured data.
@@ -81,14 +278,19 @@ def parse_vocab_docx(docx_path: str) -> dict:
     of paragraph style, since style names differ across documents.
 
     Created: 2026-02-24
+    2026-10-16: Results are cached per (path, mtime), so a vocab list used
+    by several steps or booklets is parsed once while unchanged. Callers
+    share the returned dict and must not modify it.
+    2026-10-16: Term lists are tuples, so the shared result cannot be
+    modified through them
 
     Args:
         docx_path: Path to vocab list .docx file
 
     Returns:
         {
-            'chapters': {'1': ['term1', 'term2'], '2': ['term3', ...]},
-            'all_terms': ['term1', 'term2', ...],
+            'chapters': {'1': ('term1', 'term2'), '2': ('term3', ...)},
+            'all_terms': ('term1', 'term2', ...),
             'metadata': {
                 'source_path': str,
                 'total_terms': int,
@@ -96,41 +298,71 @@ def parse_vocab_docx(docx_path: str) -> dict:
             }
         }
     """
-    doc = Document(docx_path)
+    return _parse_vocab_docx_cached(str(docx_path), os.stat(docx_path).st_mtime_ns)
 
-    chapters = {}
-    current_chapter = '0'  # Terms before first heading go into chapter '0'
-    chapter_pattern = re.compile(r'^Chapter\s+(\d+)', re.IGNORECASE)
 
-    for para in doc.paragraphs:
-        text = para.text.strip()
-        if not text:
-            continue
+@functools.lru_cache(maxsize=256)
+def _parse_vocab_docx_cached(docx_path: str, mtime_ns: int) -> dict:
+    """
+    parse_vocab_docx keyed on file mtime, so an edited file is re-parsed.
 
-        # Check for chapter heading
-        chapter_match = chapter_pattern.match(text)
-        if chapter_match:
-            current_chapter = chapter_match.group(1)
-            if current_chapter not in chapters:
-                chapters[current_chapter] = []
-            continue
+    Created: 2026-10-16
+    """
+    return _parse_vocab_docx_uncached(docx_path)
 
-        # Skip the document title (first non-empty paragraph if chapter '0' still empty)
-        if current_chapter == '0' and not chapters.get('0'):
-            # Heuristic: if text is long and looks like a title, skip it
-            if len(text) > 40 or para.style.name in ('Title', 'Heading 1', 'Heading 2'):
-                continue
 
-        # Everything else is a vocabulary term
-        if current_chapter not in chapters:
-            chapters[current_chapter] = []
-        chapters[current_chapter].append(text)
+def _parse_vocab_docx_uncached(docx_path: str) -> dict:
+    """
+    Parse a vocab list .docx (see parse_vocab_docx).
+
+    Created: 2026-02-24 (as parse_vocab_docx)
+    2026-10-16: Terms are interned, like Stage 1's extracted terms
+    2026-10-16: Paragraphs are streamed from the zip (see _iter_body_paragraphs)
+    rather than read through python-docx; styles.xml is only read if the
+    title heuristic needs a style name
+    """
+    chapters = {}
+    current_chapter = '0'  # Terms before first heading go into chapter '0'
+
+    with zipfile.ZipFile(docx_path) as zf:
+        document_part, styles_part = _docx_part_names(zf)
+        style_names = None
+        with zf.open(document_part) as document_xml:
+            for text, style_id in _iter_body_paragraphs(document_xml):
+                text = text.strip()
+                if not text:
+                    continue
+
+                # Check for chapter heading
+                chapter_match = _RE_CHAPTER.match(text)
+                if chapter_match:
+                    current_chapter = chapter_match.group(1)
+                    if current_chapter not in chapters:
+                        chapters[current_chapter] = []
+                    continue
+
+                # Skip the document title (first non-empty paragraph if chapter '0' still empty)
+                if current_chapter == '0' and not chapters.get('0'):
+                    # Heuristic: if text is long and looks like a title, skip it
+                    if len(text) > 40:
+                        continue
+                    if style_names is None:
+                        style_names = _paragraph_style_names(zf, styles_part)
+                    style_name = style_names.get(style_id, style_names[None])
+                    if style_name in ('Title', 'Heading 1', 'Heading 2'):
+                        continue
+
+                # Everything else is a vocabulary term
+                if current_chapter not in chapters:
+                    chapters[current_chapter] = []
+                chapters[current_chapter].append(sys.intern(text))
 
     # Remove chapter '0' if empty
     if '0' in chapters and not chapters['0']:
         del chapters['0']
 
-    all_terms = [term for terms in chapters.values() for term in terms]
+    chapters = {ch: tuple(terms) for ch, terms in chapters.items()}
+    all_terms = tuple(term for terms in chapters.values() for term in terms)
 
     return {
         'chapters': chapters,
@@ -147,13 +379,71 @@ def parse_vocab_docx(docx_path: str) -> dict:
 # TERM MATCHING
 # =============================================================================
 
+@functools.lru_cache(maxsize=65536)
 def _normalise(text: str) -> str:
-    """Strip punctuation and collapse whitespace for normalised matching."""
-    text = re.sub(r'[.,;:!?\'"()\[\]{}]', '', text)
-    return re.sub(r'\s+', ' ', text).strip().lower()
+    """
+    Strip punctuation and collapse whitespace for normalised matching.
+
+    2026-10-16: Cached, as the same terms are normalised by every match
+    2026-10-16: str.translate and split/join in place of regex substitution
+    """
+    return ' '.join(text.translate(_PUNCTUATION_TABLE).split()).lower()
+
+
+MatchIndex = tuple[
+    dict[str, str], dict[str, str], list[str], list[str], dict[int, list[int]]
+]
 
 
-def match_term(extracted: str, vocab_terms: list) -> dict:
+def build_match_index(terms: list) -> MatchIndex:
+    """
+    Precompute match_term's per-term work for a list of terms.
+
+    Returns (lowercased → first such term, normalised → first such term,
+    lowercased terms in list order, normalised terms in list order,
+    lowercased length → list positions). Build once per list and pass to
+    every match_term call against it.
+
+    Created: 2026-10-16
+    2026-10-16: Also returns the normalised terms, for validate_extraction's
+    missed-terms check
+    2026-10-16: Also returns list positions by length, for match_term's
+    fuzzy tier
+    2026-10-16: Lowercased and normalised forms are interned; a form shared
+    by several terms is held once
+    """
+    lower_map: dict[str, str] = {}
+    norm_map: dict[str, str] = {}
+    lowered = []
+    normalised = []
+    by_length: dict[int, list[int]] = {}
+    for i, t in enumerate(terms):
+        t_lower = sys.intern(t.lower())
+        t_norm = sys.intern(_normalise(t))
+        lowered.append(t_lower)
+        normalised.append(t_norm)
+        lower_map.setdefault(t_lower, t)
+        norm_map.setdefault(t_norm, t)
+        by_length.setdefault(len(t_lower), []).append(i)
+    return lower_map, norm_map, lowered, normalised, by_length
+
+
+def _length_ratio(len_a: int, len_b: int) -> float:
+    """Upper bound on difflib's ratio from lengths alone (its real_quick_ratio)."""
+    return 2.0 * min(len_a, len_b) / (len_a + len_b) if len_a + len_b else 1.0
+
+
+@functools.lru_cache(maxsize=256)
+def _vocab_match_index(docx_path: str, mtime_ns: int) -> MatchIndex:
+    """
+    build_match_index for a vocab list's terms, cached like parse_vocab_docx.
+
+    Created: 2026-10-16
+    """
+    return build_match_index(_parse_vocab_docx_cached(docx_path, mtime_ns)['all_terms'])
+
+
+def match_term(extracted: str, vocab_terms: list, index: MatchIndex = None) -> dict:
     """
     Match an extracted term against a list of vocab terms.
 
@@ -163,10 +453,21 @@ def match_term(extracted: str, vocab_terms: list) -> dict:
     3. Fuzzy (difflib SequenceMatcher, threshold 0.9)
 
     Created: 2026-02-24
+    2026-10-16: Fuzzy candidates are pre-screened with an upper bound on the
+    difflib ratio (rapidfuzz's Indel ratio if installed, else difflib's own
+    quick ratios), so only plausible terms get the full difflib comparison.
+    Which term matches and its confidence are unchanged.
+    2026-10-16: With an index from build_match_index, tiers 1 and 2 are one
+    dict lookup each and tier 3 reuses the lowercased terms
+    2026-10-16: With an index, tier 3 only visits terms of a length that can
+    reach the threshold, still in list order
+    2026-10-16: With rapidfuzz, all candidates are pre-screened in one
+    process.extract call
 
     Args:
         extracted: Extracted term from booklet
         vocab_terms: List of authoritative vocab terms
+        index: Optional build_match_index(vocab_terms) result
 
     Returns:
         {
@@ -179,30 +480,71 @@ def match_term(extracted: str, vocab_terms: list) -> dict:
     extracted_lower = extracted.lower()
     extracted_norm = _normalise(extracted)
 
-    for vocab_term in vocab_terms:
-        # Tier 1: Exact (case-insensitive)
-        if extracted_lower == vocab_term.lower():
-            return {
-                'matched': True,
-                'match_type': 'exact',
-                'confidence': 1.0,
-                'vocab_term': vocab_term
-            }
+    if index is not None:
+        lower_map, norm_map, vocab_lowered, _, by_length = index
+        exact = lower_map.get(extracted_lower)
+        normalised = None if exact is not None else norm_map.get(extracted_norm)
+    else:
+        vocab_lowered = map(str.lower, vocab_terms)
+        exact = next(
+            (v for v in vocab_terms if extracted_lower == v.lower()), None
+        )
+        normalised = None if exact is not None else next(
+            (v for v in vocab_terms if extracted_norm == _normalise(v)), None
+        )
+
+    # Tier 1: Exact (case-insensitive)
+    if exact is not None:
+        return {
+            'matched': True,
+            'match_type': 'exact',
+            'confidence': 1.0,
+            'vocab_term': exact
+        }
 
-    for vocab_term in vocab_terms:
-        # Tier 2: Normalised
-        if extracted_norm == _normalise(vocab_term):
-            return {
-                'matched': True,
-                'match_type': 'normalised',
-                'confidence': 0.95,
-                'vocab_term': vocab_term
-            }
+    # Tier 2: Normalised
+    if normalised is not None:
+        return {
+            'matched': True,
+            'match_type': 'normalised',
+            'confidence': 0.95,
+            'vocab_term': normalised
+        }
 
-    for vocab_term in vocab_terms:
+    if index is not None:
+        extracted_len = len(extracted_lower)
+        positions = sorted(chain.from_iterable(
+            ps for length, ps in by_length.items()
+            if _length_ratio(extracted_len, length) >= FUZZY_THRESHOLD
+        ))
+        candidates = ((vocab_terms[i], vocab_lowered[i]) for i in positions)
+    else:
+        candidates = zip(vocab_terms, vocab_lowered)
+
+    if RAPIDFUZZ_AVAILABLE:
+        # Indel ratio (2 * LCS / total length) >= difflib's ratio. Survivors
+        # are put back in list order so the first match still wins.
+        candidates = list(candidates)
+        passed = _extract_scores(
+            extracted_lower,
+            [vocab_lower for _, vocab_lower in candidates],
+            scorer=_indel_ratio,
+            processor=None,
+            limit=None,
+            score_cutoff=_FUZZY_PRESCREEN_CUTOFF
+        )
+        candidates = [candidates[i] for i in sorted(i for _, _, i in passed)]
+
+    matcher = SequenceMatcher(None, extracted_lower, '')
+    for vocab_term, vocab_lower in candidates:
         # Tier 3: Fuzzy
-        ratio = SequenceMatcher(None, extracted_lower, vocab_term.lower()).ratio()
-        if ratio >= 0.9:
+        matcher.set_seq2(vocab_lower)
+        if not RAPIDFUZZ_AVAILABLE and (
+                matcher.real_quick_ratio() < FUZZY_THRESHOLD
+                or matcher.quick_ratio() < FUZZY_THRESHOLD):
+            continue
+        ratio = matcher.ratio()
+        if ratio >= FUZZY_THRESHOLD:
             return {
                 'matched': True,
                 'match_type': 'fuzzy',
@@ -222,7 +564,27 @@ def match_term(extracted: str, vocab_terms: list) -> dict:
 # VALIDATION
 # =============================================================================
 
-def validate_extraction(extraction_results: dict, vocab_path: str) -> dict:
+# 2026-10-16: validation_status values (see validate_extraction), stored as
+#             text in occurrences.validation_status
+STATUS_CONFIRMED = 'confirmed'
+STATUS_CONFIRMED_WITH_FLAG = 'confirmed_with_flag'
+STATUS_POTENTIAL_NOISE = 'potential_noise'
+STATUS_HIGH_PRIORITY_REVIEW = 'high_priority_review'
+
+# 2026-10-16: Status by (matched in vocab, flagged by Stage 1)
+_STATUS = {
+    (True, False): STATUS_CONFIRMED,
+    (True, True): STATUS_CONFIRMED_WITH_FLAG,
+    (False, False): STATUS_POTENTIAL_NOISE,
+    (False, True): STATUS_HIGH_PRIORITY_REVIEW,
+}
+
+
+def validate_extraction(
+    extraction_results: dict,
+    vocab_path: str,
+    include_missed_terms: bool = True
+) -> dict:
     """
     Enrich extraction results with validation metadata from vocab list.
 
@@ -238,51 +600,111 @@ def validate_extraction(extraction_results: dict, vocab_path: str) -> dict:
     Also adds extraction_results['validation_stats'].
 
     Created: 2026-02-24
+    2026-10-16: The vocab list is indexed once for all match_term calls
+    2026-10-16: The index is cached per vocab file (see _vocab_match_index)
+    and its lowercased and normalised terms serve the missed-terms check
+    2026-10-16: Each distinct term is matched once; repeats (the same bold
+    word on several slides) reuse its result
+    2026-10-16: The extracted forms for the missed-terms check are collected
+    in the same pass, once per distinct term
+    2026-10-16: Distinct terms are matched in a first pass and the results
+    assigned to every term in a second
+    2026-10-16: validation_stats carries missed_terms_count; missed_terms
+    (now a tuple) can be left out with include_missed_terms=False
+    2026-10-16: Enrichment fields are built once per (term, flagged) and
+    applied with dict.update
+    2026-10-16: validation_stats carries missed_terms_digest, a 64-bit
+    BLAKE2b hash of the missed terms in vocab order, so runs can be compared
+    without the list; with include_missed_terms=False no list is built
+
+    Runs serially: matching holds the GIL (difflib), and Stage 2 already
+    validates each file in its own worker process (process_corpus).
 
     Args:
         extraction_results: Output from extract_stage1.extract_bold_runs()
         vocab_path: Path to vocab .docx
+        include_missed_terms: Add the missed vocab terms themselves to
+            validation_stats (default True)
 
     Returns:
         Enriched extraction_results dict
     """
-    vocab_data = parse_vocab_docx(vocab_path)
+    vocab_path = str(vocab_path)
+    mtime_ns = os.stat(vocab_path).st_mtime_ns
+    vocab_data = _parse_vocab_docx_cached(vocab_path, mtime_ns)
     vocab_terms = vocab_data['all_terms']
-    vocab_source = str(Path(vocab_path).name)
+    vocab_index = _vocab_match_index(vocab_path, mtime_ns)
+    # 2026-10-16: Interned; every term (and every file validated against
+    #             this list) references one string
+    vocab_source = sys.intern(Path(vocab_path).name)
 
     confirmed = 0
     potential_noise = 0
-    missed_terms = []
-
-    for term_data in extraction_results['terms']:
-        result = match_term(term_data['term'], vocab_terms)
 
-        if result['matched']:
-            status = 'confirmed_with_flag' if term_data['flagged'] else 'confirmed'
+    terms = extraction_results['terms']
+
+    results_by_term = {}
+    # Forms of the extracted terms, for finding vocab terms that were missed
+    extracted_lower = set()
+    extracted_norm = set()
+
+    # 2026-10-16: Globals and bound methods used per term are bound to locals
+    match = match_term
+    normalise = _normalise
+    add_lower = extracted_lower.add
+    add_norm = extracted_norm.add
+    for term in dict.fromkeys(term_data['term'] for term_data in terms):
+        results_by_term[term] = match(term, vocab_terms, vocab_index)
+        add_lower(term.lower())
+        add_norm(normalise(term))
+
+    # 2026-10-16: The four enrichment fields depend only on (term, flagged),
+    #             so each combination's dict is built once and applied with
+    #             a single update
+    enrichment_by_key = {}
+    get_enrichment = enrichment_by_key.get
+    for term_data in terms:
+        key = (term_data['term'], term_data['flagged'])
+        entry = get_enrichment(key)
+        if entry is None:
+            result = results_by_term[key[0]]
+            matched = result['matched']
+            entry = enrichment_by_key[key] = (matched, {
+                'validation_status': _STATUS[(bool(matched), bool(key[1]))],
+                'vocab_confidence': result['confidence'],
+                'vocab_match_type': result['match_type'],
+                'vocab_source': vocab_source
+            })
+
+        matched, enrichment = entry
+        term_data.update(enrichment)
+        if matched:
             confirmed += 1
         else:
-            status = 'high_priority_review' if term_data['flagged'] else 'potential_noise'
             potential_noise += 1
 
-        term_data['validation_status'] = status
-        term_data['vocab_confidence'] = result['confidence']
-        term_data['vocab_match_type'] = result['match_type']
-        term_data['vocab_source'] = vocab_source
-
     # Find terms in vocab that weren't extracted
-    extracted_lower = {t['term'].lower() for t in extraction_results['terms']}
-    extracted_norm = {_normalise(t['term']) for t in extraction_results['terms']}
-
-    for vocab_term in vocab_terms:
-        if vocab_term.lower() not in extracted_lower and _normalise(vocab_term) not in extracted_norm:
-            missed_terms.append(vocab_term)
-
-    extraction_results['validation_stats'] = {
+    _, _, vocab_lowered, vocab_normalised, _ = vocab_index
+    missed_terms = []
+    missed_count = 0
+    missed_digest = hashlib.blake2b(digest_size=8)
+    for vocab_term, vocab_lower, vocab_norm in zip(vocab_terms, vocab_lowered, vocab_normalised):
+        if vocab_lower not in extracted_lower and vocab_norm not in extracted_norm:
+            missed_count += 1
+            missed_digest.update(vocab_term.encode() + b'\0')
+            if include_missed_terms:
+                missed_terms.append(vocab_term)
+
+    validation_stats = {
         'vocab_list': vocab_source,
         'vocab_terms_total': vocab_data['metadata']['total_terms'],
         'extracted_confirmed': confirmed,
         'extracted_noise': potential_noise,
-        'missed_terms': missed_terms
+        'missed_terms_count': missed_count,
+        'missed_terms_digest': missed_digest.hexdigest()
     }
+    if include_missed_terms:
+        validation_stats['missed_terms'] = tuple(missed_terms)
+    extraction_results['validation_stats'] = validation_stats
 
     return extraction_results